@@ -1,11 +1,14 @@
 import os
+import threading
+import time
+from collections import namedtuple
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-import bcrypt as _bcrypt
-from jose import jwt, JWTError
-from backend.db.models import get_db, User
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy import event
+from backend.db.models import SessionLocal, get_db, User
+from backend.metrics import CACHE_REQUESTS
 
 router = APIRouter(prefix="/auth")
 
@@ -13,6 +16,60 @@ SECRET_KEY = os.environ.get("SESSION_SECRET", "nba-analytics-secret-key-change-m
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 30
 COOKIE_NAME = "session_token"
+USER_CACHE_TTL_SECONDS = int(os.environ.get("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_ENTRIES = 10000
+ADMIN_USERNAMES = {u.strip() for u in os.environ.get("ADMIN_USERNAMES", "").split(",") if u.strip()}
+
+
+AuthUser = namedtuple("AuthUser", ["id", "username", "email", "created_at"])
+
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+
+def _cached_user(user_id):
+    entry = _user_cache.get(user_id)
+    if entry is None or entry[0] < time.monotonic():
+        CACHE_REQUESTS.inc("auth_users", "miss")
+        return None
+    CACHE_REQUESTS.inc("auth_users", "hit")
+    return entry[1]
+
+
+def _remember_user(user):
+    auth_user = AuthUser(user.id, user.username, user.email, user.created_at)
+    with _user_cache_lock:
+        if len(_user_cache) >= USER_CACHE_MAX_ENTRIES:
+            _user_cache.pop(next(iter(_user_cache)), None)
+        _user_cache[user.id] = (time.monotonic() + USER_CACHE_TTL_SECONDS, auth_user)
+    return auth_user
+
+
+def invalidate_user(user_id=None):
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _track_changed_user(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_user_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    for user_id in session.info.pop("changed_user_ids", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session):
+    session.info.pop("changed_user_ids", None)
 
 
 class SignupRequest(BaseModel):
@@ -27,6 +84,8 @@ class LoginRequest(BaseModel):
 
 
 def create_access_token(user_id: int, username: str) -> str:
+    from jose import jwt
+
     expire = datetime.utcnow() + timedelta(days=ACCESS_TOKEN_EXPIRE_DAYS)
     payload = {"user_id": user_id, "username": username, "exp": expire}
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
@@ -44,27 +103,43 @@ def set_session_cookie(response: Response, token: str):
     )
 
 
-def get_current_user(request: Request, db: Session = Depends(get_db)):
+def get_current_user(request: Request):
     token = request.cookies.get(COOKIE_NAME)
     if not token:
         return None
+    from jose import jwt, JWTError
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("user_id")
-        if user_id is None:
-            return None
-        user = db.query(User).filter_by(id=user_id).first()
-        return user
     except JWTError:
         return None
+    user_id = payload.get("user_id")
+    if user_id is None:
+        return None
+    cached = _cached_user(user_id)
+    if cached is not None and cached.username == payload.get("username"):
+        return cached
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter_by(id=user_id).first()
+        if user is None:
+            return None
+        return _remember_user(user)
+    finally:
+        db.close()
 
 
-def require_user(user: User = Depends(get_current_user)):
+def require_user(user: AuthUser = Depends(get_current_user)):
     if user is None:
         raise HTTPException(status_code=401, detail="Not authenticated")
     return user
 
 
+def require_admin(user: AuthUser = Depends(require_user)):
+    if user.username not in ADMIN_USERNAMES:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return user
+
+
 @router.post("/signup")
 def signup(data: SignupRequest, response: Response, db: Session = Depends(get_db)):
     existing_email = db.query(User).filter_by(email=data.email).first()
@@ -74,6 +149,8 @@ def signup(data: SignupRequest, response: Response, db: Session = Depends(get_db
     if existing_username:
         raise HTTPException(status_code=400, detail="Username already taken")
 
+    import bcrypt as _bcrypt
+
     password_hash = _bcrypt.hashpw(data.password.encode("utf-8"), _bcrypt.gensalt()).decode("utf-8")
     user = User(
         username=data.username,
@@ -92,6 +169,8 @@ def signup(data: SignupRequest, response: Response, db: Session = Depends(get_db
 
 @router.post("/login")
 def login(data: LoginRequest, response: Response, db: Session = Depends(get_db)):
+    import bcrypt as _bcrypt
+
     user = db.query(User).filter_by(email=data.email).first()
     if not user or not _bcrypt.checkpw(data.password.encode("utf-8"), user.password_hash.encode("utf-8")):
         raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -108,7 +187,7 @@ def logout(response: Response):
 
 
 @router.get("/me")
-def me(user: User = Depends(require_user)):
+def me(user: AuthUser = Depends(require_user)):
     return {
         "id": user.id,
         "username": user.username,
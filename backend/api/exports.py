@@ -0,0 +1,110 @@
+import csv
+import io
+from sqlalchemy import select, desc
+from backend.db.models import SessionLocal, UserPick
+
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    ("id", UserPick.id), ("game_id", UserPick.game_id), ("type", UserPick.pick_type),
+    ("selection", UserPick.selection), ("odds", UserPick.odds), ("stake", UserPick.stake),
+    ("result", UserPick.result), ("payout", UserPick.payout), ("player_name", UserPick.player_name),
+    ("stat_type", UserPick.stat_type), ("line", UserPick.line), ("pick_side", UserPick.pick_side),
+    ("actual_stat", UserPick.actual_stat), ("notes", UserPick.notes), ("created_at", UserPick.created_at),
+]
+
+
+def _pick_partitions(user_id, start=None, end=None):
+    stmt = select(*[col for _, col in EXPORT_COLUMNS]).where(UserPick.user_id == user_id)
+    if start:
+        stmt = stmt.where(UserPick.created_at >= start)
+    if end:
+        stmt = stmt.where(UserPick.created_at < end)
+    stmt = stmt.order_by(desc(UserPick.created_at), desc(UserPick.id))
+
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(stream_results=True, yield_per=EXPORT_CHUNK_SIZE))
+        for rows in result.partitions():
+            yield rows
+    finally:
+        db.close()
+
+
+def stream_picks_csv(user_id, start=None, end=None):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    yield buffer.getvalue()
+
+    for rows in _pick_partitions(user_id, start, end):
+        buffer.seek(0)
+        buffer.truncate(0)
+        for r in rows:
+            r = list(r)
+            r[-1] = r[-1].isoformat() if r[-1] else ""
+            writer.writerow(r)
+        yield buffer.getvalue()
+
+
+class _ChunkSink:
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _arrow_schema(pa):
+    return pa.schema([
+        ("id", pa.int64()), ("game_id", pa.int64()), ("type", pa.string()),
+        ("selection", pa.string()), ("odds", pa.float64()), ("stake", pa.float64()),
+        ("result", pa.string()), ("payout", pa.float64()), ("player_name", pa.string()),
+        ("stat_type", pa.string()), ("line", pa.float64()), ("pick_side", pa.string()),
+        ("actual_stat", pa.float64()), ("notes", pa.string()), ("created_at", pa.timestamp("us")),
+    ])
+
+
+def stream_picks_parquet(user_id, start=None, end=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(pa)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+    try:
+        for rows in _pick_partitions(user_id, start, end):
+            columns = list(zip(*rows))
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(col, type=field.type) for col, field in zip(columns, schema)], schema=schema
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def parquet_available():
+    try:
+        import pyarrow.parquet  # noqa: F401
+        return True
+    except ImportError:
+        return False
@@ -1,25 +1,43 @@
-import csv
-import io
 import math
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, Query, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 from backend.db.models import (
     get_db, DimGame, DimTeam, DimPlayer, FactBoxScore,
-    FactOddsSnapshot, FactPropSnapshot, ScoreHistory,
-    UserPick, FeatureStore, ModelMetrics, User
+    FactOddsSnapshot, FactOddsLatest, FactPlayerProjection, ScoreHistory,
+    UserPick, FeatureStore, ModelMetrics, PlayerSummary, team_dict
 )
-from backend.api.auth import require_user
+from backend.db.game_state import STATE_LIVE, STATE_FINAL, get_live_game_ids
+from backend.db.ledger import record_pick, get_user_stats
+from backend.db.player_summary import summary_dict
+from backend.db.player_search import search_index, schedule_enrichment, ENRICH_MIN_RESULTS
+from backend.db.perf import perf_report, reset_perf
+from backend.db.data_versions import data_version, data_versions
+from backend.metrics import CACHE_REQUESTS
+from backend.api.exports import stream_picks_csv, stream_picks_parquet, parquet_available
+from backend.ingest.line_rollups import RESOLUTIONS, get_line_movement
+from backend.features.consensus import load_latest_props, compute_consensus
+from backend.features.projections import projection_game_ids, load_game_projections
+from backend.models.pricing import DISCLAIMER, implied_probability, expected_value
+from backend.models.edge_scanner import scan_slate
+from backend.api.auth import AuthUser, require_user, require_admin
+from backend.jobs.model_jobs import submit_retrain, get_job, list_jobs
+from backend.db.lease import current_lease, leader_status
+from backend.startup import readiness
 from backend.models.ml_models import (
-    predict_win_probability, train_win_probability_model,
-    train_player_prop_model, predict_player_prop, get_model_health
+    predict_win_probability, predict_win_probabilities, predict_player_prop, predict_player_props,
+    get_model_health, model_version, PLAYER_PROP_TYPES
 )
-from backend.ingest.bdl_client import has_api_key, fetch_players, fetch_game_stats, fetch_players_by_team, fetch_season_averages
-from backend.features.engineering import compute_team_rolling_stats, compute_player_rolling_stats
+from backend.ingest.bdl_client import (
+    has_api_key, fetch_game_stats, fetch_players_by_team, fetch_season_averages, request_budget
+)
+from backend.features.engineering import load_team_rolling_stats, compute_player_rolling_stats
 
 router = APIRouter(prefix="/api")
 
@@ -33,10 +51,8 @@ def api_status():
 def get_todays_games(db: Session = Depends(get_db)):
     from backend.utils import get_nba_day
     nba_date = get_nba_day()
-    live_statuses = ["In Progress", "in progress",
-        "1st Qtr", "2nd Qtr", "3rd Qtr", "4th Qtr", "Halftime", "OT", "Half"]
     query = db.query(DimGame).filter(
-        (DimGame.date == nba_date) | (DimGame.status.in_(live_statuses))
+        (DimGame.date == nba_date) | (DimGame.id.in_(get_live_game_ids()))
     )
     games = query.all()
     if not games:
@@ -46,18 +62,23 @@ def get_todays_games(db: Session = Depends(get_db)):
         else:
             games = []
 
+    team_ids = {t for g in games for t in (g.home_team_id, g.visitor_team_id)}
+    teams = {t.id: t for t in db.query(DimTeam).filter(DimTeam.id.in_(team_ids))}
+    momentum = {}
+    for m in db.query(ScoreHistory).filter(ScoreHistory.game_id.in_([g.id for g in games])).order_by(
+            ScoreHistory.recorded_at):
+        momentum.setdefault(m.game_id, []).append(m)
+
     result = []
     for g in games:
-        home = db.query(DimTeam).filter_by(id=g.home_team_id).first()
-        away = db.query(DimTeam).filter_by(id=g.visitor_team_id).first()
-        momentum = db.query(ScoreHistory).filter_by(game_id=g.id).order_by(ScoreHistory.recorded_at).all()
         result.append({
             "id": g.id, "date": g.date, "status": g.status,
             "period": g.period, "time": g.time,
-            "home_team": _team_dict(home), "visitor_team": _team_dict(away),
+            "home_team": team_dict(teams.get(g.home_team_id)),
+            "visitor_team": team_dict(teams.get(g.visitor_team_id)),
             "home_team_score": g.home_team_score, "visitor_team_score": g.visitor_team_score,
             "momentum": [{"home": m.home_score, "visitor": m.visitor_score, "period": m.period,
-                          "time": m.recorded_at.isoformat()} for m in momentum]
+                          "time": m.recorded_at.isoformat()} for m in momentum.get(g.id, [])]
         })
     return result
 
@@ -65,20 +86,17 @@ def get_todays_games(db: Session = Depends(get_db)):
 @router.get("/games/calendar")
 def get_calendar_games(db: Session = Depends(get_db)):
     games = db.query(DimGame).order_by(desc(DimGame.date)).all()
+    team_ids = {t for g in games for t in (g.home_team_id, g.visitor_team_id)}
+    teams = {t.id: t for t in db.query(DimTeam).filter(DimTeam.id.in_(team_ids))}
     dates = {}
-    team_cache = {}
     for g in games:
         date_key = g.date
         if date_key not in dates:
             dates[date_key] = []
-        if g.home_team_id not in team_cache:
-            team_cache[g.home_team_id] = db.query(DimTeam).filter_by(id=g.home_team_id).first()
-        if g.visitor_team_id not in team_cache:
-            team_cache[g.visitor_team_id] = db.query(DimTeam).filter_by(id=g.visitor_team_id).first()
         dates[date_key].append({
             "id": g.id, "date": g.date, "status": g.status,
-            "home_team": _team_dict(team_cache[g.home_team_id]),
-            "visitor_team": _team_dict(team_cache[g.visitor_team_id]),
+            "home_team": team_dict(teams.get(g.home_team_id)),
+            "visitor_team": team_dict(teams.get(g.visitor_team_id)),
             "home_team_score": g.home_team_score, "visitor_team_score": g.visitor_team_score,
         })
     return {"dates": dates}
@@ -91,76 +109,121 @@ def get_game(game_id: int, db: Session = Depends(get_db)):
         raise HTTPException(404, "Game not found")
     home = db.query(DimTeam).filter_by(id=game.home_team_id).first()
     away = db.query(DimTeam).filter_by(id=game.visitor_team_id).first()
-    box_scores = db.query(FactBoxScore).filter_by(game_id=game_id).all()
+    box_scores = db.query(FactBoxScore, DimPlayer.first_name, DimPlayer.last_name).outerjoin(
+        DimPlayer, DimPlayer.id == FactBoxScore.player_id
+    ).filter(FactBoxScore.game_id == game_id).all()
     momentum = db.query(ScoreHistory).filter_by(game_id=game_id).order_by(ScoreHistory.recorded_at).all()
 
     return {
         "game": {
             "id": game.id, "date": game.date, "status": game.status,
             "period": game.period, "time": game.time,
-            "home_team": _team_dict(home), "visitor_team": _team_dict(away),
+            "home_team": team_dict(home), "visitor_team": team_dict(away),
             "home_team_score": game.home_team_score, "visitor_team_score": game.visitor_team_score,
         },
-        "box_scores": [_boxscore_dict(bs, db) for bs in box_scores],
+        "box_scores": [_boxscore_dict(bs, first, last) for bs, first, last in box_scores],
         "momentum": [{"home": m.home_score, "visitor": m.visitor_score, "period": m.period} for m in momentum]
     }
 
 
+def _slate_start_date():
+    from backend.utils import get_nba_day
+    return (datetime.strptime(get_nba_day(), "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def _odds_entry(s):
+    return {
+        "vendor": s.vendor, "market_type": s.market_type,
+        "home_line": s.home_line, "away_line": s.away_line,
+        "home_odds": s.home_odds, "away_odds": s.away_odds,
+        "total": s.total, "over_odds": s.over_odds, "under_odds": s.under_odds,
+        "snapshot_at": s.snapshot_at.isoformat() if s.snapshot_at else None,
+    }
+
+
 @router.get("/odds")
 def get_odds(game_id: Optional[int] = None, db: Session = Depends(get_db)):
-    query = db.query(FactOddsSnapshot)
+    query = db.query(FactOddsLatest)
     if game_id:
-        query = query.filter_by(game_id=game_id)
-    snapshots = query.order_by(desc(FactOddsSnapshot.snapshot_at)).limit(500).all()
+        query = query.filter(FactOddsLatest.game_id == game_id)
+    else:
+        query = query.join(DimGame, DimGame.id == FactOddsLatest.game_id).filter(
+            DimGame.date >= _slate_start_date()
+        )
+    latest = query.order_by(FactOddsLatest.game_id, FactOddsLatest.vendor).all()
+    if not latest:
+        return []
+
+    game_ids = sorted({l.game_id for l in latest})
+    games = {g.id: g for g in db.query(DimGame).filter(DimGame.id.in_(game_ids))}
+    teams = _teams_by_id(db, [tid for g in games.values() for tid in (g.home_team_id, g.visitor_team_id)])
+    history = db.query(FactOddsSnapshot).filter(
+        FactOddsSnapshot.game_id.in_(game_ids)
+    ).order_by(desc(FactOddsSnapshot.snapshot_at)).all()
 
     games_odds = {}
-    for s in snapshots:
-        gid = s.game_id
-        if gid not in games_odds:
-            game = db.query(DimGame).filter_by(id=gid).first()
-            home = db.query(DimTeam).filter_by(id=game.home_team_id).first() if game else None
-            away = db.query(DimTeam).filter_by(id=game.visitor_team_id).first() if game else None
-            games_odds[gid] = {
-                "game_id": gid,
-                "home_team": _team_dict(home),
-                "away_team": _team_dict(away),
-                "current": [],
-                "history": [],
-            }
-
-        entry = {
-            "vendor": s.vendor, "market_type": s.market_type,
-            "home_line": s.home_line, "away_line": s.away_line,
-            "home_odds": s.home_odds, "away_odds": s.away_odds,
-            "total": s.total, "over_odds": s.over_odds, "under_odds": s.under_odds,
-            "snapshot_at": s.snapshot_at.isoformat() if s.snapshot_at else None,
+    for gid in game_ids:
+        game = games.get(gid)
+        games_odds[gid] = {
+            "game_id": gid,
+            "home_team": team_dict(teams.get(game.home_team_id)) if game else {},
+            "away_team": team_dict(teams.get(game.visitor_team_id)) if game else {},
+            "current": [],
+            "history": [],
         }
-        games_odds[gid]["history"].append(entry)
+    for s in history:
+        games_odds[s.game_id]["history"].append(_odds_entry(s))
 
-    for gid in games_odds:
-        history = games_odds[gid]["history"]
-        vendors = {}
-        for h in history:
-            if h["vendor"] not in vendors:
-                vendors[h["vendor"]] = h
-        games_odds[gid]["current"] = list(vendors.values())
+    rows_by_game = {}
+    for l in latest:
+        games_odds[l.game_id]["current"].append(_odds_entry(l))
+        rows_by_game.setdefault(l.game_id, []).append(l)
 
-        lines = [h["home_line"] for h in games_odds[gid]["current"] if h["home_line"]]
+    for gid, rows in rows_by_game.items():
+        lines = [r.home_line for r in rows if r.home_line]
         if lines:
-            best_home = min(lines)
-            games_odds[gid]["best_line"] = best_home
-            spread_range = max(lines) - min(lines)
-            games_odds[gid]["divergence"] = round(spread_range, 1)
-            if len(history) > 1:
-                first = history[-1]["home_line"] or 0
-                last = history[0]["home_line"] or 0
-                games_odds[gid]["movement"] = round(last - first, 1)
-            else:
-                games_odds[gid]["movement"] = 0
+            games_odds[gid]["best_line"] = min(lines)
+            games_odds[gid]["divergence"] = round(max(lines) - min(lines), 1)
+            newest = max(rows, key=lambda r: r.snapshot_at or datetime.min)
+            opening = min(rows, key=lambda r: r.first_seen_at or datetime.max)
+            games_odds[gid]["movement"] = round((newest.home_line or 0) - (opening.open_home_line or 0), 1)
 
     return list(games_odds.values())
 
 
+@router.get("/odds/{game_id}/movement")
+def get_odds_movement(
+    game_id: int,
+    resolution: str = Query("5m"),
+    market: Optional[str] = None,
+    vendor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    if resolution not in RESOLUTIONS:
+        raise HTTPException(400, f"resolution must be one of {', '.join(RESOLUTIONS)}")
+    return {
+        "game_id": game_id,
+        "resolution": resolution,
+        "series": get_line_movement(db, game_id, resolution, market, vendor),
+    }
+
+
+RESPONSE_CACHE_MAX_ENTRIES = 256
+PROPS_CACHE_TTL_SECONDS = 60
+_props_cache = {}
+_response_cache_lock = threading.Lock()
+
+
+def _cache_put(cache, key, entry, ttl_seconds, max_entries=RESPONSE_CACHE_MAX_ENTRIES):
+    with _response_cache_lock:
+        for stale in [k for k, v in cache.items() if entry["time"] - v["time"] >= ttl_seconds]:
+            del cache[stale]
+        cache.pop(key, None)
+        while len(cache) >= max_entries:
+            del cache[next(iter(cache))]
+        cache[key] = entry
+
+
 @router.get("/props")
 def get_props(
     game_id: Optional[int] = None,
@@ -169,50 +232,28 @@ def get_props(
     vendor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(FactPropSnapshot)
-    if game_id:
-        query = query.filter_by(game_id=game_id)
-    if player_name:
-        query = query.filter(FactPropSnapshot.player_name.ilike(f"%{player_name}%"))
-    if prop_type:
-        query = query.filter_by(prop_type=prop_type)
-    if vendor:
-        query = query.filter_by(vendor=vendor)
-
-    props = query.order_by(desc(FactPropSnapshot.snapshot_at)).limit(500).all()
-
-    grouped = {}
-    for p in props:
-        key = f"{p.player_id}_{p.prop_type}"
-        if key not in grouped:
-            grouped[key] = {
-                "player_id": p.player_id, "player_name": p.player_name,
-                "team_id": p.team_id, "prop_type": p.prop_type,
-                "game_id": p.game_id, "vendors": [],
-            }
-        grouped[key]["vendors"].append({
-            "vendor": p.vendor, "line": p.line,
-            "over_odds": p.over_odds, "under_odds": p.under_odds,
-            "snapshot_at": p.snapshot_at.isoformat() if p.snapshot_at else None,
-        })
-
-    result = []
-    for key, data in grouped.items():
-        lines = [v["line"] for v in data["vendors"]]
-        over_odds = [v["over_odds"] for v in data["vendors"] if v["over_odds"]]
-        under_odds = [v["under_odds"] for v in data["vendors"] if v["under_odds"]]
-
-        import statistics
-        data["consensus_line"] = round(statistics.median(lines), 1) if lines else 0
-        data["best_over_odds"] = max(over_odds) if over_odds else 0
-        data["best_under_odds"] = max(under_odds) if under_odds else 0
-        if len(lines) > 1:
-            data["disagreement"] = round(statistics.stdev(lines), 2)
+    now = time.time()
+    key = (game_id, vendor)
+    version = data_version(db, "props")
+    cached = _props_cache.get(key)
+    if cached and cached["version"] == version and (now - cached["time"]) < PROPS_CACHE_TTL_SECONDS:
+        CACHE_REQUESTS.inc("props", "hit")
+        board = cached["data"]
+    else:
+        CACHE_REQUESTS.inc("props", "miss")
+        if game_id:
+            game_ids = [game_id]
         else:
-            data["disagreement"] = 0
-        result.append(data)
+            game_ids = [gid for (gid,) in db.query(DimGame.id).filter(DimGame.date >= _slate_start_date())]
+        board = compute_consensus(load_latest_props(db, game_ids, vendor))
+        _cache_put(_props_cache, key, {"data": board, "version": version, "time": now}, PROPS_CACHE_TTL_SECONDS)
 
-    return result
+    if player_name:
+        needle = player_name.lower()
+        board = [p for p in board if needle in (p["player_name"] or "").lower()]
+    if prop_type:
+        board = [p for p in board if p["prop_type"] == prop_type]
+    return board
 
 
 @router.get("/edge")
@@ -223,10 +264,7 @@ def calculate_edge(
     side: str = Query("home"),
     db: Session = Depends(get_db)
 ):
-    if odds > 0:
-        implied = 100 / (odds + 100)
-    else:
-        implied = abs(odds) / (abs(odds) + 100)
+    implied = float(implied_probability(odds))
 
     model_prob = true_prob
     if model_prob is None and game_id:
@@ -239,33 +277,126 @@ def calculate_edge(
         model_prob = 0.5
 
     edge = model_prob - implied
-    if odds > 0:
-        payout_mult = odds / 100
-    else:
-        payout_mult = 100 / abs(odds)
-    ev = model_prob * payout_mult - (1 - model_prob)
+    ev = float(expected_value(model_prob, odds))
 
     return {
         "odds": odds, "implied_probability": round(implied, 4),
         "model_probability": round(model_prob, 4),
         "edge": round(edge, 4), "expected_value": round(ev, 4),
         "recommendation_signal": "positive_ev" if ev > 0 else "negative_ev",
+        "disclaimer": DISCLAIMER,
     }
 
 
+EDGE_SCAN_CACHE_TTL_SECONDS = 300
+_edge_scan_cache = {}
+
+
+@router.get("/edge/scan")
+def scan_edges(
+    date: Optional[str] = None,
+    top: int = Query(25, ge=1, le=200),
+    min_edge: float = 0.0,
+    include_props: bool = True,
+    db: Session = Depends(get_db)
+):
+    from backend.utils import get_nba_day
+
+    game_date = date or get_nba_day()
+    try:
+        datetime.strptime(game_date, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(400, "date must be YYYY-MM-DD")
+
+    now = time.time()
+    key = (game_date, top, min_edge, include_props)
+    version = (*data_versions(db, ("odds", "props")), model_version())
+    cached = _edge_scan_cache.get(key)
+    if cached and cached["version"] == version and (now - cached["time"]) < EDGE_SCAN_CACHE_TTL_SECONDS:
+        CACHE_REQUESTS.inc("edge_scan", "hit")
+        results = cached["data"]
+    else:
+        CACHE_REQUESTS.inc("edge_scan", "miss")
+        results = scan_slate(db, game_date, top, min_edge, include_props)
+        _cache_put(_edge_scan_cache, key, {"data": results, "version": version, "time": now},
+                   EDGE_SCAN_CACHE_TTL_SECONDS)
+
+    return {
+        "date": game_date,
+        "count": len(results),
+        "results": results,
+        "disclaimer": DISCLAIMER,
+    }
+
+
+@router.get("/ready")
+def api_ready():
+    state = readiness()
+    return JSONResponse(state, status_code=200 if state["ready"] else 503)
+
+
+@router.get("/debug/perf")
+def debug_perf(reset: bool = False, current_user: AuthUser = Depends(require_admin)):
+    report = perf_report()
+    if reset:
+        reset_perf()
+    return report
+
+
+@router.get("/admin/jobs")
+def admin_jobs(current_user: AuthUser = Depends(require_admin)):
+    from backend.jobs.monitor import configure_profiling
+    from backend.jobs.worker import is_leader, scheduler_status
+    leader = is_leader()
+    status = scheduler_status() if leader else leader_status()
+    status = status or {"scheduler_running": False, "live_cadence": None, "jobs": []}
+    return {
+        "leader": leader,
+        "lease": current_lease(),
+        "profiling": configure_profiling(),
+        "request_budget": request_budget(),
+        "status_published_at": None if leader else status.get("published_at"),
+        "scheduler_running": status["scheduler_running"],
+        "live_cadence": status["live_cadence"],
+        "jobs": status["jobs"],
+    }
+
+
+@router.get("/admin/profiles")
+def admin_profiles(job: Optional[str] = None, current_user: AuthUser = Depends(require_admin)):
+    from backend.jobs.monitor import recent_profiles, configure_profiling
+    from backend.jobs.worker import is_leader
+    if is_leader():
+        profiles = recent_profiles(job)
+    else:
+        profiles = [p for p in (leader_status() or {}).get("profiles", []) if job is None or p["job"] == job]
+    return {"profiling": configure_profiling(), "profiles": profiles}
+
+
 @router.get("/model/health")
 def model_health_endpoint():
     health = get_model_health()
     return {"models": health}
 
 
-@router.post("/model/retrain")
+@router.post("/model/retrain", status_code=202)
 def retrain_models():
-    win_result = train_win_probability_model()
-    results = {"win_probability": win_result}
-    for prop in ["PTS", "REB", "AST", "STL", "BLK"]:
-        results[f"player_prop_{prop.lower()}"] = train_player_prop_model(prop)
-    return results
+    job, created = submit_retrain(source="api")
+    lease = current_lease()
+    return {**job, "deduplicated": not created, "runner_active": bool(lease and lease["active"])}
+
+
+@router.get("/model/jobs")
+def model_jobs():
+    return {"jobs": list_jobs()}
+
+
+@router.get("/model/jobs/{job_id}")
+def model_job_status(job_id: str):
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(404, "Job not found")
+    return job
 
 
 @router.get("/model/predict/win")
@@ -297,21 +428,23 @@ class PickCreate(BaseModel):
 
 
 @router.post("/picks")
-def create_pick(pick: PickCreate, db: Session = Depends(get_db), current_user: User = Depends(require_user)):
+def create_pick(pick: PickCreate, db: Session = Depends(get_db), current_user: AuthUser = Depends(require_user)):
     if pick.game_id:
         game = db.query(DimGame).filter_by(id=pick.game_id).first()
-        if game and game.status:
-            s = game.status.lower()
-            if 'final' in s or 'qtr' in s or 'half' in s or 'ot' in s or 'progress' in s:
-                raise HTTPException(400, "Cannot place picks on live or completed games")
-        existing = db.query(UserPick).filter_by(
-            game_id=pick.game_id, pick_type='moneyline', user_id=current_user.id
-        ).first()
+        if game and game.state in (STATE_LIVE, STATE_FINAL):
+            raise HTTPException(400, "Cannot place picks on live or completed games")
+        existing = None
+        if pick.pick_type == 'moneyline':
+            existing = db.query(UserPick).filter_by(
+                game_id=pick.game_id, pick_type='moneyline', user_id=current_user.id
+            ).first()
         if existing:
+            record_pick(db, existing, -1)
             existing.selection = pick.selection
             existing.odds = pick.odds
             existing.notes = pick.notes
             existing.created_at = datetime.utcnow()
+            record_pick(db, existing)
             db.commit()
             db.refresh(existing)
             return {"id": existing.id, "status": "updated"}
@@ -325,23 +458,63 @@ def create_pick(pick: PickCreate, db: Session = Depends(get_db), current_user: U
         line=pick.line,
         pick_side=pick.pick_side,
         user_id=current_user.id,
-        created_at=datetime.utcnow()
+        created_at=datetime.utcnow(),
+        result="pending",
+        payout=0.0,
     )
     db.add(new_pick)
+    record_pick(db, new_pick)
     db.commit()
     db.refresh(new_pick)
     return {"id": new_pick.id, "status": "created"}
 
 
+PICK_RESULT_FILTERS = {
+    "pending": ["pending"], "win": ["win"], "loss": ["loss"], "push": ["push"],
+    "graded": ["win", "loss", "push"],
+}
+
+
+def _encode_pick_cursor(pick):
+    return f"{pick.created_at.isoformat()}_{pick.id}"
+
+
+def _decode_pick_cursor(cursor):
+    try:
+        created_at, pick_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), int(pick_id)
+    except ValueError:
+        raise HTTPException(400, "Invalid cursor")
+
+
 @router.get("/picks")
-def get_picks(db: Session = Depends(get_db), current_user: User = Depends(require_user)):
-    picks = db.query(UserPick).filter_by(user_id=current_user.id).order_by(desc(UserPick.created_at)).all()
-    total_staked = sum(p.stake for p in picks)
-    total_payout = sum(p.payout or 0 for p in picks)
-    graded = [p for p in picks if p.result in ("win", "loss")]
-    wins = [p for p in graded if p.result == "win"]
-    win_rate = len(wins) / len(graded) if graded else 0
-    roi = ((total_payout - total_staked) / total_staked * 100) if total_staked > 0 else 0
+def get_picks(
+    limit: int = Query(50, ge=0, le=200),
+    cursor: Optional[str] = None,
+    result: Optional[str] = None,
+    pick_type: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: AuthUser = Depends(require_user),
+):
+    query = db.query(UserPick).filter(UserPick.user_id == current_user.id)
+    if result:
+        if result not in PICK_RESULT_FILTERS:
+            raise HTTPException(400, f"Unknown result filter: {result}")
+        query = query.filter(UserPick.result.in_(PICK_RESULT_FILTERS[result]))
+    if pick_type:
+        query = query.filter(UserPick.pick_type == pick_type)
+    if cursor:
+        created_at, pick_id = _decode_pick_cursor(cursor)
+        query = query.filter(
+            (UserPick.created_at < created_at) |
+            ((UserPick.created_at == created_at) & (UserPick.id < pick_id))
+        )
+
+    picks = []
+    if limit:
+        picks = query.order_by(desc(UserPick.created_at), desc(UserPick.id)).limit(limit + 1).all()
+    has_more = len(picks) > limit
+    picks = picks[:limit]
 
     return {
         "picks": [{
@@ -354,52 +527,61 @@ def get_picks(db: Session = Depends(get_db), current_user: User = Depends(requir
             "stat_type": p.stat_type, "line": p.line,
             "pick_side": p.pick_side, "actual_stat": p.actual_stat,
         } for p in picks],
-        "stats": {
-            "total_picks": len(picks),
-            "wins": len(wins),
-            "losses": len(graded) - len(wins),
-            "pending": len([p for p in picks if p.result == "pending"]),
-            "win_rate": round(win_rate, 3),
-            "total_staked": round(total_staked, 2),
-            "total_payout": round(total_payout, 2),
-            "roi": round(roi, 2),
-            "profit": round(total_payout - total_staked, 2),
-        }
+        "next_cursor": _encode_pick_cursor(picks[-1]) if has_more and picks else None,
+        "stats": get_user_stats(db, current_user.id),
     }
 
 
 @router.delete("/picks/{pick_id}")
-def delete_pick(pick_id: int, db: Session = Depends(get_db), current_user: User = Depends(require_user)):
+def delete_pick(pick_id: int, db: Session = Depends(get_db), current_user: AuthUser = Depends(require_user)):
     pick = db.query(UserPick).filter_by(id=pick_id).first()
     if not pick:
         raise HTTPException(404, "Pick not found")
     if pick.user_id != current_user.id:
         raise HTTPException(403, "Not authorized to delete this pick")
+    record_pick(db, pick, -1)
     db.delete(pick)
     db.commit()
     return {"status": "deleted"}
 
 
+def _parse_export_date(value, name):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(400, f"{name} must be YYYY-MM-DD")
+
+
 @router.get("/picks/export")
-def export_picks(db: Session = Depends(get_db)):
-    picks = db.query(UserPick).order_by(desc(UserPick.created_at)).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["id", "game_id", "type", "selection", "odds", "stake", "result", "payout",
-                      "player_name", "stat_type", "line", "pick_side", "actual_stat", "notes", "created_at"])
-    for p in picks:
-        writer.writerow([p.id, p.game_id, p.pick_type, p.selection, p.odds, p.stake, p.result, p.payout,
-                         p.player_name, p.stat_type, p.line, p.pick_side, p.actual_stat, p.notes,
-                         p.created_at.isoformat() if p.created_at else ""])
-    output.seek(0)
-    return StreamingResponse(output, media_type="text/csv",
-                             headers={"Content-Disposition": "attachment; filename=picks.csv"})
+def export_picks(
+    format: str = Query("csv"),
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    current_user: AuthUser = Depends(require_user),
+):
+    start = _parse_export_date(start_date, "start_date")
+    end = _parse_export_date(end_date, "end_date")
+    if end:
+        end += timedelta(days=1)
+
+    if format == "csv":
+        return StreamingResponse(stream_picks_csv(current_user.id, start, end), media_type="text/csv",
+                                 headers={"Content-Disposition": "attachment; filename=picks.csv"})
+    if format == "parquet":
+        if not parquet_available():
+            raise HTTPException(501, "Parquet export requires pyarrow")
+        return StreamingResponse(stream_picks_parquet(current_user.id, start, end),
+                                 media_type="application/vnd.apache.parquet",
+                                 headers={"Content-Disposition": "attachment; filename=picks.parquet"})
+    raise HTTPException(400, "format must be csv or parquet")
 
 
 @router.get("/teams")
 def get_teams(db: Session = Depends(get_db)):
     teams = db.query(DimTeam).all()
-    return [_team_dict(t) for t in teams]
+    return [team_dict(t) for t in teams]
 
 
 @router.get("/players")
@@ -425,45 +607,41 @@ _model_odds_cache = {"data": None, "time": 0}
 
 @router.get("/model-odds")
 def get_model_odds(db: Session = Depends(get_db)):
-    import time as _time
     from datetime import timedelta
 
-    now = _time.time()
+    now = time.time()
     if _model_odds_cache["data"] and (now - _model_odds_cache["time"]) < 30:
+        CACHE_REQUESTS.inc("model_odds", "hit")
         return _model_odds_cache["data"]
+    CACHE_REQUESTS.inc("model_odds", "miss")
 
     utc_now = datetime.utcnow()
     today = utc_now.strftime("%Y-%m-%d")
     yesterday = (utc_now - timedelta(days=1)).strftime("%Y-%m-%d")
-    live_statuses = ["In Progress", "in progress",
-        "1st Qtr", "2nd Qtr", "3rd Qtr", "4th Qtr", "Halftime", "OT", "Half"]
 
     games = db.query(DimGame).filter(
-        (DimGame.date.in_([today, yesterday])) | (DimGame.status.in_(live_statuses))
+        (DimGame.date.in_([today, yesterday])) | (DimGame.id.in_(get_live_game_ids()))
     ).all()
 
     if not games:
         games = db.query(DimGame).order_by(desc(DimGame.date)).limit(10).all()
 
-    stats_cache = {}
-    results = []
-    for g in games:
-        home = db.query(DimTeam).filter_by(id=g.home_team_id).first()
-        away = db.query(DimTeam).filter_by(id=g.visitor_team_id).first()
+    team_ids = {t for g in games for t in (g.home_team_id, g.visitor_team_id)}
+    teams = _teams_by_id(db, team_ids)
+    team_stats = load_team_rolling_stats(db, team_ids)
+    probs = predict_win_probabilities([(g.home_team_id, g.visitor_team_id) for g in games], features=team_stats)
 
-        probs = predict_win_probability(g.home_team_id, g.visitor_team_id)
-        home_prob = probs["home_win_prob"]
-        away_prob = probs["away_win_prob"]
+    results = []
+    for g, home_prob in zip(games, probs.tolist()):
+        home = teams.get(g.home_team_id)
+        away = teams.get(g.visitor_team_id)
+        away_prob = 1 - home_prob
 
         home_ml = _prob_to_american(home_prob)
         away_ml = _prob_to_american(away_prob)
 
-        if g.home_team_id not in stats_cache:
-            stats_cache[g.home_team_id] = compute_team_rolling_stats(g.home_team_id)
-        if g.visitor_team_id not in stats_cache:
-            stats_cache[g.visitor_team_id] = compute_team_rolling_stats(g.visitor_team_id)
-        home_feats = stats_cache[g.home_team_id]
-        away_feats = stats_cache[g.visitor_team_id]
+        home_feats = team_stats.get(g.home_team_id)
+        away_feats = team_stats.get(g.visitor_team_id)
 
         pick = home if home_prob >= away_prob else away
         pick_prob = max(home_prob, away_prob)
@@ -473,15 +651,15 @@ def get_model_odds(db: Session = Depends(get_db)):
             "game_id": g.id,
             "date": g.date,
             "status": g.status,
-            "home_team": _team_dict(home),
-            "away_team": _team_dict(away),
+            "home_team": team_dict(home),
+            "away_team": team_dict(away),
             "home_team_score": g.home_team_score,
             "visitor_team_score": g.visitor_team_score,
             "home_win_prob": round(home_prob, 4),
             "away_win_prob": round(away_prob, 4),
             "home_moneyline": home_ml,
             "away_moneyline": away_ml,
-            "model_pick": _team_dict(pick),
+            "model_pick": team_dict(pick),
             "model_pick_prob": round(pick_prob, 4),
             "confidence": confidence,
             "home_stats": {
@@ -505,62 +683,14 @@ def get_model_odds(db: Session = Depends(get_db)):
 
 
 @router.get("/players/search")
-def search_players(query: str = Query("", min_length=0), db: Session = Depends(get_db)):
+def search_players(query: str = Query("", min_length=0)):
     if not query or len(query) < 2:
         return []
 
-    local_players = db.query(DimPlayer).filter(
-        (DimPlayer.first_name.ilike(f"%{query}%")) |
-        (DimPlayer.last_name.ilike(f"%{query}%"))
-    ).limit(20).all()
-
-    if local_players:
-        results = []
-        for p in local_players:
-            team = db.query(DimTeam).filter_by(id=p.team_id).first()
-            results.append({
-                "id": p.id,
-                "first_name": p.first_name,
-                "last_name": p.last_name,
-                "full_name": f"{p.first_name} {p.last_name}",
-                "position": p.position,
-                "team_id": p.team_id,
-                "team": _team_dict(team),
-            })
-        return results
-
-    if has_api_key():
-        api_players = fetch_players(search=query)
-        results = []
-        for p in api_players[:15]:
-            team_data = p.get("team", {})
-            existing = db.query(DimPlayer).filter_by(id=p["id"]).first()
-            if not existing:
-                db.add(DimPlayer(
-                    id=p["id"],
-                    first_name=p.get("first_name", ""),
-                    last_name=p.get("last_name", ""),
-                    position=p.get("position", ""),
-                    team_id=team_data.get("id"),
-                ))
-            team = db.query(DimTeam).filter_by(id=team_data.get("id")).first()
-            results.append({
-                "id": p["id"],
-                "first_name": p.get("first_name", ""),
-                "last_name": p.get("last_name", ""),
-                "full_name": f"{p.get('first_name', '')} {p.get('last_name', '')}",
-                "position": p.get("position", ""),
-                "team_id": team_data.get("id"),
-                "team": _team_dict(team) if team else {
-                    "abbreviation": team_data.get("abbreviation", ""),
-                    "full_name": team_data.get("full_name", ""),
-                    "name": team_data.get("name", ""),
-                },
-            })
-        db.commit()
-        return results
-
-    return []
+    results = search_index(query)
+    if len(results) < ENRICH_MIN_RESULTS and has_api_key():
+        schedule_enrichment(query)
+    return results
 
 
 @router.get("/player-stats/{player_id}")
@@ -571,16 +701,15 @@ def get_player_stats(player_id: int, db: Session = Depends(get_db)):
 
     team = db.query(DimTeam).filter_by(id=player.team_id).first()
 
-    recent_games = db.query(FactBoxScore).filter_by(
-        player_id=player_id
-    ).order_by(FactBoxScore.id.desc()).limit(10).all()
+    recent_games = db.query(FactBoxScore, DimGame.date).outerjoin(
+        DimGame, DimGame.id == FactBoxScore.game_id
+    ).filter(FactBoxScore.player_id == player_id).order_by(FactBoxScore.id.desc()).limit(10).all()
 
     game_log = []
-    for bs in recent_games:
-        game = db.query(DimGame).filter_by(id=bs.game_id).first()
+    for bs, game_date in recent_games:
         game_log.append({
             "game_id": bs.game_id,
-            "date": game.date if game else None,
+            "date": game_date,
             "opponent": None,
             "pts": bs.pts, "reb": bs.reb, "ast": bs.ast,
             "stl": bs.stl, "blk": bs.blk, "turnover": bs.turnover,
@@ -592,9 +721,10 @@ def get_player_stats(player_id: int, db: Session = Depends(get_db)):
 
     rolling = compute_player_rolling_stats(player_id)
 
+    predictions = predict_player_props([player_id], PLAYER_PROP_TYPES, features={player_id: rolling})
     projections = {}
-    for prop_type in ["PTS", "REB", "AST", "STL", "BLK"]:
-        pred = predict_player_prop(player_id, prop_type)
+    for prop_type in PLAYER_PROP_TYPES:
+        pred = predictions.get((player_id, prop_type))
         if pred is not None:
             projections[prop_type] = round(pred, 1)
         elif rolling:
@@ -621,153 +751,55 @@ def get_player_stats(player_id: int, db: Session = Depends(get_db)):
             "last_name": player.last_name,
             "full_name": f"{player.first_name} {player.last_name}",
             "position": player.position,
-            "team": _team_dict(team),
+            "team": team_dict(team),
         },
         "averages": averages,
         "projections": projections,
         "game_log": game_log,
         "games_available": len(recent_games),
+        "summary": summary_dict(db.query(PlayerSummary).filter_by(player_id=player_id).first()),
     }
 
 
-_todays_players_cache = {"data": None, "time": 0}
-
 @router.get("/todays-players")
 def get_todays_players(db: Session = Depends(get_db)):
-    import time as _time
-    from datetime import timedelta
-
-    now = _time.time()
-    if _todays_players_cache["data"] and (now - _todays_players_cache["time"]) < 300:
-        return _todays_players_cache["data"]
-
-    utc_now = datetime.utcnow()
-    today = utc_now.strftime("%Y-%m-%d")
-    yesterday = (utc_now - timedelta(days=1)).strftime("%Y-%m-%d")
-    live_statuses = ["In Progress", "in progress",
-        "1st Qtr", "2nd Qtr", "3rd Qtr", "4th Qtr", "Halftime", "OT", "Half"]
-
-    games = db.query(DimGame).filter(
-        (DimGame.date.in_([today, yesterday])) | (DimGame.status.in_(live_statuses))
-    ).all()
-
+    game_ids = projection_game_ids(db)
+    games = db.query(DimGame).filter(DimGame.id.in_(game_ids)).all()
     if not games:
-        games = db.query(DimGame).order_by(desc(DimGame.date)).limit(6).all()
+        return []
 
+    players = load_game_projections(db, game_ids)
+    built = {gid for (gid,) in db.query(FactPlayerProjection.game_id).filter(
+        FactPlayerProjection.game_id.in_(game_ids)).distinct()}
+    teams = _teams_by_id(db, [t for g in games for t in (g.home_team_id, g.visitor_team_id)])
     result = []
     for g in games:
-        home = db.query(DimTeam).filter_by(id=g.home_team_id).first()
-        away = db.query(DimTeam).filter_by(id=g.visitor_team_id).first()
-
-        home_players = _get_team_players_for_game(db, g.home_team_id, g.id)
-        away_players = _get_team_players_for_game(db, g.visitor_team_id, g.id)
-
-        game_data = {
+        result.append({
             "game_id": g.id,
             "date": g.date,
             "status": g.status,
-            "home_team": _team_dict(home),
-            "away_team": _team_dict(away),
+            "home_team": team_dict(teams.get(g.home_team_id)),
+            "away_team": team_dict(teams.get(g.visitor_team_id)),
             "home_team_score": g.home_team_score,
             "visitor_team_score": g.visitor_team_score,
-            "home_players": home_players,
-            "away_players": away_players,
-        }
-        result.append(game_data)
-
-    _todays_players_cache["data"] = result
-    _todays_players_cache["time"] = now
-    return result
-
-
-def _get_team_players_for_game(db, team_id, game_id):
-    players = db.query(DimPlayer).filter_by(team_id=team_id).all()
-
-    if not players:
-        return []
-
-    POSITION_BASELINES = {
-        "G": {"PTS": 14.5, "REB": 3.2, "AST": 4.8, "STL": 1.1, "BLK": 0.3, "fg_pct": 0.44},
-        "F": {"PTS": 13.0, "REB": 5.8, "AST": 2.4, "STL": 0.9, "BLK": 0.7, "fg_pct": 0.46},
-        "C": {"PTS": 11.5, "REB": 8.2, "AST": 1.8, "STL": 0.6, "BLK": 1.4, "fg_pct": 0.55},
-        "G-F": {"PTS": 13.5, "REB": 4.5, "AST": 3.5, "STL": 1.0, "BLK": 0.5, "fg_pct": 0.45},
-        "F-G": {"PTS": 13.5, "REB": 4.5, "AST": 3.5, "STL": 1.0, "BLK": 0.5, "fg_pct": 0.45},
-        "F-C": {"PTS": 12.0, "REB": 7.0, "AST": 2.0, "STL": 0.7, "BLK": 1.0, "fg_pct": 0.50},
-        "C-F": {"PTS": 12.0, "REB": 7.0, "AST": 2.0, "STL": 0.7, "BLK": 1.0, "fg_pct": 0.50},
-    }
-
-    player_list = []
-
-    for p in players:
-        rolling = compute_player_rolling_stats(p.id)
-
-        pos = (p.position or "G").strip()
-        baseline = POSITION_BASELINES.get(pos, POSITION_BASELINES.get("G"))
-
-        if rolling:
-            averages = {
-                "pts": round(rolling.get("avg_pts", 0), 1),
-                "reb": round(rolling.get("avg_reb", 0), 1),
-                "ast": round(rolling.get("avg_ast", 0), 1),
-                "stl": round(rolling.get("avg_stl", 0), 1),
-                "blk": round(rolling.get("avg_blk", 0), 1),
-                "fg_pct": round(rolling.get("avg_fg_pct", 0), 3),
-            }
-        else:
-            averages = {
-                "pts": baseline["PTS"],
-                "reb": baseline["REB"],
-                "ast": baseline["AST"],
-                "stl": baseline["STL"],
-                "blk": baseline["BLK"],
-                "fg_pct": baseline["fg_pct"],
-            }
-
-        projections = {}
-        for prop_type in ["PTS", "REB", "AST", "STL", "BLK"]:
-            pred = predict_player_prop(p.id, prop_type)
-            if pred is not None:
-                projections[prop_type] = round(pred, 1)
-            elif rolling:
-                key_map = {"PTS": "avg_pts", "REB": "avg_reb", "AST": "avg_ast",
-                           "STL": "avg_stl", "BLK": "avg_blk"}
-                projections[prop_type] = round(rolling.get(key_map.get(prop_type, ""), 0), 1)
-            else:
-                projections[prop_type] = baseline[prop_type]
-
-        games_count = db.query(FactBoxScore).filter_by(player_id=p.id).count()
-
-        player_list.append({
-            "id": p.id,
-            "first_name": p.first_name,
-            "last_name": p.last_name,
-            "full_name": f"{p.first_name} {p.last_name}",
-            "position": p.position,
-            "averages": averages,
-            "projections": projections,
-            "games_tracked": games_count,
+            "home_players": players.get((g.id, g.home_team_id), []),
+            "away_players": players.get((g.id, g.visitor_team_id), []),
+            "projections_ready": g.id in built,
         })
-
-    player_list.sort(key=lambda x: x["projections"].get("PTS", 0), reverse=True)
-    return player_list[:15]
+    return result
 
 
-def _team_dict(t):
-    if not t:
+def _teams_by_id(db, team_ids):
+    team_ids = {tid for tid in team_ids if tid is not None}
+    if not team_ids:
         return {}
-    return {
-        "id": t.id, "abbreviation": t.abbreviation, "city": t.city,
-        "conference": t.conference, "division": t.division,
-        "full_name": t.full_name, "name": t.name,
-        "primary_color": t.primary_color, "secondary_color": t.secondary_color,
-    }
+    return {t.id: t for t in db.query(DimTeam).filter(DimTeam.id.in_(team_ids))}
 
 
-def _boxscore_dict(bs, db):
-    player = db.query(DimPlayer).filter_by(id=bs.player_id).first()
+def _boxscore_dict(bs, first_name=None, last_name=None):
     return {
         "player_id": bs.player_id,
-        "player_name": f"{player.first_name} {player.last_name}" if player else "Unknown",
+        "player_name": f"{first_name} {last_name}" if first_name is not None else "Unknown",
         "team_id": bs.team_id, "min": bs.min,
         "pts": bs.pts, "reb": bs.reb, "ast": bs.ast,
         "stl": bs.stl, "blk": bs.blk, "turnover": bs.turnover,
@@ -0,0 +1,37 @@
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from backend.db.models import DataVersion
+
+
+def mark_changed(db, kind):
+    db.info.setdefault("changed_data", set()).add(kind)
+
+
+def data_versions(db, kinds):
+    versions = dict(db.query(DataVersion.kind, DataVersion.version).filter(DataVersion.kind.in_(kinds)).all())
+    return tuple(versions.get(kind, 0) for kind in kinds)
+
+
+def data_version(db, kind):
+    return data_versions(db, (kind,))[0]
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_changed_data(session):
+    session.flush()
+    kinds = session.info.pop("changed_data", None)
+    if not kinds:
+        return
+    now = datetime.utcnow()
+    stmt = sqlite_insert(DataVersion).values([{"kind": kind, "version": 1, "updated_at": now} for kind in sorted(kinds)])
+    session.execute(stmt.on_conflict_do_update(
+        index_elements=[DataVersion.kind],
+        set_={"version": DataVersion.version + 1, "updated_at": stmt.excluded.updated_at},
+    ))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_data(session):
+    session.info.pop("changed_data", None)
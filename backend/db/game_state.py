@@ -0,0 +1,93 @@
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from backend.db.models import SessionLocal, DimGame
+from backend.metrics import gauge
+
+STATE_SCHEDULED = "scheduled"
+STATE_LIVE = "live"
+STATE_FINAL = "final"
+
+LIVE_SET_TTL_SECONDS = 15
+
+_LIVE_PATTERN = re.compile(r"qtr|quarter|half|progress|overtime|^ot\d*$|^end of")
+
+_live_games = {"ids": frozenset(), "time": 0}
+_live_lock = threading.Lock()
+
+gauge("nba_live_games", "Games currently in the live set", callback=lambda: [((), len(_live_games["ids"]))])
+
+
+def normalize_status(status, period=0):
+    s = (status or "").strip().lower()
+    if "final" in s:
+        return STATE_FINAL
+    if _LIVE_PATTERN.search(s):
+        return STATE_LIVE
+    if period and s not in ("", "scheduled", "postponed"):
+        return STATE_LIVE
+    return STATE_SCHEDULED
+
+
+def apply_status(game, status, period=None):
+    previous = game.state
+    game.status = status
+    game.state = normalize_status(status, game.period if period is None else period)
+    return previous, game.state
+
+
+def parse_tipoff(game):
+    for value in (game.get("datetime"), game.get("status")):
+        if not value or "T" not in str(value):
+            continue
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    return None
+
+
+def get_live_game_ids():
+    if time.time() - _live_games["time"] < LIVE_SET_TTL_SECONDS:
+        return _live_games["ids"]
+    return refresh_live_game_ids()
+
+
+def refresh_live_game_ids(db=None):
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+    try:
+        ids = frozenset(gid for (gid,) in db.query(DimGame.id).filter(DimGame.state == STATE_LIVE))
+    finally:
+        if own_session:
+            db.close()
+    with _live_lock:
+        _live_games["ids"] = ids
+        _live_games["time"] = time.time()
+    return ids
+
+
+def update_live_game_ids(states):
+    with _live_lock:
+        ids = set(_live_games["ids"])
+        for game_id, state in states.items():
+            if state == STATE_LIVE:
+                ids.add(game_id)
+            else:
+                ids.discard(game_id)
+        _live_games["ids"] = frozenset(ids)
+        _live_games["time"] = time.time()
+
+
+def backfill_game_states(db):
+    games = db.query(DimGame).filter(DimGame.state.is_(None)).all()
+    for g in games:
+        g.state = normalize_status(g.status, g.period or 0)
+    if games:
+        db.commit()
+    return len(games)
@@ -0,0 +1,111 @@
+import json
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import update, case
+from sqlalchemy.exc import IntegrityError
+from backend.db.models import SessionLocal, SchedulerLease
+
+SCHEDULER_LEASE = "scheduler"
+LEASE_SECONDS = int(os.environ.get("SCHEDULER_LEASE_SECONDS", "30"))
+
+_leadership = {}
+
+
+def holder_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def acquire_lease(holder, name=SCHEDULER_LEASE, ttl_seconds=LEASE_SECONDS, now=None):
+    now = now or datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name,
+                   (SchedulerLease.holder == holder) | (SchedulerLease.expires_at < now))
+            .values(holder=holder, renewed_at=now, expires_at=expires_at,
+                    acquired_at=case((SchedulerLease.holder == holder, SchedulerLease.acquired_at), else_=now))
+        )
+        if result.rowcount:
+            db.commit()
+            return True
+        if db.query(SchedulerLease.name).filter_by(name=name).first() is not None:
+            db.rollback()
+            return False
+        db.add(SchedulerLease(name=name, holder=holder, acquired_at=now, renewed_at=now, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        return True
+    finally:
+        db.close()
+
+
+def release_lease(holder, name=SCHEDULER_LEASE):
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.holder == holder)
+            .values(expires_at=datetime.utcnow())
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def current_lease(name=SCHEDULER_LEASE):
+    db = SessionLocal()
+    try:
+        lease = db.query(SchedulerLease).filter_by(name=name).first()
+        if lease is None:
+            return None
+        return {
+            "name": lease.name, "holder": lease.holder,
+            "acquired_at": lease.acquired_at.isoformat() if lease.acquired_at else None,
+            "expires_at": lease.expires_at.isoformat(),
+            "active": lease.expires_at > datetime.utcnow(),
+        }
+    finally:
+        db.close()
+
+
+def set_leadership(leading, name=SCHEDULER_LEASE):
+    _leadership[name] = leading
+
+
+def standing_down(name=SCHEDULER_LEASE):
+    return _leadership.get(name) is False
+
+
+def publish_status(holder, status, name=SCHEDULER_LEASE):
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.holder == holder)
+            .values(status=json.dumps(status, default=str), status_at=datetime.utcnow())
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def leader_status(name=SCHEDULER_LEASE):
+    db = SessionLocal()
+    try:
+        lease = db.query(SchedulerLease).filter_by(name=name).first()
+        if lease is None or not lease.status:
+            return None
+        return {
+            **json.loads(lease.status),
+            "holder": lease.holder,
+            "published_at": lease.status_at.isoformat() if lease.status_at else None,
+        }
+    finally:
+        db.close()
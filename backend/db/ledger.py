@@ -0,0 +1,107 @@
+from collections import defaultdict
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from backend.db.models import UserPick, UserPickLedger
+
+RESULT_COUNTERS = {"win": "wins", "loss": "losses", "push": "pushes", "pending": "pending"}
+LEDGER_FIELDS = ["total_picks", "wins", "losses", "pushes", "pending", "total_staked", "total_payout"]
+
+
+def _month(created_at):
+    return created_at.strftime("%Y-%m") if created_at else "unknown"
+
+
+def pick_delta(result, stake, payout, sign=1):
+    delta = {
+        "total_picks": sign,
+        "total_staked": sign * (stake or 0),
+        "total_payout": sign * (payout or 0),
+    }
+    counter = RESULT_COUNTERS.get(result or "pending")
+    if counter:
+        delta[counter] = sign
+    return delta
+
+
+def pick_bucket(user_id, pick_type, created_at):
+    return (user_id, pick_type or "", _month(created_at))
+
+
+def add_delta(deltas, bucket, delta):
+    entry = deltas[bucket]
+    for field, value in delta.items():
+        entry[field] += value
+
+
+def new_deltas():
+    return defaultdict(lambda: defaultdict(float))
+
+
+def apply_deltas(db, deltas):
+    rows = [{"user_id": user_id, "pick_type": pick_type, "month": month,
+             **{field: delta.get(field, 0) for field in LEDGER_FIELDS}}
+            for (user_id, pick_type, month), delta in deltas.items()
+            if user_id is not None and any(delta.get(field) for field in LEDGER_FIELDS)]
+    if not rows:
+        return
+    stmt = sqlite_insert(UserPickLedger.__table__)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id", "pick_type", "month"],
+        set_={field: UserPickLedger.__table__.c[field] + stmt.excluded[field] for field in LEDGER_FIELDS},
+    ), rows)
+
+
+def record_pick(db, pick, sign=1):
+    deltas = new_deltas()
+    add_delta(deltas, pick_bucket(pick.user_id, pick.pick_type, pick.created_at),
+              pick_delta(pick.result, pick.stake, pick.payout, sign))
+    apply_deltas(db, deltas)
+
+
+def rebuild_ledger(db):
+    db.query(UserPickLedger).delete()
+    deltas = new_deltas()
+    rows = db.query(
+        UserPick.user_id, UserPick.pick_type, UserPick.created_at,
+        UserPick.result, UserPick.stake, UserPick.payout
+    ).filter(UserPick.user_id.isnot(None)).yield_per(1000)
+    for user_id, pick_type, created_at, result, stake, payout in rows:
+        add_delta(deltas, pick_bucket(user_id, pick_type, created_at), pick_delta(result, stake, payout))
+    apply_deltas(db, deltas)
+    db.commit()
+
+
+def summarize(rows):
+    totals = dict.fromkeys(LEDGER_FIELDS, 0)
+    for r in rows:
+        for field in LEDGER_FIELDS:
+            totals[field] += getattr(r, field) or 0
+
+    graded = totals["wins"] + totals["losses"]
+    staked = totals["total_staked"]
+    payout = totals["total_payout"]
+    return {
+        "total_picks": int(totals["total_picks"]),
+        "wins": int(totals["wins"]),
+        "losses": int(totals["losses"]),
+        "pushes": int(totals["pushes"]),
+        "pending": int(totals["pending"]),
+        "win_rate": round(totals["wins"] / graded, 3) if graded else 0,
+        "total_staked": round(staked, 2),
+        "total_payout": round(payout, 2),
+        "roi": round((payout - staked) / staked * 100, 2) if staked > 0 else 0,
+        "profit": round(payout - staked, 2),
+    }
+
+
+def get_user_stats(db, user_id):
+    rows = db.query(UserPickLedger).filter_by(user_id=user_id).all()
+    by_type = defaultdict(list)
+    by_month = defaultdict(list)
+    for r in rows:
+        by_type[r.pick_type].append(r)
+        by_month[r.month].append(r)
+
+    stats = summarize(rows)
+    stats["by_type"] = {k: summarize(v) for k, v in by_type.items()}
+    stats["by_month"] = {k: summarize(v) for k, v in sorted(by_month.items())}
+    return stats
@@ -1,14 +1,18 @@
 import json
+import os
 from datetime import datetime
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey
+    create_engine, inspect, text, Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey,
+    Index, UniqueConstraint
 )
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 
 Base = declarative_base()
 
-DATABASE_URL = "sqlite:///nba_pipeline.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///nba_pipeline.db")
+engine = create_engine(
+    DATABASE_URL, connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
@@ -42,6 +46,17 @@ class DimTeam(Base):
     secondary_color = Column(String(7), default="#e94560")
 
 
+def team_dict(team):
+    if not team:
+        return {}
+    return {
+        "id": team.id, "abbreviation": team.abbreviation, "city": team.city,
+        "conference": team.conference, "division": team.division,
+        "full_name": team.full_name, "name": team.name,
+        "primary_color": team.primary_color, "secondary_color": team.secondary_color,
+    }
+
+
 class DimPlayer(Base):
     __tablename__ = "dim_players"
     id = Column(Integer, primary_key=True)
@@ -58,6 +73,7 @@ class DimGame(Base):
     date = Column(String(20), index=True)
     season = Column(Integer)
     status = Column(String(50))
+    state = Column(String(20), index=True)
     period = Column(Integer, default=0)
     time = Column(String(20))
     home_team_id = Column(Integer, ForeignKey("dim_teams.id"))
@@ -65,6 +81,7 @@ class DimGame(Base):
     home_team_score = Column(Integer, default=0)
     visitor_team_score = Column(Integer, default=0)
     postseason = Column(Boolean, default=False)
+    tipoff_at = Column(DateTime, index=True)
     home_team = relationship("DimTeam", foreign_keys=[home_team_id])
     visitor_team = relationship("DimTeam", foreign_keys=[visitor_team_id])
 
@@ -92,6 +109,31 @@ class FactBoxScore(Base):
     fg_pct = Column(Float, default=0.0)
     fg3_pct = Column(Float, default=0.0)
     ft_pct = Column(Float, default=0.0)
+    __table_args__ = (
+        Index("ix_fact_boxscores_player", "player_id", "id"),
+    )
+
+
+class PlayerSummary(Base):
+    __tablename__ = "player_summaries"
+    player_id = Column(Integer, ForeignKey("dim_players.id"), primary_key=True)
+    games_tracked = Column(Integer, default=0)
+    last_game_id = Column(Integer)
+    last_game_date = Column(String(20))
+    season = Column(Integer)
+    season_games = Column(Integer, default=0)
+    pts = Column(Integer, default=0)
+    reb = Column(Integer, default=0)
+    ast = Column(Integer, default=0)
+    stl = Column(Integer, default=0)
+    blk = Column(Integer, default=0)
+    turnover = Column(Integer, default=0)
+    fgm = Column(Integer, default=0)
+    fga = Column(Integer, default=0)
+    fg3m = Column(Integer, default=0)
+    ftm = Column(Integer, default=0)
+    fta = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
 
 
 class FactOddsSnapshot(Base):
@@ -108,6 +150,53 @@ class FactOddsSnapshot(Base):
     over_odds = Column(Float)
     under_odds = Column(Float)
     snapshot_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        Index("ix_fact_odds_snapshots_series", "game_id", "vendor", "market_type", "snapshot_at"),
+    )
+
+
+class FactOddsLatest(Base):
+    __tablename__ = "fact_odds_latest"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_id = Column(Integer, ForeignKey("dim_games.id"), index=True)
+    vendor = Column(String(100))
+    market_type = Column(String(50))
+    home_line = Column(Float)
+    away_line = Column(Float)
+    home_odds = Column(Float)
+    away_odds = Column(Float)
+    total = Column(Float)
+    over_odds = Column(Float)
+    under_odds = Column(Float)
+    open_home_line = Column(Float)
+    open_total = Column(Float)
+    first_seen_at = Column(DateTime)
+    snapshot_at = Column(DateTime)
+    last_seen_at = Column(DateTime)
+    __table_args__ = (
+        UniqueConstraint("game_id", "vendor", "market_type", name="uq_fact_odds_latest_series"),
+    )
+
+
+class FactLineRollup(Base):
+    __tablename__ = "fact_line_rollups"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_id = Column(Integer, ForeignKey("dim_games.id"), nullable=False)
+    resolution = Column(String(4), nullable=False)
+    vendor = Column(String(100), nullable=False)
+    market = Column(String(60), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float)
+    count = Column(Integer, default=0)
+    first_at = Column(DateTime)
+    last_at = Column(DateTime)
+    __table_args__ = (
+        UniqueConstraint("game_id", "resolution", "vendor", "market", "bucket_start",
+                         name="uq_fact_line_rollups_bucket"),
+    )
 
 
 class FactPropSnapshot(Base):
@@ -123,6 +212,26 @@ class FactPropSnapshot(Base):
     under_odds = Column(Float)
     vendor = Column(String(100))
     snapshot_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        Index("ix_fact_prop_snapshots_series", "game_id", "player_id", "prop_type", "vendor", "snapshot_at"),
+    )
+
+
+class FactPlayerProjection(Base):
+    __tablename__ = "fact_player_projections"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_id = Column(Integer, ForeignKey("dim_games.id"), nullable=False)
+    player_id = Column(Integer, ForeignKey("dim_players.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("dim_teams.id"), index=True)
+    prop_type = Column(String(20), nullable=False)
+    projection = Column(Float)
+    average = Column(Float)
+    source = Column(String(20))
+    games_tracked = Column(Integer, default=0)
+    built_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        UniqueConstraint("game_id", "player_id", "prop_type", name="uq_fact_player_projections_prop"),
+    )
 
 
 class FeatureStore(Base):
@@ -158,7 +267,7 @@ class User(Base):
 class UserPick(Base):
     __tablename__ = "user_picks"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    game_id = Column(Integer, ForeignKey("dim_games.id"))
+    game_id = Column(Integer, ForeignKey("dim_games.id"), index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     pick_type = Column(String(20))
     selection = Column(String(200))
@@ -175,6 +284,74 @@ class UserPick(Base):
     line = Column(Float, nullable=True)
     pick_side = Column(String(10), nullable=True)
     actual_stat = Column(Float, nullable=True)
+    __table_args__ = (
+        Index("ix_user_picks_user_created", "user_id", "created_at", "id"),
+    )
+
+
+class UserPickLedger(Base):
+    __tablename__ = "user_pick_ledger"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    pick_type = Column(String(20), nullable=False)
+    month = Column(String(7), nullable=False)
+    total_picks = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    pushes = Column(Integer, default=0)
+    pending = Column(Integer, default=0)
+    total_staked = Column(Float, default=0.0)
+    total_payout = Column(Float, default=0.0)
+    __table_args__ = (
+        UniqueConstraint("user_id", "pick_type", "month", name="uq_user_pick_ledger_bucket"),
+    )
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(200), nullable=False)
+    acquired_at = Column(DateTime, default=datetime.utcnow)
+    renewed_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
+    status = Column(Text)
+    status_at = Column(DateTime)
+
+
+class ModelJob(Base):
+    __tablename__ = "model_jobs"
+    id = Column(String(12), primary_key=True)
+    kind = Column(String(20), nullable=False)
+    source = Column(String(20))
+    status = Column(String(20), nullable=False, index=True)
+    active_key = Column(String(20), unique=True)
+    stage = Column(String(50))
+    progress = Column(Float, default=0.0)
+    stages = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    duration_seconds = Column(Float)
+    claimed_by = Column(String(200))
+    result = Column(Text)
+    error = Column(Text)
+
+
+class PlayerSearchRequest(Base):
+    __tablename__ = "player_search_requests"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    query_key = Column(String(100), nullable=False, unique=True)
+    query = Column(String(100), nullable=False)
+    requested_at = Column(DateTime, default=datetime.utcnow)
+    processed_at = Column(DateTime, index=True)
+
+
+class DataVersion(Base):
+    __tablename__ = "data_versions"
+    kind = Column(String(20), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
 
 
 class ScoreHistory(Base):
@@ -187,5 +364,20 @@ class ScoreHistory(Base):
     recorded_at = Column(DateTime, default=datetime.utcnow)
 
 
+def _ensure_schema():
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    col_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"))
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def init_db():
     Base.metadata.create_all(bind=engine)
+    _ensure_schema()
@@ -0,0 +1,243 @@
+import heapq
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from sqlalchemy import event
+from collections import deque
+from backend.metrics import JOB_RUNS, JOB_DURATION, JOB_LAST_SUCCESS, JOB_PHASE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_PER_SCOPE = 3
+SLOWEST_OVERALL = 10
+STATEMENT_PREVIEW_CHARS = 300
+BUDGET_MODES = ("off", "log", "raise")
+RECENT_JOB_RUNS = 20
+
+QUERY_BUDGETS = {
+    "GET /api/games/today": 6,
+    "GET /api/games/calendar": 3,
+    "GET /api/odds": 6,
+    "GET /api/props": 4,
+    "GET /api/picks": 6,
+    "GET /api/model-odds": 8,
+    "GET /api/todays-players": 8,
+}
+
+_current = ContextVar("query_stats", default=None)
+_lock = threading.Lock()
+_aggregates = {"route": {}, "job": {}}
+_slowest = []
+_recent_runs = {}
+_settings = {"budget_mode": os.environ.get("QUERY_BUDGET_MODE", "log")}
+_instrumented = set()
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def set_budget_mode(mode):
+    if mode not in BUDGET_MODES:
+        raise ValueError(f"Unknown query budget mode: {mode}")
+    previous = _settings["budget_mode"]
+    _settings["budget_mode"] = mode
+    return previous
+
+
+def set_query_budget(scope, max_queries):
+    if max_queries is None:
+        QUERY_BUDGETS.pop(scope, None)
+    else:
+        QUERY_BUDGETS[scope] = max_queries
+
+
+def _new_stats(kind, name):
+    return {"kind": kind, "name": name, "queries": 0, "db_ms": 0.0, "http_calls": 0, "http_ms": 0.0, "slowest": [],
+            "started": time.perf_counter()}
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._perf_started = time.perf_counter()
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, "_perf_started", None)
+    if stats is None or started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats["queries"] += 1
+    stats["db_ms"] += elapsed_ms
+    entry = (elapsed_ms, statement[:STATEMENT_PREVIEW_CHARS])
+    if len(stats["slowest"]) < SLOWEST_PER_SCOPE:
+        heapq.heappush(stats["slowest"], entry)
+    elif elapsed_ms > stats["slowest"][0][0]:
+        heapq.heapreplace(stats["slowest"], entry)
+
+
+def record_http(elapsed_ms):
+    stats = _current.get()
+    if stats is not None:
+        stats["http_calls"] += 1
+        stats["http_ms"] += elapsed_ms
+
+
+def instrument_engine(engine):
+    if id(engine) in _instrumented:
+        return
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    event.listen(engine, "after_cursor_execute", _after_execute)
+    _instrumented.add(id(engine))
+
+
+def current_stats():
+    return _current.get()
+
+
+def start_tracking(kind, name):
+    stats = _new_stats(kind, name)
+    return stats, _current.set(stats)
+
+
+def finish_tracking(stats, token, scope=None):
+    _current.reset(token)
+    stats["total_ms"] = (time.perf_counter() - stats["started"]) * 1000
+    if scope is not None:
+        stats["name"] = scope
+    _record(stats)
+    return stats
+
+
+def _record(stats):
+    with _lock:
+        agg = _aggregates[stats["kind"]].setdefault(stats["name"], {
+            "count": 0, "queries": 0, "max_queries": 0, "db_ms": 0.0, "max_db_ms": 0.0, "total_ms": 0.0,
+            "budget_exceeded": 0,
+        })
+        agg["count"] += 1
+        agg["queries"] += stats["queries"]
+        agg["max_queries"] = max(agg["max_queries"], stats["queries"])
+        agg["db_ms"] += stats["db_ms"]
+        agg["max_db_ms"] = max(agg["max_db_ms"], stats["db_ms"])
+        agg["total_ms"] += stats["total_ms"]
+        for elapsed_ms, statement in stats["slowest"]:
+            entry = (elapsed_ms, statement, stats["kind"], stats["name"])
+            if len(_slowest) < SLOWEST_OVERALL:
+                heapq.heappush(_slowest, entry)
+            elif elapsed_ms > _slowest[0][0]:
+                heapq.heapreplace(_slowest, entry)
+    check_budget(stats)
+
+
+def check_budget(stats, budget=None):
+    budget = budget if budget is not None else QUERY_BUDGETS.get(stats["name"])
+    mode = _settings["budget_mode"]
+    if budget is None or mode == "off" or stats["queries"] <= budget:
+        return True
+    with _lock:
+        agg = _aggregates[stats["kind"]].get(stats["name"])
+        if agg is not None:
+            agg["budget_exceeded"] += 1
+    message = (f"{stats['name']} ran {stats['queries']} queries (budget {budget}, "
+               f"{stats['db_ms']:.1f}ms in DB)")
+    if mode == "raise":
+        raise QueryBudgetExceeded(message)
+    logger.warning(f"Query budget exceeded: {message}")
+    return False
+
+
+@contextmanager
+def query_budget(max_queries, name="block"):
+    stats, token = start_tracking("job", name)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+    if stats["queries"] > max_queries:
+        raise QueryBudgetExceeded(f"{name} ran {stats['queries']} queries (budget {max_queries})")
+
+
+def tracked_job(fn):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        stats, token = start_tracking("job", fn.__name__)
+        cpu_started = time.thread_time()
+        status = "error"
+        try:
+            result = fn(*args, **kwargs)
+            status = "success"
+            return result
+        finally:
+            stats["cpu_ms"] = (time.thread_time() - cpu_started) * 1000
+            stats["status"] = status
+            finish_tracking(stats, token)
+            _remember_run(stats)
+            JOB_RUNS.inc(fn.__name__, status)
+            JOB_DURATION.observe(stats["total_ms"] / 1000, fn.__name__)
+            for phase in ("db", "http", "cpu"):
+                JOB_PHASE_SECONDS.inc(fn.__name__, phase, amount=stats[f"{phase}_ms"] / 1000)
+            if status == "success":
+                JOB_LAST_SUCCESS.set(time.time(), fn.__name__)
+    return wrapper
+
+
+def _remember_run(stats):
+    run = {
+        "finished_at": datetime.utcnow().isoformat(), "status": stats["status"],
+        "total_ms": round(stats["total_ms"], 1), "db_ms": round(stats["db_ms"], 1),
+        "http_ms": round(stats["http_ms"], 1), "cpu_ms": round(stats["cpu_ms"], 1),
+        "queries": stats["queries"], "http_calls": stats["http_calls"],
+    }
+    with _lock:
+        _recent_runs.setdefault(stats["name"], deque(maxlen=RECENT_JOB_RUNS)).append(run)
+
+
+def recent_job_runs(name):
+    with _lock:
+        return list(_recent_runs.get(name, ()))
+
+
+def server_timing(stats):
+    return (f'db;dur={stats["db_ms"]:.1f};desc="{stats["queries"]} queries", '
+            f'app;dur={stats["total_ms"]:.1f}')
+
+
+def _summarize(name, agg):
+    count = agg["count"] or 1
+    return {
+        "name": name, "count": agg["count"],
+        "avg_queries": round(agg["queries"] / count, 2), "max_queries": agg["max_queries"],
+        "avg_db_ms": round(agg["db_ms"] / count, 2), "max_db_ms": round(agg["max_db_ms"], 2),
+        "avg_total_ms": round(agg["total_ms"] / count, 2),
+        "budget": QUERY_BUDGETS.get(name), "budget_exceeded": agg["budget_exceeded"],
+    }
+
+
+def perf_report():
+    with _lock:
+        return {
+            "budget_mode": _settings["budget_mode"],
+            "routes": sorted((_summarize(n, a) for n, a in _aggregates["route"].items()),
+                             key=lambda r: r["avg_db_ms"], reverse=True),
+            "jobs": sorted((_summarize(n, a) for n, a in _aggregates["job"].items()),
+                           key=lambda r: r["avg_db_ms"], reverse=True),
+            "slowest_statements": [
+                {"ms": round(ms, 2), "statement": statement, "kind": kind, "name": name}
+                for ms, statement, kind, name in sorted(_slowest, reverse=True)
+            ],
+        }
+
+
+def reset_perf():
+    with _lock:
+        _aggregates["route"].clear()
+        _aggregates["job"].clear()
+        _slowest.clear()
+        _recent_runs.clear()
@@ -0,0 +1,306 @@
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy import event, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
+from backend.db.models import SessionLocal, DimPlayer, DimTeam, PlayerSearchRequest, team_dict
+from backend.db.data_versions import data_version, mark_changed
+from backend.db.lease import standing_down
+
+logger = logging.getLogger(__name__)
+
+SEARCH_LIMIT = 20
+FUZZY_MIN_LENGTH = 4
+FUZZY_THRESHOLD = 0.5
+ENRICH_MIN_RESULTS = 3
+ENRICH_COOLDOWN_SECONDS = 3600
+ENRICH_BATCH_SIZE = 10
+INDEX_CHECK_SECONDS = int(os.environ.get("PLAYER_INDEX_CHECK_SECONDS", "30"))
+
+_index = {"current": None, "watermark": None, "checked_at": 0.0}
+_index_lock = threading.Lock()
+_enrich_lock = threading.Lock()
+_enrich_recent = {}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+
+
+def normalize_name(text):
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return " ".join(_NON_ALNUM.sub(" ", text).split())
+
+
+def trigrams(text):
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _entry(player_id, first_name, last_name, position, team_id, team):
+    full_name = f"{first_name or ''} {last_name or ''}".strip()
+    key = normalize_name(full_name)
+    return {
+        "id": player_id,
+        "first_name": first_name or "",
+        "last_name": last_name or "",
+        "full_name": full_name,
+        "position": position or "",
+        "team_id": team_id,
+        "team": team,
+        "key": key,
+        "words": key.split(),
+        "trigrams": trigrams(key),
+    }
+
+
+def _build(entries):
+    postings = {}
+    tokens = []
+    for i, e in enumerate(entries):
+        for gram in e["trigrams"]:
+            postings.setdefault(gram, []).append(i)
+        tokens.extend((word, i) for word in e["words"])
+        tokens.append((e["key"], i))
+    tokens.sort()
+    return {"entries": entries, "trigrams": postings, "tokens": tokens}
+
+
+@event.listens_for(DimPlayer, "after_insert")
+@event.listens_for(DimPlayer, "after_update")
+@event.listens_for(DimPlayer, "after_delete")
+def _track_changed_players(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        mark_changed(session, "players")
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_player_changes(state):
+    if (state.is_update or state.is_delete) and state.bind_mapper is not None \
+            and state.bind_mapper.class_ is DimPlayer:
+        mark_changed(state.session, "players")
+
+
+def rebuild_player_index(db=None):
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+    try:
+        watermark = data_version(db, "players")
+        teams = {t.id: team_dict(t) for t in db.query(DimTeam)}
+        entries = [
+            _entry(p.id, p.first_name, p.last_name, p.position, p.team_id, teams.get(p.team_id, {}))
+            for p in db.query(DimPlayer)
+        ]
+    finally:
+        if own_session:
+            db.close()
+    index = _build(entries)
+    with _index_lock:
+        _index.update(current=index, watermark=watermark, checked_at=time.monotonic())
+    logger.info(f"Player search index rebuilt with {len(entries)} players")
+    return len(entries)
+
+
+def add_to_index(entries):
+    with _index_lock:
+        current = _index["current"]["entries"] if _index["current"] else []
+        known = {e["id"] for e in current}
+        fresh = [e for e in entries if e["id"] not in known]
+        if fresh:
+            _index["current"] = _build(current + fresh)
+    return len(fresh)
+
+
+def _prefix_matches(index, prefix):
+    tokens = index["tokens"]
+    matches = set()
+    i = bisect_left(tokens, (prefix, -1))
+    while i < len(tokens) and tokens[i][0].startswith(prefix):
+        matches.add(tokens[i][1])
+        i += 1
+    return matches
+
+
+def _score(entry, query, query_words, shared, query_grams):
+    key = entry["key"]
+    if key == query:
+        return 100
+    if key.startswith(query):
+        return 90
+    words = entry["words"]
+    if all(any(w.startswith(q) for w in words) for q in query_words):
+        return 80
+    if query in key:
+        return 60
+    if len(query) < FUZZY_MIN_LENGTH or not query_grams:
+        return 0
+    similarity = shared / len(query_grams)
+    if similarity < FUZZY_THRESHOLD:
+        return 0
+    jaccard = shared / (len(query_grams) + len(entry["trigrams"]) - shared)
+    return 30 + 20 * similarity + 10 * jaccard
+
+
+def refresh_player_index(force=False):
+    if not force and time.monotonic() - _index["checked_at"] < INDEX_CHECK_SECONDS:
+        return False
+    db = SessionLocal()
+    try:
+        _index["checked_at"] = time.monotonic()
+        if data_version(db, "players") == _index["watermark"]:
+            return False
+        rebuild_player_index(db)
+    finally:
+        db.close()
+    return True
+
+
+def search_index(query, limit=SEARCH_LIMIT):
+    if _index["current"] is None:
+        rebuild_player_index()
+    else:
+        refresh_player_index()
+    index = _index["current"]
+    q = normalize_name(query)
+    if not q:
+        return []
+    query_words = q.split()
+    query_grams = trigrams(q)
+
+    shared = Counter()
+    for gram in query_grams:
+        shared.update(index["trigrams"].get(gram, ()))
+    candidates = set(shared) | _prefix_matches(index, q)
+    for word in query_words:
+        candidates |= _prefix_matches(index, word)
+
+    entries = index["entries"]
+    scored = []
+    for i in candidates:
+        score = _score(entries[i], q, query_words, shared[i], query_grams)
+        if score > 0:
+            scored.append((-score, entries[i]["full_name"], i))
+    scored.sort()
+    return [_result(entries[i]) for _, _, i in scored[:limit]]
+
+
+def _result(entry):
+    return {
+        "id": entry["id"],
+        "first_name": entry["first_name"],
+        "last_name": entry["last_name"],
+        "full_name": entry["full_name"],
+        "position": entry["position"],
+        "team_id": entry["team_id"],
+        "team": entry["team"],
+    }
+
+
+def enrich_from_api(query):
+    from backend.ingest.bdl_client import fetch_players
+
+    api_players = fetch_players(search=query)
+    if not api_players:
+        return 0
+    db = SessionLocal()
+    try:
+        ids = [p["id"] for p in api_players if p.get("id")]
+        known = {pid for (pid,) in db.query(DimPlayer.id).filter(DimPlayer.id.in_(ids))}
+        team_ids = {(p.get("team") or {}).get("id") for p in api_players}
+        teams = {t.id: team_dict(t) for t in db.query(DimTeam).filter(DimTeam.id.in_(team_ids))}
+        entries = []
+        for p in api_players:
+            if not p.get("id") or p["id"] in known:
+                continue
+            team_data = p.get("team") or {}
+            db.add(DimPlayer(
+                id=p["id"],
+                first_name=p.get("first_name", ""),
+                last_name=p.get("last_name", ""),
+                position=p.get("position", ""),
+                team_id=team_data.get("id"),
+            ))
+            team = teams.get(team_data.get("id")) or {
+                "abbreviation": team_data.get("abbreviation", ""),
+                "full_name": team_data.get("full_name", ""),
+                "name": team_data.get("name", ""),
+            }
+            entries.append(_entry(p["id"], p.get("first_name"), p.get("last_name"),
+                                  p.get("position"), team_data.get("id"), team))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error enriching player search for '{query}': {e}")
+        return 0
+    finally:
+        db.close()
+    added = add_to_index(entries)
+    if added:
+        logger.info(f"Added {added} players from BDL search for '{query}'")
+    return added
+
+
+def schedule_enrichment(query):
+    key = normalize_name(query)[:100]
+    if not key:
+        return False
+    now = time.time()
+    with _enrich_lock:
+        last = _enrich_recent.get(key)
+        if last is not None and now - last < ENRICH_COOLDOWN_SECONDS:
+            return False
+        _enrich_recent[key] = now
+    db = SessionLocal()
+    try:
+        request = db.query(PlayerSearchRequest).filter_by(query_key=key).first()
+        cutoff = datetime.utcnow() - timedelta(seconds=ENRICH_COOLDOWN_SECONDS)
+        if request is None:
+            db.add(PlayerSearchRequest(query_key=key, query=query[:100]))
+        elif request.processed_at is not None and request.processed_at < cutoff:
+            request.query = query[:100]
+            request.requested_at = datetime.utcnow()
+            request.processed_at = None
+        else:
+            return False
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    finally:
+        db.close()
+    return True
+
+
+def process_enrichment_requests(limit=ENRICH_BATCH_SIZE):
+    db = SessionLocal()
+    try:
+        pending = db.query(PlayerSearchRequest.id, PlayerSearchRequest.query).filter(
+            PlayerSearchRequest.processed_at.is_(None)
+        ).order_by(PlayerSearchRequest.requested_at).limit(limit).all()
+    finally:
+        db.close()
+
+    added = 0
+    for request_id, query in pending:
+        if standing_down():
+            break
+        added += enrich_from_api(query)
+        db = SessionLocal()
+        try:
+            db.execute(update(PlayerSearchRequest).where(PlayerSearchRequest.id == request_id)
+                       .values(processed_at=datetime.utcnow()))
+            db.commit()
+        finally:
+            db.close()
+    return added
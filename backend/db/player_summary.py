@@ -0,0 +1,81 @@
+from datetime import datetime
+from backend.db.models import DimGame, FactBoxScore, PlayerSummary
+
+TOTAL_FIELDS = ["pts", "reb", "ast", "stl", "blk", "turnover", "fgm", "fga", "fg3m", "ftm", "fta"]
+
+
+def _new_summary(player_id):
+    return PlayerSummary(player_id=player_id, games_tracked=0, season_games=0,
+                         **dict.fromkeys(TOTAL_FIELDS, 0))
+
+
+def _apply(summary, bs, game_date, season):
+    summary.games_tracked = (summary.games_tracked or 0) + 1
+    if (game_date or "", bs.game_id) >= (summary.last_game_date or "", summary.last_game_id or 0):
+        summary.last_game_id = bs.game_id
+        summary.last_game_date = game_date
+
+    if season is None or (summary.season is not None and season < summary.season):
+        return
+    if summary.season is None or season > summary.season:
+        summary.season = season
+        summary.season_games = 0
+        for field in TOTAL_FIELDS:
+            setattr(summary, field, 0)
+    summary.season_games = (summary.season_games or 0) + 1
+    for field in TOTAL_FIELDS:
+        setattr(summary, field, (getattr(summary, field) or 0) + (getattr(bs, field) or 0))
+    summary.updated_at = datetime.utcnow()
+
+
+def record_box_scores(db, box_scores):
+    box_scores = [bs for bs in box_scores if bs.player_id is not None]
+    if not box_scores:
+        return
+    games = {g.id: g for g in db.query(DimGame).filter(
+        DimGame.id.in_({bs.game_id for bs in box_scores})
+    )}
+    summaries = {s.player_id: s for s in db.query(PlayerSummary).filter(
+        PlayerSummary.player_id.in_({bs.player_id for bs in box_scores})
+    )}
+    for bs in box_scores:
+        summary = summaries.get(bs.player_id)
+        if summary is None:
+            summary = summaries[bs.player_id] = _new_summary(bs.player_id)
+            db.add(summary)
+        game = games.get(bs.game_id)
+        _apply(summary, bs, game.date if game else None, game.season if game else None)
+    db.flush()
+
+
+def rebuild_player_summaries(db):
+    db.query(PlayerSummary).delete()
+    summaries = {}
+    rows = db.query(FactBoxScore, DimGame.date, DimGame.season).outerjoin(
+        DimGame, DimGame.id == FactBoxScore.game_id
+    ).filter(FactBoxScore.player_id.isnot(None)).order_by(DimGame.date, FactBoxScore.game_id).yield_per(1000)
+    for bs, game_date, season in rows:
+        summary = summaries.get(bs.player_id)
+        if summary is None:
+            summary = summaries[bs.player_id] = _new_summary(bs.player_id)
+        _apply(summary, bs, game_date, season)
+    db.add_all(summaries.values())
+    db.commit()
+    return len(summaries)
+
+
+def summary_dict(summary):
+    if summary is None:
+        return {"games_tracked": 0, "last_game_id": None, "last_game_date": None,
+                "season": None, "season_games": 0, "totals": {}, "per_game": {}}
+    games = summary.season_games or 0
+    totals = {field: getattr(summary, field) or 0 for field in TOTAL_FIELDS}
+    return {
+        "games_tracked": summary.games_tracked or 0,
+        "last_game_id": summary.last_game_id,
+        "last_game_date": summary.last_game_date,
+        "season": summary.season,
+        "season_games": games,
+        "totals": totals,
+        "per_game": {field: round(value / games, 1) for field, value in totals.items()} if games else {},
+    }
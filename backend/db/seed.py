@@ -3,9 +3,15 @@ import os
 import random
 from backend.db.models import (
     SessionLocal, DimTeam, DimPlayer, DimGame, FactBoxScore,
-    FactOddsSnapshot, FactPropSnapshot, ScoreHistory, UserPick, init_db
+    FactOddsSnapshot, FactOddsLatest, FactLineRollup, ScoreHistory, UserPick, UserPickLedger,
+    PlayerSummary, init_db
 )
+from backend.db.game_state import STATE_SCHEDULED, STATE_LIVE, STATE_FINAL, backfill_game_states
+from backend.db.ledger import rebuild_ledger
+from backend.db.player_summary import record_box_scores, rebuild_player_summaries
 from backend.ingest.bdl_client import has_api_key
+from backend.ingest.odds import record_odds_snapshot, record_prop_snapshot, rebuild_latest_odds
+from backend.ingest.line_rollups import rebuild_line_rollups
 
 NBA_TEAMS = [
     (1, "ATL", "Atlanta", "East", "Southeast", "Atlanta Hawks", "Hawks", "#E03A3E", "#C1D32F"),
@@ -84,6 +90,15 @@ def seed_database():
                 ))
             db.commit()
 
+        backfill_game_states(db)
+        if db.query(UserPickLedger).first() is None and db.query(UserPick).filter(UserPick.user_id.isnot(None)).first():
+            rebuild_ledger(db)
+        if db.query(FactOddsLatest).first() is None and db.query(FactOddsSnapshot).first():
+            rebuild_latest_odds(db)
+        if db.query(FactLineRollup).first() is None and db.query(FactOddsSnapshot).first():
+            rebuild_line_rollups(db)
+        if db.query(PlayerSummary).first() is None and db.query(FactBoxScore).first():
+            rebuild_player_summaries(db)
         if not has_api_key():
             _seed_demo_data(db)
     finally:
@@ -97,19 +112,21 @@ def _seed_demo_data(db):
     today = datetime.utcnow().strftime("%Y-%m-%d")
     yesterday = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
     game_pairs = [(14, 2), (10, 17), (21, 7), (8, 24), (20, 16)]
+    box_scores = []
 
     for i, (home, away) in enumerate(game_pairs):
         game_id = 900000 + i
         is_live = i < 2
         is_final = i >= 2 and i < 4
         status = "In Progress" if is_live else ("Final" if is_final else "Scheduled")
+        state = STATE_LIVE if is_live else (STATE_FINAL if is_final else STATE_SCHEDULED)
         period = random.randint(2, 4) if is_live else (4 if is_final else 0)
         h_score = random.randint(70, 120) if (is_live or is_final) else 0
         v_score = random.randint(70, 120) if (is_live or is_final) else 0
         game_date = yesterday if is_final else today
 
         db.add(DimGame(
-            id=game_id, date=game_date, season=2025, status=status,
+            id=game_id, date=game_date, season=2025, status=status, state=state,
             period=period, time="8:30 PM ET" if not is_live else f"Q{period} 5:42",
             home_team_id=home, visitor_team_id=away,
             home_team_score=h_score, visitor_team_score=v_score
@@ -128,17 +145,16 @@ def _seed_demo_data(db):
         for vendor in VENDORS:
             spread = round(random.uniform(-8, 8), 1)
             total = round(random.uniform(210, 235), 1)
-            for snap in range(3):
+            for snap in reversed(range(3)):
                 snap_time = datetime.utcnow() - timedelta(minutes=snap * 30)
                 mv = random.uniform(-0.5, 0.5)
-                db.add(FactOddsSnapshot(
-                    game_id=game_id, vendor=vendor, market_type="game",
+                record_odds_snapshot(
+                    db, game_id, vendor, "game", snapshot_at=snap_time,
                     home_line=spread + mv, away_line=-(spread + mv),
                     home_odds=random.randint(-200, 200),
                     away_odds=random.randint(-200, 200),
                     total=total + mv, over_odds=-110, under_odds=-110,
-                    snapshot_at=snap_time
-                ))
+                )
 
         game_players = [p for p in SAMPLE_PLAYERS if p[4] in (home, away)]
         for pl in game_players:
@@ -146,18 +162,15 @@ def _seed_demo_data(db):
                 base_line = {"PTS": 25.5, "REB": 8.5, "AST": 7.5}[prop_type]
                 for vendor in VENDORS[:3]:
                     line = base_line + round(random.uniform(-3, 3), 1)
-                    db.add(FactPropSnapshot(
-                        game_id=game_id, player_id=pl[0],
-                        player_name=f"{pl[1]} {pl[2]}",
-                        team_id=pl[4], prop_type=prop_type,
+                    record_prop_snapshot(
+                        db, game_id, pl[0], f"{pl[1]} {pl[2]}", pl[4], prop_type, vendor,
                         line=line,
                         over_odds=random.randint(-130, -100),
                         under_odds=random.randint(-130, -100),
-                        vendor=vendor, snapshot_at=datetime.utcnow()
-                    ))
+                    )
 
             if is_final:
-                db.add(FactBoxScore(
+                box_scores.append(FactBoxScore(
                     game_id=game_id, player_id=pl[0], team_id=pl[4],
                     min=f"{random.randint(25, 38)}:00",
                     pts=random.randint(15, 40), reb=random.randint(3, 15),
@@ -172,4 +185,7 @@ def _seed_demo_data(db):
                     ft_pct=round(random.uniform(0.70, 0.95), 3),
                 ))
 
+    db.add_all(box_scores)
+    db.flush()
+    record_box_scores(db, box_scores)
     db.commit()
@@ -0,0 +1,458 @@
+import argparse
+import json
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+import numpy as np
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from backend.db.models import (
+    Base, DimTeam, DimPlayer, DimGame, FactBoxScore, FactOddsSnapshot, FactPropSnapshot,
+    ScoreHistory, User, UserPick
+)
+from backend.db.game_state import STATE_SCHEDULED, STATE_LIVE, STATE_FINAL
+from backend.db.seed import NBA_TEAMS, VENDORS
+from backend.db.ledger import rebuild_ledger
+from backend.db.player_summary import rebuild_player_summaries
+from backend.ingest.odds import rebuild_latest_odds
+from backend.ingest.line_rollups import rebuild_line_rollups
+from backend.jobs.grading import grade_pending_picks
+
+logger = logging.getLogger(__name__)
+
+GAME_ID_BASE = 5_000_000
+PLAYER_ID_BASE = 5_000_000
+GAMES_PER_SEASON = 1230
+SEASON_DAYS = 170
+DEFAULT_SEASON_PROGRESS = 0.6
+ROSTER_SIZE = 15
+ACTIVE_PLAYERS = 13
+GAME_MINUTES = 48
+GAME_WALL_MINUTES = 150
+INSERT_CHUNK = 5000
+
+DEFAULT_USERS = 2000
+DEFAULT_PICKS_PER_USER = 25
+ODDS_SNAPSHOTS = 4
+ODDS_SNAPSHOT_HOURS = 3
+PROP_VENDORS = 3
+PROP_SNAPSHOTS = 3
+PROP_PLAYERS_PER_TEAM = 4
+PROP_HISTORY_DAYS = 21
+PROP_TYPES = ["PTS", "REB", "AST"]
+SYNTHETIC_PASSWORD = "synthetic-password"
+SYNTHETIC_PASSWORD_HASH = "$2b$04$syntheticNBAseasonDatuGuQ3KFb0WXlAzL4MSGQov9DQPxu0jWa"
+
+TIPOFF_SLOTS = [(23, 0), (23, 30), (0, 0), (0, 30), (2, 0), (2, 30)]
+SLOT_POSITIONS = ["G", "G", "F", "F", "C", "G", "F", "F-C", "G", "F", "C", "G", "F", "G", "C"]
+SLOT_MINUTES = [34, 33, 32, 31, 30, 22, 18, 14, 10, 3, 2, 1, 0, 0, 0]
+SLOT_PTS_RATE = [0.72, 0.55, 0.5, 0.46, 0.44, 0.42, 0.4, 0.36, 0.34, 0.3, 0.3, 0.28, 0.28, 0.28, 0.28]
+POSITION_RATES = {
+    "G": {"reb": 0.13, "ast": 0.2, "stl": 0.035, "blk": 0.01, "turnover": 0.06, "pf": 0.07, "three_share": 0.45},
+    "F": {"reb": 0.2, "ast": 0.1, "stl": 0.03, "blk": 0.02, "turnover": 0.05, "pf": 0.08, "three_share": 0.35},
+    "F-C": {"reb": 0.25, "ast": 0.08, "stl": 0.025, "blk": 0.035, "turnover": 0.05, "pf": 0.09, "three_share": 0.2},
+    "C": {"reb": 0.3, "ast": 0.07, "stl": 0.02, "blk": 0.05, "turnover": 0.05, "pf": 0.1, "three_share": 0.1},
+}
+FIRST_NAMES = [
+    "Marcus", "Jalen", "Tyrese", "Darius", "Andre", "Malik", "Devin", "Isaiah", "Cameron", "Jordan",
+    "Trey", "Kevin", "Miles", "Aaron", "Caleb", "Elijah", "Xavier", "Dante", "Julian", "Terrence",
+]
+LAST_NAMES = [
+    "Walker", "Brooks", "Carter", "Hayes", "Mitchell", "Reed", "Coleman", "Bennett", "Foster", "Graham",
+    "Sanders", "Porter", "Wallace", "Griffin", "Hughes", "Barnes", "Fleming", "Holloway", "Pryor", "Vaughn",
+]
+
+
+def _season_for(day):
+    return day.year if day.month >= 9 else day.year - 1
+
+
+def _schedule_pairs(rng, team_ids, games):
+    pairs = [(h, a) for h in team_ids for a in team_ids if h != a]
+    extra = []
+    while len(pairs) + len(extra) < games:
+        order = [int(t) for t in rng.permutation(team_ids)]
+        rounds = [(order[i], order[i + 1]) for i in range(0, len(order) - 1, 2)]
+        extra.extend(rounds)
+        extra.extend((a, h) for h, a in rounds)
+    pairs = pairs + extra
+    rng.shuffle(pairs)
+    return pairs[:games]
+
+
+def _schedule_days(pairs, days):
+    per_day = max(1, math.ceil(len(pairs) / days))
+    scheduled, pending = [], list(pairs)
+    day = 0
+    while pending:
+        busy, remaining, count = set(), [], 0
+        for home, away in pending:
+            if count < per_day and home not in busy and away not in busy:
+                busy.update((home, away))
+                scheduled.append((day, home, away))
+                count += 1
+            else:
+                remaining.append((home, away))
+        pending = remaining
+        day += 1
+    return scheduled
+
+
+def _american(prob):
+    prob = min(max(prob, 0.02), 0.98)
+    if prob >= 0.5:
+        return float(round(-100 * prob / (1 - prob)))
+    return float(round(100 * (1 - prob) / prob))
+
+
+def _half_point(value):
+    return math.floor(value) + 0.5
+
+
+def _build_rosters(rng, team_ids):
+    players = []
+    for team_index, team_id in enumerate(team_ids):
+        for slot in range(ROSTER_SIZE):
+            position = SLOT_POSITIONS[slot]
+            rates = POSITION_RATES[position]
+            skill = float(rng.lognormal(0, 0.15))
+            players.append({
+                "id": PLAYER_ID_BASE + team_index * 100 + slot,
+                "first_name": FIRST_NAMES[int(rng.integers(len(FIRST_NAMES)))],
+                "last_name": f"{LAST_NAMES[int(rng.integers(len(LAST_NAMES)))]}-{team_index + 1:02d}{slot:02d}",
+                "position": position,
+                "team_id": team_id,
+                "jersey_number": str(int(rng.integers(0, 100))),
+                "minutes": SLOT_MINUTES[slot],
+                "pts_rate": SLOT_PTS_RATE[slot] * skill,
+                **{k: v * skill for k, v in rates.items() if k != "three_share"},
+                "three_share": rates["three_share"],
+            })
+    return players
+
+
+def _team_arrays(roster):
+    return {
+        "ids": np.array([p["id"] for p in roster]),
+        "minutes": np.array([p["minutes"] for p in roster], dtype=float),
+        "pts_rate": np.array([p["pts_rate"] for p in roster]),
+        "three_share": np.array([p["three_share"] for p in roster]),
+        **{k: np.array([p[k] for p in roster]) for k in ("reb", "ast", "stl", "blk", "turnover", "pf")},
+    }
+
+
+def _simulate_team(rng, team, factor):
+    minutes = np.clip(rng.normal(team["minutes"], 3), 0, 44)
+    minutes[team["minutes"] == 0] = 0
+    minutes = minutes * (240 / minutes.sum())
+    fga = rng.poisson(team["pts_rate"] * minutes * factor / 1.2)
+    fg3a = rng.binomial(fga, team["three_share"])
+    fg3m = rng.binomial(fg3a, 0.36)
+    fg2m = rng.binomial(fga - fg3a, 0.53)
+    fta = rng.poisson(0.25 * fga)
+    ftm = rng.binomial(fta, 0.78)
+    stats = {
+        "min": minutes, "fga": fga, "fgm": fg2m + fg3m, "fg3a": fg3a, "fg3m": fg3m,
+        "fta": fta, "ftm": ftm, "pts": 2 * fg2m + 3 * fg3m + ftm,
+    }
+    for k in ("reb", "ast", "stl", "blk", "turnover", "pf"):
+        stats[k] = rng.poisson(team[k] * minutes)
+    stats["pf"] = np.minimum(stats["pf"], 6)
+    return stats
+
+
+def _box_rows(game_id, team_id, team, stats):
+    rows = []
+    for i in range(ACTIVE_PLAYERS):
+        fga, fg3a, fta = int(stats["fga"][i]), int(stats["fg3a"][i]), int(stats["fta"][i])
+        seconds = int(round(stats["min"][i] * 60))
+        rows.append({
+            "game_id": game_id, "player_id": int(team["ids"][i]), "team_id": team_id,
+            "min": f"{seconds // 60}:{seconds % 60:02d}",
+            **{k: int(stats[k][i]) for k in ("pts", "reb", "ast", "stl", "blk", "turnover", "fgm", "fga",
+                                              "fg3m", "fg3a", "ftm", "fta", "pf")},
+            "fg_pct": round(int(stats["fgm"][i]) / fga, 3) if fga else 0.0,
+            "fg3_pct": round(int(stats["fg3m"][i]) / fg3a, 3) if fg3a else 0.0,
+            "ft_pct": round(int(stats["ftm"][i]) / fta, 3) if fta else 0.0,
+        })
+    return rows
+
+
+def _score_curve(rng, final):
+    weights = rng.dirichlet(np.full(GAME_MINUTES, 6.0))
+    return np.cumsum(rng.multinomial(final, weights))
+
+
+def _period_label(minute):
+    period = min(4, (minute - 1) // 12 + 1)
+    ordinal = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}[period]
+    remaining = 12 * period - minute
+    return period, f"{ordinal} Qtr", f"Q{period} {remaining}:00"
+
+
+def _odds_rows(rng, game_id, tipoff, spread, total, as_of, vendors):
+    rows = []
+    open_spread = spread + rng.normal(0, 1.0)
+    open_total = total + rng.normal(0, 2.0)
+    for vendor in vendors:
+        offset = rng.normal(0, 0.4)
+        for k in range(ODDS_SNAPSHOTS):
+            snapshot_at = tipoff - timedelta(hours=(ODDS_SNAPSHOTS - 1 - k) * ODDS_SNAPSHOT_HOURS)
+            if snapshot_at > as_of:
+                break
+            w = k / max(1, ODDS_SNAPSHOTS - 1)
+            line = round(2 * ((1 - w) * open_spread + w * spread + offset)) / 2
+            line_total = round(2 * ((1 - w) * open_total + w * total + offset)) / 2
+            home_prob = 1 / (1 + math.exp(line / 6.5))
+            vig = 1.025 + rng.uniform(-0.005, 0.005)
+            rows.append({
+                "game_id": game_id, "vendor": vendor, "market_type": "game", "snapshot_at": snapshot_at,
+                "home_line": line, "away_line": -line,
+                "home_odds": _american(home_prob * vig), "away_odds": _american((1 - home_prob) * vig),
+                "total": line_total,
+                "over_odds": float(-110 + int(rng.integers(-5, 6))),
+                "under_odds": float(-110 + int(rng.integers(-5, 6))),
+            })
+    return rows
+
+
+def _prop_rows(rng, game_id, tipoff, players, factor, as_of):
+    rows = []
+    for p in players:
+        expected = {
+            "PTS": p["pts_rate"] * p["minutes"] * factor,
+            "REB": p["reb"] * p["minutes"],
+            "AST": p["ast"] * p["minutes"],
+        }
+        for prop_type in PROP_TYPES:
+            base = expected[prop_type]
+            for vendor in VENDORS[:PROP_VENDORS]:
+                offset = float(rng.choice([-1.0, -0.5, 0.0, 0.0, 0.5]))
+                for k in range(PROP_SNAPSHOTS):
+                    snapshot_at = tipoff - timedelta(hours=(PROP_SNAPSHOTS - 1 - k) * ODDS_SNAPSHOT_HOURS)
+                    if snapshot_at > as_of:
+                        break
+                    rows.append({
+                        "game_id": game_id, "player_id": p["id"],
+                        "player_name": f"{p['first_name']} {p['last_name']}", "team_id": p["team_id"],
+                        "prop_type": prop_type, "vendor": vendor, "snapshot_at": snapshot_at,
+                        "line": max(0.5, _half_point(base + offset + rng.normal(0, 0.3))),
+                        "over_odds": float(-110 + int(rng.integers(-15, 16))),
+                        "under_odds": float(-110 + int(rng.integers(-15, 16))),
+                    })
+    return rows
+
+
+def _insert(db, model, rows):
+    for i in range(0, len(rows), INSERT_CHUNK):
+        db.execute(insert(model), rows[i:i + INSERT_CHUNK])
+
+
+def generate_season(rng, season_index, start_day, as_of, rosters, ratings, team_ids, vendors,
+                    games_per_season=GAMES_PER_SEASON):
+    pairs = _schedule_pairs(rng, team_ids, games_per_season)
+    days = max(1, round(SEASON_DAYS * len(pairs) / GAMES_PER_SEASON))
+    out = {"games": [], "box_scores": [], "score_history": [], "odds": [], "props": [], "pickable": []}
+    team_arrays = {team_id: _team_arrays(roster) for team_id, roster in rosters.items()}
+    prop_cutoff = as_of - timedelta(days=PROP_HISTORY_DAYS)
+
+    for n, (day, home, away) in enumerate(_schedule_days(pairs, days)):
+        game_id = GAME_ID_BASE + season_index * 10000 + n
+        date = start_day + timedelta(days=day)
+        hour, minute = TIPOFF_SLOTS[int(rng.integers(len(TIPOFF_SLOTS)))]
+        tipoff = datetime(date.year, date.month, date.day) + timedelta(days=1 if hour < 12 else 0,
+                                                                      hours=hour, minutes=minute)
+        home_factor = 1 + (ratings[home] + 1.5) / 110
+        away_factor = 1 + (ratings[away] - 1.5) / 110
+        spread = round(2 * (-(ratings[home] - ratings[away] + 2.5) + rng.normal(0, 1.0))) / 2
+        total = round(2 * (224 + rng.normal(0, 4))) / 2
+
+        game = {
+            "id": game_id, "date": date.strftime("%Y-%m-%d"), "season": _season_for(start_day),
+            "status": "Scheduled", "state": STATE_SCHEDULED, "period": 0,
+            "time": (tipoff - timedelta(hours=5)).strftime("%I:%M %p ET").lstrip("0"),
+            "home_team_id": home, "visitor_team_id": away,
+            "home_team_score": 0, "visitor_team_score": 0, "postseason": False,
+        }
+        elapsed = (as_of - tipoff).total_seconds() / 60
+        if elapsed >= 0:
+            home_stats = _simulate_team(rng, team_arrays[home], home_factor)
+            away_stats = _simulate_team(rng, team_arrays[away], away_factor)
+            if home_stats["pts"].sum() == away_stats["pts"].sum():
+                for k in ("pts", "ftm", "fta"):
+                    home_stats[k][0] += 1
+            home_final, away_final = int(home_stats["pts"].sum()), int(away_stats["pts"].sum())
+            home_curve, away_curve = _score_curve(rng, home_final), _score_curve(rng, away_final)
+            minutes_played = min(GAME_MINUTES, int(elapsed * GAME_MINUTES / GAME_WALL_MINUTES))
+            final = elapsed >= GAME_WALL_MINUTES
+            for m in range(1, (GAME_MINUTES if final else minutes_played) + 1):
+                out["score_history"].append({
+                    "game_id": game_id, "home_score": int(home_curve[m - 1]),
+                    "visitor_score": int(away_curve[m - 1]), "period": min(4, (m - 1) // 12 + 1),
+                    "recorded_at": tipoff + timedelta(minutes=m * GAME_WALL_MINUTES / GAME_MINUTES),
+                })
+            if final:
+                game.update(status="Final", state=STATE_FINAL, period=4, time="Final",
+                            home_team_score=home_final, visitor_team_score=away_final)
+                out["box_scores"].extend(_box_rows(game_id, home, team_arrays[home], home_stats))
+                out["box_scores"].extend(_box_rows(game_id, away, team_arrays[away], away_stats))
+            elif minutes_played > 0:
+                period, status, clock = _period_label(minutes_played)
+                game.update(status=status, state=STATE_LIVE, period=period, time=clock,
+                            home_team_score=int(home_curve[minutes_played - 1]),
+                            visitor_team_score=int(away_curve[minutes_played - 1]))
+            else:
+                game.update(status="In Progress", state=STATE_LIVE, period=1, time="Q1 12:00")
+        out["games"].append(game)
+
+        odds = _odds_rows(rng, game_id, tipoff, spread, total, as_of, vendors)
+        out["odds"].extend(odds)
+        props = []
+        if prop_cutoff <= tipoff:
+            prop_players = rosters[home][:PROP_PLAYERS_PER_TEAM] + rosters[away][:PROP_PLAYERS_PER_TEAM]
+            props = _prop_rows(rng, game_id, tipoff, prop_players, 1.0, as_of)
+            out["props"].extend(props)
+        if odds:
+            out["pickable"].append({"game": game, "tipoff": tipoff, "closing": odds[-1], "props": props})
+    return out
+
+
+def _user_rows(count, created_at):
+    return [{
+        "username": f"synthetic_user_{i:06d}", "email": f"synthetic_user_{i:06d}@example.com",
+        "password_hash": SYNTHETIC_PASSWORD_HASH, "created_at": created_at,
+    } for i in range(count)]
+
+
+def _pick_rows(rng, user_ids, picks_per_user, pickable, team_names, as_of):
+    rows = []
+    for user_id in user_ids:
+        for _ in range(int(rng.poisson(picks_per_user))):
+            entry = pickable[int(rng.integers(len(pickable)))]
+            game, tipoff = entry["game"], entry["tipoff"]
+            created_at = min(as_of, tipoff - timedelta(minutes=int(rng.integers(10, 24 * 60))))
+            stake = float(rng.choice([5, 10, 10, 20, 25, 50, 100]))
+            if entry["props"] and rng.random() < 0.4:
+                prop = entry["props"][int(rng.integers(len(entry["props"])))]
+                side = "over" if rng.random() < 0.55 else "under"
+                rows.append({
+                    "game_id": game["id"], "user_id": user_id, "pick_type": "player_prop",
+                    "selection": f"{prop['player_name']} {side} {prop['line']} {prop['prop_type']}",
+                    "odds": prop[f"{side}_odds"], "stake": stake, "notes": "", "result": "pending",
+                    "payout": 0.0, "created_at": created_at, "player_id": prop["player_id"],
+                    "player_name": prop["player_name"], "stat_type": prop["prop_type"],
+                    "line": prop["line"], "pick_side": side,
+                })
+                continue
+            closing = entry["closing"]
+            home_side = rng.random() < 0.5
+            team_id = game["home_team_id"] if home_side else game["visitor_team_id"]
+            rows.append({
+                "game_id": game["id"], "user_id": user_id, "pick_type": "moneyline",
+                "selection": team_names[team_id],
+                "odds": closing["home_odds"] if home_side else closing["away_odds"],
+                "stake": stake, "notes": "", "result": "pending", "payout": 0.0, "created_at": created_at,
+            })
+    return rows
+
+
+def generate_synthetic_data(db, seasons=1, scale=1.0, seed=42, as_of=None, users=None,
+                            picks_per_user=DEFAULT_PICKS_PER_USER, vendors=len(VENDORS),
+                            games_per_season=GAMES_PER_SEASON, season_progress=DEFAULT_SEASON_PROGRESS):
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    as_of = as_of or datetime.utcnow().replace(microsecond=0)
+    team_ids = [t[0] for t in NBA_TEAMS]
+    team_names = {t[0]: t[5] for t in NBA_TEAMS}
+    counts = {}
+
+    existing_teams = {tid for (tid,) in db.query(DimTeam.id)}
+    _insert(db, DimTeam, [{
+        "id": t[0], "abbreviation": t[1], "city": t[2], "conference": t[3], "division": t[4],
+        "full_name": t[5], "name": t[6], "primary_color": t[7], "secondary_color": t[8],
+    } for t in NBA_TEAMS if t[0] not in existing_teams])
+
+    players = _build_rosters(rng, team_ids)
+    rosters = {team_id: [p for p in players if p["team_id"] == team_id] for team_id in team_ids}
+    _insert(db, DimPlayer, [{k: p[k] for k in ("id", "first_name", "last_name", "position",
+                                               "team_id", "jersey_number")} for p in players])
+    counts["players"] = len(players)
+
+    ratings = {team_id: float(rng.normal(0, 4)) for team_id in team_ids}
+    days_in = int(SEASON_DAYS * season_progress)
+    current_start = datetime(as_of.year, as_of.month, as_of.day) - timedelta(days=days_in)
+    pickable = []
+    for k in ("games", "box_scores", "score_history", "odds", "props"):
+        counts[k] = 0
+    for season_index in range(seasons):
+        start_day = current_start - timedelta(days=365 * (seasons - 1 - season_index))
+        season = generate_season(rng, season_index, start_day, as_of, rosters, ratings, team_ids,
+                                 VENDORS[:vendors], games_per_season)
+        _insert(db, DimGame, season["games"])
+        _insert(db, FactBoxScore, season["box_scores"])
+        _insert(db, ScoreHistory, season["score_history"])
+        _insert(db, FactOddsSnapshot, season["odds"])
+        _insert(db, FactPropSnapshot, season["props"])
+        for k in ("games", "box_scores", "score_history", "odds", "props"):
+            counts[k] += len(season[k])
+        pickable = season["pickable"]
+        for team_id in team_ids:
+            ratings[team_id] = 0.6 * ratings[team_id] + float(rng.normal(0, 2.5))
+        db.commit()
+        logger.info(f"Synthetic season {season_index + 1}/{seasons}: {len(season['games'])} games")
+
+    user_count = users if users is not None else int(DEFAULT_USERS * scale)
+    _insert(db, User, _user_rows(user_count, current_start))
+    user_ids = [uid for (uid,) in db.query(User.id).filter(User.username.like("synthetic_user_%"))]
+    picks = _pick_rows(rng, user_ids, picks_per_user * scale if users is None else picks_per_user,
+                       pickable, team_names, as_of) if pickable else []
+    _insert(db, UserPick, picks)
+    db.commit()
+    counts["users"] = user_count
+    counts["picks"] = len(picks)
+
+    counts["odds_latest"] = rebuild_latest_odds(db)
+    counts["line_rollups"] = rebuild_line_rollups(db)
+    rebuild_player_summaries(db)
+    counts["graded_picks"] = grade_pending_picks(db)
+    rebuild_ledger(db)
+    counts["seconds"] = round(time.perf_counter() - started, 2)
+    logger.info(f"Synthetic data generated: {counts}")
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic NBA season for load testing")
+    parser.add_argument("--database-url", default="sqlite:///nba_synthetic.db")
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--as-of", help="UTC timestamp the season is positioned at, e.g. 2026-01-15T01:30:00")
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--picks-per-user", type=float, default=DEFAULT_PICKS_PER_USER)
+    parser.add_argument("--vendors", type=int, default=len(VENDORS))
+    parser.add_argument("--games-per-season", type=int, default=GAMES_PER_SEASON)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    engine = create_engine(args.database_url)
+    if args.reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        counts = generate_synthetic_data(
+            db, seasons=args.seasons, scale=args.scale, seed=args.seed,
+            as_of=datetime.fromisoformat(args.as_of) if args.as_of else None,
+            users=args.users, picks_per_user=args.picks_per_user, vendors=args.vendors,
+            games_per_season=args.games_per_season,
+        )
+    finally:
+        db.close()
+    print(json.dumps(counts, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import numpy as np
+from sqlalchemy import select, func, desc
+from backend.db.models import FactPropSnapshot
+
+
+def load_latest_props(db, game_ids=None, vendor=None):
+    ranked = select(
+        FactPropSnapshot.game_id, FactPropSnapshot.player_id, FactPropSnapshot.player_name,
+        FactPropSnapshot.team_id, FactPropSnapshot.prop_type, FactPropSnapshot.vendor,
+        FactPropSnapshot.line, FactPropSnapshot.over_odds, FactPropSnapshot.under_odds,
+        FactPropSnapshot.snapshot_at,
+        func.row_number().over(
+            partition_by=(FactPropSnapshot.game_id, FactPropSnapshot.player_id,
+                          FactPropSnapshot.prop_type, FactPropSnapshot.vendor),
+            order_by=(desc(FactPropSnapshot.snapshot_at), desc(FactPropSnapshot.id)),
+        ).label("rn"),
+    )
+    if game_ids is not None:
+        ranked = ranked.where(FactPropSnapshot.game_id.in_(list(game_ids)))
+    if vendor:
+        ranked = ranked.where(FactPropSnapshot.vendor == vendor)
+    ranked = ranked.subquery()
+
+    stmt = select(ranked).where(ranked.c.rn == 1, ranked.c.line.isnot(None)).order_by(
+        ranked.c.game_id, ranked.c.player_id, ranked.c.prop_type, ranked.c.line, ranked.c.vendor
+    )
+    return db.execute(stmt).all()
+
+
+def _best_odds(values, starts):
+    arr = np.array([v if v else -np.inf for v in values], dtype=float)
+    best = np.maximum.reduceat(arr, starts)
+    return np.where(np.isfinite(best), best, 0)
+
+
+def compute_consensus(rows):
+    if not rows:
+        return []
+
+    keys = [(r.game_id, r.player_id, r.prop_type) for r in rows]
+    starts = np.array([0] + [i for i in range(1, len(keys)) if keys[i] != keys[i - 1]])
+    counts = np.diff(np.append(starts, len(rows)))
+
+    lines = np.array([r.line for r in rows], dtype=float)
+    medians = (lines[starts + (counts - 1) // 2] + lines[starts + counts // 2]) / 2
+    means = np.add.reduceat(lines, starts) / counts
+    sq_dev = np.add.reduceat(lines ** 2, starts) - counts * means ** 2
+    stdevs = np.sqrt(np.clip(sq_dev, 0, None) / np.maximum(counts - 1, 1))
+    stdevs = np.where(counts > 1, stdevs, 0)
+    best_over = _best_odds([r.over_odds for r in rows], starts)
+    best_under = _best_odds([r.under_odds for r in rows], starts)
+
+    result = []
+    for g, (start, n) in enumerate(zip(starts.tolist(), counts.tolist())):
+        first = rows[start]
+        result.append({
+            "player_id": first.player_id, "player_name": first.player_name,
+            "team_id": first.team_id, "prop_type": first.prop_type,
+            "game_id": first.game_id,
+            "vendors": [{
+                "vendor": r.vendor, "line": r.line,
+                "over_odds": r.over_odds, "under_odds": r.under_odds,
+                "snapshot_at": r.snapshot_at.isoformat() if r.snapshot_at else None,
+            } for r in rows[start:start + n]],
+            "consensus_line": round(float(medians[g]), 1),
+            "best_over_odds": float(best_over[g]),
+            "best_under_odds": float(best_under[g]),
+            "disagreement": round(float(stdevs[g]), 2),
+        })
+    return result
@@ -1,49 +1,121 @@
 import logging
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import select, func, desc, and_, union_all
 from backend.db.models import (
     SessionLocal, FactBoxScore, DimGame, FeatureStore, DimPlayer
 )
+from backend.db.game_state import STATE_FINAL
 
 logger = logging.getLogger(__name__)
 
+TEAM_ROLLING_GAMES = 10
+PLAYER_ROLLING_GAMES = 10
+DEFAULT_TEAM_FG_PCT = 0.45
+COMPLETED_GAME = and_(DimGame.state == STATE_FINAL, DimGame.home_team_score > 0)
+PLAYER_ROLLING_COLUMNS = {
+    "avg_pts": FactBoxScore.pts, "avg_reb": FactBoxScore.reb, "avg_ast": FactBoxScore.ast,
+    "avg_stl": FactBoxScore.stl, "avg_blk": FactBoxScore.blk, "avg_fg3m": FactBoxScore.fg3m,
+    "avg_fg_pct": FactBoxScore.fg_pct,
+}
 
-def compute_team_rolling_stats(team_id, n_games=10):
-    db = SessionLocal()
-    try:
-        recent_games = db.query(DimGame).filter(
-            ((DimGame.home_team_id == team_id) | (DimGame.visitor_team_id == team_id)),
-            DimGame.status.in_(["Final", "final"])
-        ).order_by(DimGame.date.desc()).limit(n_games).all()
 
-        if not recent_games:
-            return {}
+def team_fg_pct_by_game(db, game_ids=None):
+    query = db.query(FactBoxScore.game_id, FactBoxScore.team_id, func.avg(FactBoxScore.fg_pct))
+    if game_ids is not None:
+        query = query.filter(FactBoxScore.game_id.in_(list(game_ids)))
+    return {
+        (game_id, team_id): float(fg)
+        for game_id, team_id, fg in query.group_by(FactBoxScore.game_id, FactBoxScore.team_id)
+        if fg is not None
+    }
 
-        wins = 0
-        total_scored = 0
-        total_allowed = 0
-        for g in recent_games:
-            if g.home_team_id == team_id:
-                total_scored += g.home_team_score or 0
-                total_allowed += g.visitor_team_score or 0
-                if (g.home_team_score or 0) > (g.visitor_team_score or 0):
-                    wins += 1
-            else:
-                total_scored += g.visitor_team_score or 0
-                total_allowed += g.home_team_score or 0
-                if (g.visitor_team_score or 0) > (g.home_team_score or 0):
-                    wins += 1
 
-        n = len(recent_games)
-        features = {
-            "win_pct": wins / n if n else 0,
-            "avg_scored": total_scored / n if n else 0,
-            "avg_allowed": total_allowed / n if n else 0,
-            "net_rating": (total_scored - total_allowed) / n if n else 0,
-        }
+def team_result(scored, allowed, fg_pct):
+    scored, allowed = scored or 0, allowed or 0
+    return (scored, allowed, scored > allowed, fg_pct)
+
+
+def team_features(history):
+    n = len(history)
+    scored = sum(h[0] for h in history)
+    allowed = sum(h[1] for h in history)
+    fg = [h[3] for h in history if h[3] is not None]
+    return {
+        "win_pct": sum(h[2] for h in history) / n,
+        "avg_scored": scored / n,
+        "avg_allowed": allowed / n,
+        "net_rating": (scored - allowed) / n,
+        "avg_fg_pct": sum(fg) / len(fg) if fg else DEFAULT_TEAM_FG_PCT,
+    }
+
+
+def load_team_histories(db, team_ids, n_games=TEAM_ROLLING_GAMES):
+    team_ids = list(team_ids)
+    if not team_ids:
+        return {}
+    sides = union_all(
+        select(DimGame.id.label("game_id"), DimGame.date.label("date"), DimGame.home_team_id.label("team_id"),
+               DimGame.home_team_score.label("scored"), DimGame.visitor_team_score.label("allowed"))
+        .where(COMPLETED_GAME, DimGame.home_team_id.in_(team_ids)),
+        select(DimGame.id, DimGame.date, DimGame.visitor_team_id,
+               DimGame.visitor_team_score, DimGame.home_team_score)
+        .where(COMPLETED_GAME, DimGame.visitor_team_id.in_(team_ids)),
+    ).subquery()
+    ranked = select(
+        sides,
+        func.row_number().over(
+            partition_by=sides.c.team_id, order_by=(desc(sides.c.date), desc(sides.c.game_id))
+        ).label("rn"),
+    ).subquery()
+    rows = db.execute(
+        select(ranked).where(ranked.c.rn <= n_games).order_by(ranked.c.team_id, desc(ranked.c.rn))
+    ).all()
+
+    team_fg = team_fg_pct_by_game(db, {r.game_id for r in rows})
+    histories = {}
+    for r in rows:
+        histories.setdefault(r.team_id, []).append(
+            team_result(r.scored, r.allowed, team_fg.get((r.game_id, r.team_id)))
+        )
+    return histories
+
+
+def load_team_rolling_stats(db, team_ids, n_games=TEAM_ROLLING_GAMES):
+    return {team_id: team_features(history) for team_id, history in load_team_histories(db, team_ids, n_games).items()}
+
+
+def load_rolling_stats(db, player_ids, n_games=PLAYER_ROLLING_GAMES):
+    if not player_ids:
+        return {}
+    ranked = select(
+        FactBoxScore.player_id,
+        *[func.coalesce(col, 0).label(name) for name, col in PLAYER_ROLLING_COLUMNS.items()],
+        func.row_number().over(partition_by=FactBoxScore.player_id, order_by=desc(FactBoxScore.id)).label("rn"),
+    ).where(FactBoxScore.player_id.in_(list(player_ids))).subquery()
+
+    stmt = select(
+        ranked.c.player_id,
+        *[func.avg(ranked.c[name]) for name in PLAYER_ROLLING_COLUMNS],
+    ).where(ranked.c.rn <= n_games).group_by(ranked.c.player_id)
+
+    return {
+        row[0]: {name: float(v or 0) for name, v in zip(PLAYER_ROLLING_COLUMNS, row[1:])}
+        for row in db.execute(stmt)
+    }
+
+
+def compute_team_rolling_stats(team_id, n_games=TEAM_ROLLING_GAMES):
+    db = SessionLocal()
+    try:
+        history = load_team_histories(db, [team_id], n_games).get(team_id)
+        if not history:
+            return {}
+        features = team_features(history)
 
+        recent_game_ids = [gid for (gid,) in db.query(DimGame.id).filter(
+            ((DimGame.home_team_id == team_id) | (DimGame.visitor_team_id == team_id)), COMPLETED_GAME
+        ).order_by(DimGame.date.desc(), DimGame.id.desc()).limit(n_games)]
         box_stats = db.query(
-            func.avg(FactBoxScore.fg_pct),
             func.avg(FactBoxScore.fg3_pct),
             func.avg(FactBoxScore.ft_pct),
             func.avg(FactBoxScore.reb),
@@ -51,18 +123,16 @@ def compute_team_rolling_stats(team_id, n_games=10):
             func.avg(FactBoxScore.turnover),
         ).filter(
             FactBoxScore.team_id == team_id,
-            FactBoxScore.game_id.in_([g.id for g in recent_games])
+            FactBoxScore.game_id.in_(recent_game_ids)
         ).first()
 
         if box_stats and box_stats[0] is not None:
-            features["avg_fg_pct"] = float(box_stats[0] or 0)
-            features["avg_fg3_pct"] = float(box_stats[1] or 0)
-            features["avg_ft_pct"] = float(box_stats[2] or 0)
-            features["avg_reb"] = float(box_stats[3] or 0)
-            features["avg_ast"] = float(box_stats[4] or 0)
-            features["avg_tov"] = float(box_stats[5] or 0)
+            features["avg_fg3_pct"] = float(box_stats[0] or 0)
+            features["avg_ft_pct"] = float(box_stats[1] or 0)
+            features["avg_reb"] = float(box_stats[2] or 0)
+            features["avg_ast"] = float(box_stats[3] or 0)
+            features["avg_tov"] = float(box_stats[4] or 0)
         else:
-            features["avg_fg_pct"] = 0.45
             features["avg_fg3_pct"] = 0.35
             features["avg_ft_pct"] = 0.76
             features["avg_reb"] = 44.0
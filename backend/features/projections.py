@@ -0,0 +1,125 @@
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import desc, insert
+from backend.db.models import DimGame, DimPlayer, FactPlayerProjection, PlayerSummary
+from backend.db.game_state import get_live_game_ids
+from backend.features.engineering import load_rolling_stats
+from backend.models.ml_models import predict_player_props, PLAYER_PROP_TYPES
+
+logger = logging.getLogger(__name__)
+
+PLAYERS_PER_TEAM = 15
+FG_PCT = "FG_PCT"
+
+POSITION_BASELINES = {
+    "G": {"PTS": 14.5, "REB": 3.2, "AST": 4.8, "STL": 1.1, "BLK": 0.3, "FG_PCT": 0.44},
+    "F": {"PTS": 13.0, "REB": 5.8, "AST": 2.4, "STL": 0.9, "BLK": 0.7, "FG_PCT": 0.46},
+    "C": {"PTS": 11.5, "REB": 8.2, "AST": 1.8, "STL": 0.6, "BLK": 1.4, "FG_PCT": 0.55},
+    "G-F": {"PTS": 13.5, "REB": 4.5, "AST": 3.5, "STL": 1.0, "BLK": 0.5, "FG_PCT": 0.45},
+    "F-G": {"PTS": 13.5, "REB": 4.5, "AST": 3.5, "STL": 1.0, "BLK": 0.5, "FG_PCT": 0.45},
+    "F-C": {"PTS": 12.0, "REB": 7.0, "AST": 2.0, "STL": 0.7, "BLK": 1.0, "FG_PCT": 0.50},
+    "C-F": {"PTS": 12.0, "REB": 7.0, "AST": 2.0, "STL": 0.7, "BLK": 1.0, "FG_PCT": 0.50},
+}
+
+PROP_FEATURES = {"PTS": "avg_pts", "REB": "avg_reb", "AST": "avg_ast", "STL": "avg_stl",
+                 "BLK": "avg_blk", FG_PCT: "avg_fg_pct"}
+
+
+def projection_game_ids(db):
+    utc_now = datetime.utcnow()
+    dates = [utc_now.strftime("%Y-%m-%d"), (utc_now - timedelta(days=1)).strftime("%Y-%m-%d")]
+    ids = [gid for (gid,) in db.query(DimGame.id).filter(
+        DimGame.date.in_(dates) | DimGame.id.in_(get_live_game_ids())
+    )]
+    if not ids:
+        ids = [gid for (gid,) in db.query(DimGame.id).order_by(desc(DimGame.date)).limit(6)]
+    return ids
+
+
+def build_player_projections(db, game_ids=None):
+    if game_ids is None:
+        game_ids = projection_game_ids(db)
+    games = db.query(DimGame).filter(DimGame.id.in_(list(game_ids))).all()
+    if not games:
+        return 0
+
+    team_ids = {t for g in games for t in (g.home_team_id, g.visitor_team_id)}
+    players = db.query(DimPlayer).filter(DimPlayer.team_id.in_(team_ids)).all()
+    player_ids = [p.id for p in players]
+    rolling = load_rolling_stats(db, player_ids)
+    games_tracked = dict(db.query(PlayerSummary.player_id, PlayerSummary.games_tracked).filter(
+        PlayerSummary.player_id.in_(player_ids)
+    ))
+    predictions = predict_player_props(list(rolling), PLAYER_PROP_TYPES, features=rolling)
+
+    players_by_team = {}
+    for p in players:
+        players_by_team.setdefault(p.team_id, []).append(p)
+
+    now = datetime.utcnow()
+    rows = []
+    for g in games:
+        for team_id in (g.home_team_id, g.visitor_team_id):
+            for p in players_by_team.get(team_id, []):
+                stats = rolling.get(p.id)
+                baseline = POSITION_BASELINES.get((p.position or "G").strip(), POSITION_BASELINES["G"])
+                for prop_type in PLAYER_PROP_TYPES + [FG_PCT]:
+                    average = stats[PROP_FEATURES[prop_type]] if stats else baseline[prop_type]
+                    projection = predictions.get((p.id, prop_type))
+                    if projection is not None:
+                        source = "model"
+                    elif stats:
+                        projection, source = average, "rolling"
+                    else:
+                        projection, source = baseline[prop_type], "baseline"
+                    digits = 3 if prop_type == FG_PCT else 1
+                    rows.append({
+                        "game_id": g.id, "player_id": p.id, "team_id": team_id,
+                        "prop_type": prop_type, "projection": round(projection, digits),
+                        "average": round(average, digits), "source": source,
+                        "games_tracked": games_tracked.get(p.id, 0), "built_at": now,
+                    })
+
+    db.query(FactPlayerProjection).filter(
+        FactPlayerProjection.game_id.in_([g.id for g in games])
+    ).delete(synchronize_session=False)
+    if rows:
+        db.execute(insert(FactPlayerProjection), rows)
+    db.commit()
+    logger.info(f"Built {len(rows)} player projections for {len(games)} games")
+    return len(rows)
+
+
+def load_game_projections(db, game_ids):
+    rows = db.query(
+        FactPlayerProjection.game_id, FactPlayerProjection.team_id, FactPlayerProjection.player_id,
+        FactPlayerProjection.prop_type, FactPlayerProjection.projection, FactPlayerProjection.average,
+        FactPlayerProjection.games_tracked,
+        DimPlayer.first_name, DimPlayer.last_name, DimPlayer.position,
+    ).join(DimPlayer, DimPlayer.id == FactPlayerProjection.player_id).filter(
+        FactPlayerProjection.game_id.in_(list(game_ids))
+    ).all()
+
+    players = {}
+    for r in rows:
+        key = (r.game_id, r.team_id)
+        entry = players.setdefault(key, {}).get(r.player_id)
+        if entry is None:
+            entry = players[key][r.player_id] = {
+                "id": r.player_id,
+                "first_name": r.first_name,
+                "last_name": r.last_name,
+                "full_name": f"{r.first_name} {r.last_name}",
+                "position": r.position,
+                "averages": {},
+                "projections": {},
+                "games_tracked": r.games_tracked,
+            }
+        entry["averages"][r.prop_type.lower()] = r.average
+        if r.prop_type != FG_PCT:
+            entry["projections"][r.prop_type] = r.projection
+
+    return {
+        key: sorted(team.values(), key=lambda x: x["projections"].get("PTS", 0), reverse=True)[:PLAYERS_PER_TEAM]
+        for key, team in players.items()
+    }
@@ -0,0 +1,131 @@
+import json
+import hashlib
+import numpy as np
+
+FEATURE_SCHEMAS = {
+    "win_matchup": {
+        "version": 1,
+        "inputs": "pair",
+        "features": [
+            {"name": "win_pct_diff", "op": "diff", "source": "win_pct", "default": 0.5},
+            {"name": "net_rating_diff", "op": "diff", "source": "net_rating", "default": 0.0},
+            {"name": "avg_scored_diff", "op": "diff", "source": "avg_scored", "default": 100.0},
+            {"name": "avg_fg_pct_diff", "op": "diff", "source": "avg_fg_pct", "default": 0.45},
+            {"name": "home_court", "op": "const", "value": 0.03},
+        ],
+    },
+    "player_rolling": {
+        "version": 1,
+        "inputs": "single",
+        "features": [
+            {"name": "avg_pts", "op": "value", "source": "avg_pts", "default": 0.0},
+            {"name": "avg_reb", "op": "value", "source": "avg_reb", "default": 0.0},
+            {"name": "avg_ast", "op": "value", "source": "avg_ast", "default": 0.0},
+            {"name": "avg_stl", "op": "value", "source": "avg_stl", "default": 0.0},
+            {"name": "avg_blk", "op": "value", "source": "avg_blk", "default": 0.0},
+            {"name": "avg_fg_pct", "op": "value", "source": "avg_fg_pct", "default": 0.0},
+            {"name": "avg_fg3m", "op": "value", "source": "avg_fg3m", "default": 0.0},
+        ],
+    },
+}
+
+MODEL_SCHEMAS = {"win_probability": "win_matchup"}
+DEFAULT_MODEL_SCHEMA = "player_rolling"
+
+_compiled = {}
+
+
+def schema_for_model(model_name):
+    return MODEL_SCHEMAS.get(model_name, DEFAULT_MODEL_SCHEMA)
+
+
+def schema_fingerprint(name):
+    spec = FEATURE_SCHEMAS[name]
+    payload = json.dumps({"name": name, **spec}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def schema_info(name):
+    spec = FEATURE_SCHEMAS[name]
+    return {
+        "name": name,
+        "version": spec["version"],
+        "fingerprint": schema_fingerprint(name),
+        "features": [f["name"] for f in spec["features"]],
+    }
+
+
+def validate_schema(info, expected_name=None):
+    if not info or info.get("name") not in FEATURE_SCHEMAS:
+        raise ValueError(f"Unknown feature schema: {info.get('name') if info else None}")
+    if expected_name and info["name"] != expected_name:
+        raise ValueError(f"Expected feature schema {expected_name}, got {info['name']}")
+    current = schema_info(info["name"])
+    if info.get("version") != current["version"] or info.get("fingerprint") != current["fingerprint"]:
+        raise ValueError(
+            f"Feature schema {info['name']} mismatch: artifact v{info.get('version')} "
+            f"({info.get('fingerprint')}), registry v{current['version']} ({current['fingerprint']})"
+        )
+    if info.get("features") != current["features"]:
+        raise ValueError(f"Feature schema {info['name']} columns differ from the registry")
+
+
+def _compile(name):
+    compiled = _compiled.get(name)
+    if compiled is not None:
+        return compiled
+    spec = FEATURE_SCHEMAS[name]
+    sources, defaults = [], []
+    for f in spec["features"]:
+        if f["op"] != "const" and f["source"] not in sources:
+            sources.append(f["source"])
+            defaults.append(f["default"])
+
+    def _columns(op):
+        cols = [i for i, f in enumerate(spec["features"]) if f["op"] == op]
+        return np.array(cols, dtype=int), cols
+
+    diff_cols, diff = _columns("diff")
+    value_cols, value = _columns("value")
+    const_cols, const = _columns("const")
+    features = spec["features"]
+    compiled = _compiled[name] = {
+        "inputs": spec["inputs"],
+        "sources": sources,
+        "defaults": defaults,
+        "width": len(features),
+        "diff_cols": diff_cols,
+        "diff_src": np.array([sources.index(features[i]["source"]) for i in diff], dtype=int),
+        "value_cols": value_cols,
+        "value_src": np.array([sources.index(features[i]["source"]) for i in value], dtype=int),
+        "const_cols": const_cols,
+        "const_values": np.array([features[i]["value"] for i in const], dtype=float),
+    }
+    return compiled
+
+
+def feature_table(name, rows):
+    compiled = _compile(name)
+    sources, defaults = compiled["sources"], compiled["defaults"]
+    table = np.array([[row.get(s, d) for s, d in zip(sources, defaults)] for row in rows], dtype=float)
+    return table.reshape(len(rows), len(sources))
+
+
+def build_matrix(name, rows, index=None):
+    compiled = _compile(name)
+    table = feature_table(name, rows)
+    if compiled["inputs"] == "pair":
+        index = np.asarray(index, dtype=int).reshape(-1, 2)
+        left, right = table[index[:, 0]], table[index[:, 1]]
+    else:
+        left = table if index is None else table[np.asarray(index, dtype=int)]
+        right = None
+
+    X = np.empty((len(left), compiled["width"]), dtype=float)
+    if len(compiled["diff_cols"]):
+        X[:, compiled["diff_cols"]] = left[:, compiled["diff_src"]] - right[:, compiled["diff_src"]]
+    if len(compiled["value_cols"]):
+        X[:, compiled["value_cols"]] = left[:, compiled["value_src"]]
+    if len(compiled["const_cols"]):
+        X[:, compiled["const_cols"]] = compiled["const_values"]
+    return X
@@ -2,20 +2,39 @@ import os
 import time
 import json
 import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import wraps
-import httpx
+from backend.metrics import BDL_REQUESTS, BDL_LATENCY, CACHE_REQUESTS, gauge
+from backend.db.perf import record_http
 
 logger = logging.getLogger(__name__)
 
-BDL_BASE_URL = "https://api.balldontlie.io/v1"
+BDL_BASE_URL = os.environ.get("BDL_BASE_URL", "https://api.balldontlie.io/v1")
 
 _cache = {}
 _cache_ttl = {}
 CACHE_TTL_SECONDS = 60
 
 _last_request_time = 0
-MIN_REQUEST_INTERVAL = 0.6
+MIN_REQUEST_INTERVAL = float(os.environ.get("BDL_MIN_REQUEST_INTERVAL", "0.6"))
+RETRY_BACKOFF_SECONDS = float(os.environ.get("BDL_RETRY_BACKOFF_SECONDS", "2"))
+REQUEST_TIMEOUT_SECONDS = 15
+REQUESTS_PER_MINUTE = float(os.environ.get("BDL_REQUESTS_PER_MINUTE", "100"))
+BACKGROUND_RESERVE = float(os.environ.get("BDL_BACKGROUND_RESERVE", "0.25"))
+
+_http = {"client": None, "transport": None}
+_request_stats = {"requests": 0, "rate_limited": 0, "errors": 0, "cache_hits": 0}
+_budget = {"tokens": REQUESTS_PER_MINUTE, "updated": time.monotonic()}
+_budget_lock = threading.Lock()
+_live_priority = ContextVar("bdl_live_priority", default=False)
+
+gauge("nba_bdl_cache_entries", "Responses held in the BallDontLie client cache",
+      callback=lambda: [((), len(_cache))])
+gauge("nba_bdl_request_budget_tokens", "Requests left in the shared BallDontLie rate budget",
+      callback=lambda: [((), request_budget()["tokens"])])
 
 
 def get_api_key():
@@ -31,10 +50,108 @@ def _rate_limit():
     _last_request_time = time.time()
 
 
+def _refill_budget():
+    now = time.monotonic()
+    elapsed = now - _budget["updated"]
+    _budget["tokens"] = min(REQUESTS_PER_MINUTE, _budget["tokens"] + elapsed * REQUESTS_PER_MINUTE / 60)
+    _budget["updated"] = now
+
+
+def _reserve(background):
+    if not background:
+        return 0
+    return min(REQUESTS_PER_MINUTE * BACKGROUND_RESERVE, REQUESTS_PER_MINUTE - 1)
+
+
+@contextmanager
+def live_priority():
+    token = _live_priority.set(True)
+    try:
+        yield
+    finally:
+        _live_priority.reset(token)
+
+
+def _consume_budget():
+    if REQUESTS_PER_MINUTE <= 0:
+        return
+    reserve = _reserve(not _live_priority.get())
+    while True:
+        with _budget_lock:
+            _refill_budget()
+            if _budget["tokens"] - reserve >= 1:
+                _budget["tokens"] -= 1
+                return
+            wait = (1 + reserve - _budget["tokens"]) * 60 / REQUESTS_PER_MINUTE
+        time.sleep(wait)
+
+
+def _drain_budget():
+    with _budget_lock:
+        _budget["tokens"] = 0
+        _budget["updated"] = time.monotonic()
+
+
+def has_request_budget(background=True):
+    if REQUESTS_PER_MINUTE <= 0:
+        return True
+    reserve = _reserve(background)
+    with _budget_lock:
+        _refill_budget()
+        return _budget["tokens"] - 1 >= reserve
+
+
+def request_budget():
+    if REQUESTS_PER_MINUTE <= 0:
+        return {"per_minute": None, "tokens": 0}
+    with _budget_lock:
+        _refill_budget()
+        return {"per_minute": REQUESTS_PER_MINUTE, "tokens": round(_budget["tokens"], 2)}
+
+
+def reset_request_budget():
+    with _budget_lock:
+        _budget["tokens"] = REQUESTS_PER_MINUTE
+        _budget["updated"] = time.monotonic()
+
+
+def set_transport(transport):
+    client = _http["client"]
+    _http["client"] = None
+    _http["transport"] = transport
+    if client is not None:
+        client.close()
+
+
+def _get_client():
+    client = _http["client"]
+    if client is None:
+        import httpx
+        client = _http["client"] = httpx.Client(timeout=REQUEST_TIMEOUT_SECONDS, transport=_http["transport"])
+    return client
+
+
+def request_stats():
+    return dict(_request_stats)
+
+
+def reset_request_stats():
+    for key in _request_stats:
+        _request_stats[key] = 0
+
+
+def clear_cache():
+    _cache.clear()
+    _cache_ttl.clear()
+
+
 def _get_cached(key):
     if key in _cache and key in _cache_ttl:
         if time.time() - _cache_ttl[key] < CACHE_TTL_SECONDS:
+            _request_stats["cache_hits"] += 1
+            CACHE_REQUESTS.inc("bdl", "hit")
             return _cache[key]
+    CACHE_REQUESTS.inc("bdl", "miss")
     return None
 
 
@@ -43,6 +160,16 @@ def _set_cache(key, data):
     _cache_ttl[key] = time.time()
 
 
+def _timed_get(endpoint, url, params, headers):
+    started = time.perf_counter()
+    try:
+        return _get_client().get(url, params=params, headers=headers)
+    finally:
+        elapsed = time.perf_counter() - started
+        BDL_LATENCY.observe(elapsed, endpoint)
+        record_http(elapsed * 1000)
+
+
 def _request_with_retry(url, params=None, max_retries=3):
     api_key = get_api_key()
     if not api_key:
@@ -55,26 +182,34 @@ def _request_with_retry(url, params=None, max_retries=3):
     if cached is not None:
         return cached
 
+    endpoint = url.rsplit("/", 1)[-1]
     for attempt in range(max_retries):
         try:
+            _consume_budget()
             _rate_limit()
-            with httpx.Client(timeout=15) as client:
-                resp = client.get(url, params=params, headers=headers)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    _set_cache(cache_key, data)
-                    return data
-                elif resp.status_code == 429:
-                    wait = (2 ** attempt) * 2
-                    logger.warning(f"Rate limited, waiting {wait}s")
-                    time.sleep(wait)
-                else:
-                    logger.error(f"BDL API error {resp.status_code}: {resp.text[:200]}")
-                    return None
+            _request_stats["requests"] += 1
+            resp = _timed_get(endpoint, url, params, headers)
+            BDL_REQUESTS.inc(endpoint, resp.status_code)
+            if resp.status_code == 200:
+                data = resp.json()
+                _set_cache(cache_key, data)
+                return data
+            elif resp.status_code == 429:
+                _request_stats["rate_limited"] += 1
+                _drain_budget()
+                wait = (2 ** attempt) * RETRY_BACKOFF_SECONDS
+                logger.warning(f"Rate limited, waiting {wait}s")
+                time.sleep(wait)
+            else:
+                _request_stats["errors"] += 1
+                logger.error(f"BDL API error {resp.status_code}: {resp.text[:200]}")
+                return None
         except Exception as e:
+            _request_stats["errors"] += 1
+            BDL_REQUESTS.inc(endpoint, "error")
             logger.error(f"BDL request error: {e}")
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+                time.sleep((2 ** attempt) * RETRY_BACKOFF_SECONDS / 2)
     return None
 
 
@@ -199,17 +334,19 @@ def fetch_season_averages(season=2025, player_ids=None):
         if not api_key:
             return []
         headers = {"Authorization": api_key}
+        _consume_budget()
         _rate_limit()
         try:
-            with httpx.Client(timeout=15) as client:
-                resp = client.get(url, params=params, headers=headers)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    _set_cache(cache_key, data)
-                    return data.get("data", [])
-                else:
-                    logger.error(f"Season averages error {resp.status_code}")
-                    return []
+            _request_stats["requests"] += 1
+            resp = _timed_get("season_averages", url, params, headers)
+            BDL_REQUESTS.inc("season_averages", resp.status_code)
+            if resp.status_code == 200:
+                data = resp.json()
+                _set_cache(cache_key, data)
+                return data.get("data", [])
+            else:
+                logger.error(f"Season averages error {resp.status_code}")
+                return []
         except Exception as e:
             logger.error(f"Season averages request error: {e}")
             return []
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from backend.db.models import FactLineRollup, FactOddsSnapshot, FactPropSnapshot
+
+REBUILD_BATCH_SIZE = 5000
+RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600}
+ODDS_MARKETS = {"spread": "home_line", "total": "total", "moneyline": "home_odds"}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def bucket_start(ts, seconds):
+    elapsed = int((ts - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+def prop_market(prop_type, player_id):
+    return f"{prop_type}:{player_id}"
+
+
+def odds_points(lines):
+    return {market: lines.get(field) for market, field in ODDS_MARKETS.items()
+            if lines.get(field) is not None}
+
+
+def record_line_points(db, game_id, vendor, points, ts):
+    if not points:
+        return
+    buckets = {res: bucket_start(ts, seconds) for res, seconds in RESOLUTIONS.items()}
+    existing = db.query(FactLineRollup).filter(
+        FactLineRollup.game_id == game_id,
+        FactLineRollup.resolution.in_(list(buckets)),
+        FactLineRollup.vendor == vendor,
+        FactLineRollup.market.in_(list(points)),
+        FactLineRollup.bucket_start.in_(list(set(buckets.values()))),
+    ).all()
+    rows = {(r.resolution, r.market, r.bucket_start): r for r in existing}
+
+    for resolution, start in buckets.items():
+        for market, value in points.items():
+            row = rows.get((resolution, market, start))
+            if row is None:
+                db.add(FactLineRollup(
+                    game_id=game_id, resolution=resolution, vendor=vendor, market=market,
+                    bucket_start=start, open=value, high=value, low=value, close=value, count=1,
+                    first_at=ts, last_at=ts,
+                ))
+                continue
+            row.high = max(row.high, value)
+            row.low = min(row.low, value)
+            if row.first_at is not None and ts < row.first_at:
+                row.open = value
+                row.first_at = ts
+            if row.last_at is None or ts >= row.last_at:
+                row.close = value
+                row.last_at = ts
+            row.count = (row.count or 0) + 1
+    db.flush()
+
+
+def rebuild_line_rollups(db):
+    db.query(FactLineRollup).delete()
+    series = {}
+
+    def _add(game_id, vendor, market, ts, value):
+        for resolution, seconds in RESOLUTIONS.items():
+            key = (game_id, resolution, vendor, market, bucket_start(ts, seconds))
+            row = series.get(key)
+            if row is None:
+                series[key] = {
+                    "game_id": game_id, "resolution": resolution, "vendor": vendor, "market": market,
+                    "bucket_start": key[-1], "open": value, "high": value, "low": value, "close": value,
+                    "count": 1, "first_at": ts, "last_at": ts,
+                }
+            else:
+                row["high"] = max(row["high"], value)
+                row["low"] = min(row["low"], value)
+                row["close"] = value
+                row["last_at"] = ts
+                row["count"] += 1
+
+    for s in db.query(FactOddsSnapshot).order_by(FactOddsSnapshot.snapshot_at).yield_per(1000):
+        if s.snapshot_at is None:
+            continue
+        lines = {field: getattr(s, field) for field in ODDS_MARKETS.values()}
+        for market, value in odds_points(lines).items():
+            _add(s.game_id, s.vendor, market, s.snapshot_at, value)
+    for p in db.query(FactPropSnapshot).order_by(FactPropSnapshot.snapshot_at).yield_per(1000):
+        if p.snapshot_at is None or p.line is None:
+            continue
+        _add(p.game_id, p.vendor, prop_market(p.prop_type, p.player_id), p.snapshot_at, p.line)
+
+    rows = list(series.values())
+    for i in range(0, len(rows), REBUILD_BATCH_SIZE):
+        db.execute(insert(FactLineRollup), rows[i:i + REBUILD_BATCH_SIZE])
+    db.commit()
+    return len(rows)
+
+
+def get_line_movement(db, game_id, resolution="5m", market=None, vendor=None):
+    query = db.query(FactLineRollup).filter(
+        FactLineRollup.game_id == game_id,
+        FactLineRollup.resolution == resolution,
+    )
+    if vendor:
+        query = query.filter(FactLineRollup.vendor == vendor)
+    if market:
+        query = query.filter(FactLineRollup.market == market)
+    rows = query.order_by(FactLineRollup.vendor, FactLineRollup.market, FactLineRollup.bucket_start).all()
+
+    series = {}
+    for r in rows:
+        key = (r.vendor, r.market)
+        if key not in series:
+            series[key] = {"vendor": r.vendor, "market": r.market, "points": []}
+        series[key]["points"].append({
+            "t": r.bucket_start.isoformat(), "open": r.open, "high": r.high,
+            "low": r.low, "close": r.close, "count": r.count,
+        })
+    return list(series.values())
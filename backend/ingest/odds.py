@@ -0,0 +1,118 @@
+import logging
+from datetime import datetime
+from backend.db.data_versions import mark_changed
+from backend.db.models import FactOddsSnapshot, FactOddsLatest, FactPropSnapshot
+from backend.ingest.line_rollups import record_line_points, odds_points, prop_market
+
+logger = logging.getLogger(__name__)
+
+ODDS_FIELDS = ["home_line", "away_line", "home_odds", "away_odds", "total", "over_odds", "under_odds"]
+COMPACTION_BATCH_SIZE = 1000
+
+def _same_lines(row, lines):
+    return all(getattr(row, f) == lines.get(f) for f in ODDS_FIELDS)
+
+
+def record_odds_snapshot(db, game_id, vendor, market_type, snapshot_at=None, **lines):
+    snapshot_at = snapshot_at or datetime.utcnow()
+    record_line_points(db, game_id, vendor, odds_points(lines), snapshot_at)
+    latest = db.query(FactOddsLatest).filter_by(
+        game_id=game_id, vendor=vendor, market_type=market_type
+    ).first()
+
+    if latest is None:
+        db.add(FactOddsLatest(
+            game_id=game_id, vendor=vendor, market_type=market_type,
+            open_home_line=lines.get("home_line"), open_total=lines.get("total"),
+            first_seen_at=snapshot_at, snapshot_at=snapshot_at, last_seen_at=snapshot_at,
+            **{f: lines.get(f) for f in ODDS_FIELDS}
+        ))
+        db.flush()
+    elif snapshot_at >= latest.snapshot_at:
+        if _same_lines(latest, lines):
+            latest.last_seen_at = max(latest.last_seen_at or snapshot_at, snapshot_at)
+            return None
+        for f in ODDS_FIELDS:
+            setattr(latest, f, lines.get(f))
+        latest.snapshot_at = snapshot_at
+        latest.last_seen_at = snapshot_at
+    elif snapshot_at < latest.first_seen_at:
+        latest.first_seen_at = snapshot_at
+        latest.open_home_line = lines.get("home_line")
+        latest.open_total = lines.get("total")
+    mark_changed(db, "odds")
+
+    snapshot = FactOddsSnapshot(
+        game_id=game_id, vendor=vendor, market_type=market_type, snapshot_at=snapshot_at,
+        **{f: lines.get(f) for f in ODDS_FIELDS}
+    )
+    db.add(snapshot)
+    return snapshot
+
+
+def record_prop_snapshot(db, game_id, player_id, player_name, team_id, prop_type, vendor,
+                         line, over_odds=None, under_odds=None, snapshot_at=None):
+    snapshot_at = snapshot_at or datetime.utcnow()
+    if line is not None:
+        record_line_points(db, game_id, vendor, {prop_market(prop_type, player_id): line}, snapshot_at)
+    snapshot = FactPropSnapshot(
+        game_id=game_id, player_id=player_id, player_name=player_name, team_id=team_id,
+        prop_type=prop_type, line=line, over_odds=over_odds, under_odds=under_odds,
+        vendor=vendor, snapshot_at=snapshot_at,
+    )
+    db.add(snapshot)
+    mark_changed(db, "props")
+    return snapshot
+
+
+def compact_odds_history(db):
+    rows = db.query(
+        FactOddsSnapshot.id, FactOddsSnapshot.game_id, FactOddsSnapshot.vendor, FactOddsSnapshot.market_type,
+        *[getattr(FactOddsSnapshot, f) for f in ODDS_FIELDS]
+    ).order_by(
+        FactOddsSnapshot.game_id, FactOddsSnapshot.vendor, FactOddsSnapshot.market_type,
+        FactOddsSnapshot.snapshot_at, FactOddsSnapshot.id
+    ).yield_per(COMPACTION_BATCH_SIZE)
+
+    duplicates = []
+    previous_key = previous_lines = None
+    for r in rows:
+        key = (r.game_id, r.vendor, r.market_type)
+        values = tuple(r[4:])
+        if key == previous_key and values == previous_lines:
+            duplicates.append(r.id)
+        previous_key, previous_lines = key, values
+
+    for i in range(0, len(duplicates), COMPACTION_BATCH_SIZE):
+        batch = duplicates[i:i + COMPACTION_BATCH_SIZE]
+        db.query(FactOddsSnapshot).filter(FactOddsSnapshot.id.in_(batch)).delete(synchronize_session=False)
+    db.commit()
+    if duplicates:
+        logger.info(f"Compacted {len(duplicates)} unchanged odds snapshots")
+    return len(duplicates)
+
+
+def rebuild_latest_odds(db):
+    db.query(FactOddsLatest).delete()
+    series = {}
+    rows = db.query(FactOddsSnapshot).order_by(
+        FactOddsSnapshot.snapshot_at, FactOddsSnapshot.id
+    ).yield_per(COMPACTION_BATCH_SIZE)
+    for s in rows:
+        key = (s.game_id, s.vendor, s.market_type)
+        latest = series.get(key)
+        if latest is None:
+            latest = series[key] = FactOddsLatest(
+                game_id=s.game_id, vendor=s.vendor, market_type=s.market_type,
+                open_home_line=s.home_line, open_total=s.total, first_seen_at=s.snapshot_at,
+            )
+        elif _same_lines(latest, {f: getattr(s, f) for f in ODDS_FIELDS}):
+            latest.last_seen_at = s.snapshot_at
+            continue
+        for f in ODDS_FIELDS:
+            setattr(latest, f, getattr(s, f))
+        latest.snapshot_at = s.snapshot_at
+        latest.last_seen_at = s.snapshot_at
+    db.add_all(series.values())
+    db.commit()
+    return len(series)
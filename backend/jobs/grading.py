@@ -0,0 +1,126 @@
+import logging
+from datetime import datetime
+import numpy as np
+from sqlalchemy import and_, update
+from sqlalchemy.orm import aliased
+from backend.db.models import DimGame, DimTeam, FactBoxScore, UserPick
+from backend.db.game_state import STATE_FINAL
+from backend.models.pricing import payout_multiplier
+from backend.db.ledger import new_deltas, add_delta, apply_deltas, pick_bucket, pick_delta
+
+logger = logging.getLogger(__name__)
+
+PROP_STAT_TYPES = ["PTS", "REB", "AST", "STL", "BLK", "FG3M", "PRA"]
+
+
+def _load_gradable(db, game_ids=None):
+    home = aliased(DimTeam)
+    away = aliased(DimTeam)
+    query = db.query(
+        UserPick.id, UserPick.pick_type, UserPick.selection, UserPick.odds, UserPick.stake,
+        UserPick.stat_type, UserPick.line, UserPick.pick_side,
+        UserPick.user_id, UserPick.created_at, UserPick.payout.label("previous_payout"),
+        DimGame.home_team_score, DimGame.visitor_team_score,
+        home.full_name.label("home_name"), home.abbreviation.label("home_abbr"),
+        away.full_name.label("away_name"), away.abbreviation.label("away_abbr"),
+        FactBoxScore.id.label("box_score_id"), FactBoxScore.pts, FactBoxScore.reb,
+        FactBoxScore.ast, FactBoxScore.stl, FactBoxScore.blk, FactBoxScore.fg3m,
+    ).join(
+        DimGame, DimGame.id == UserPick.game_id
+    ).outerjoin(
+        home, home.id == DimGame.home_team_id
+    ).outerjoin(
+        away, away.id == DimGame.visitor_team_id
+    ).outerjoin(
+        FactBoxScore, and_(
+            UserPick.pick_type == "player_prop",
+            FactBoxScore.game_id == UserPick.game_id,
+            FactBoxScore.player_id == UserPick.player_id,
+        )
+    ).filter(
+        UserPick.result == "pending",
+        DimGame.state == STATE_FINAL,
+    )
+    if game_ids is not None:
+        query = query.filter(UserPick.game_id.in_(list(game_ids)))
+    rows = query.order_by(UserPick.id).all()
+
+    seen = set()
+    unique = []
+    for r in rows:
+        if r.id not in seen:
+            seen.add(r.id)
+            unique.append(r)
+    return unique
+
+
+def _grade_moneyline(rows):
+    home_score = np.array([r.home_team_score or 0 for r in rows])
+    away_score = np.array([r.visitor_team_score or 0 for r in rows])
+    selection = np.array([r.selection or "" for r in rows], dtype=str)
+    home_won = home_score > away_score
+    winner_name = np.where(home_won, [r.home_name or "" for r in rows], [r.away_name or "" for r in rows])
+    winner_abbr = np.where(home_won, [r.home_abbr or "" for r in rows], [r.away_abbr or "" for r in rows])
+
+    has_winner = winner_name != ""
+    matched = (np.char.find(selection, winner_name) >= 0) | (np.char.find(selection, winner_abbr) >= 0)
+    won = has_winner & matched
+
+    stake = np.array([r.stake or 0 for r in rows], dtype=float)
+    payout = np.where(won, stake * payout_multiplier([r.odds or 0 for r in rows]), 0.0)
+    result = np.where(won, "win", "loss")
+    actual = np.full(len(rows), np.nan)
+    return result, payout, actual
+
+
+def _grade_props(rows):
+    stats = np.array([[r.pts or 0, r.reb or 0, r.ast or 0, r.stl or 0, r.blk or 0, r.fg3m or 0]
+                      for r in rows], dtype=float).reshape(-1, 6)
+    stats = np.column_stack([stats, stats[:, 0] + stats[:, 1] + stats[:, 2]])
+    stat_idx = np.array([PROP_STAT_TYPES.index(r.stat_type.upper()) for r in rows], dtype=int)
+    actual = stats[np.arange(len(rows)), stat_idx]
+
+    line = np.array([r.line for r in rows], dtype=float)
+    over = np.array([r.pick_side == "over" for r in rows], dtype=bool)
+    won = np.where(over, actual > line, actual < line)
+    push = actual == line
+
+    stake = np.array([r.stake or 0 for r in rows], dtype=float)
+    win_payout = stake * payout_multiplier([r.odds or 0 for r in rows])
+    payout = np.where(push, stake, np.where(won, win_payout, 0.0))
+    result = np.where(push, "push", np.where(won, "win", "loss"))
+    return result, payout, actual
+
+
+def grade_pending_picks(db, game_ids=None):
+    rows = _load_gradable(db, game_ids)
+    if not rows:
+        return 0
+
+    moneyline = [r for r in rows if r.pick_type == "moneyline"]
+    props = [r for r in rows if r.pick_type == "player_prop" and r.box_score_id is not None
+             and r.stat_type and r.stat_type.upper() in PROP_STAT_TYPES and r.line is not None]
+
+    now = datetime.utcnow()
+    updates = []
+    deltas = new_deltas()
+    for batch, grader in ((moneyline, _grade_moneyline), (props, _grade_props)):
+        if not batch:
+            continue
+        result, payout, actual = grader(batch)
+        for r, res, pay, act in zip(batch, result.tolist(), payout.tolist(), actual.tolist()):
+            updates.append({
+                "id": r.id, "result": res, "payout": pay,
+                "actual_stat": None if np.isnan(act) else act,
+                "graded_at": now,
+            })
+            bucket = pick_bucket(r.user_id, r.pick_type, r.created_at)
+            add_delta(deltas, bucket, pick_delta("pending", r.stake, r.previous_payout, -1))
+            add_delta(deltas, bucket, pick_delta(res, r.stake, pay))
+
+    if updates:
+        db.execute(update(UserPick), updates)
+        apply_deltas(db, deltas)
+        db.commit()
+    logger.info(f"Graded {len(updates)} picks ({len(rows) - len(updates)} awaiting box scores)")
+    return len(updates)
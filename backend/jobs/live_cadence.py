@@ -0,0 +1,72 @@
+import os
+import re
+from datetime import datetime, timedelta
+from backend.db.models import DimGame
+from backend.db.game_state import STATE_LIVE, STATE_SCHEDULED
+
+MODE_IDLE = "idle"
+MODE_PREGAME = "pregame"
+MODE_LIVE = "live"
+MODE_CLUTCH = "clutch"
+
+CADENCE_SECONDS = {
+    MODE_IDLE: int(os.environ.get("LIVE_POLL_IDLE_SECONDS", "600")),
+    MODE_PREGAME: int(os.environ.get("LIVE_POLL_PREGAME_SECONDS", "60")),
+    MODE_LIVE: int(os.environ.get("REFRESH_SECONDS", "15")),
+    MODE_CLUTCH: int(os.environ.get("LIVE_POLL_CLUTCH_SECONDS", "5")),
+}
+PREGAME_WINDOW = timedelta(minutes=int(os.environ.get("LIVE_POLL_PREGAME_MINUTES", "60")))
+LATE_TIPOFF_WINDOW = timedelta(hours=3)
+CLUTCH_CLOCK_SECONDS = 180
+REGULATION_PERIODS = 4
+
+_CLOCK_PATTERN = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def clock_seconds(time_str):
+    matches = _CLOCK_PATTERN.findall(time_str or "")
+    if not matches:
+        return None
+    minutes, seconds = matches[-1]
+    return int(minutes) * 60 + int(seconds)
+
+
+def is_clutch(period, time_str):
+    period = period or 0
+    if period > REGULATION_PERIODS:
+        return True
+    if period < REGULATION_PERIODS:
+        return False
+    remaining = clock_seconds(time_str)
+    return remaining is not None and remaining <= CLUTCH_CLOCK_SECONDS
+
+
+def cadence_for(games, today_dates, now=None):
+    now = now or datetime.utcnow()
+    mode = MODE_IDLE
+    for state, period, time_str, tipoff_at, date in games:
+        if state == STATE_LIVE:
+            if is_clutch(period, time_str):
+                return MODE_CLUTCH
+            mode = MODE_LIVE
+        elif state == STATE_SCHEDULED and mode == MODE_IDLE:
+            if tipoff_at is not None:
+                if now - LATE_TIPOFF_WINDOW <= tipoff_at <= now + PREGAME_WINDOW:
+                    mode = MODE_PREGAME
+            elif date in today_dates:
+                mode = MODE_PREGAME
+    return mode
+
+
+def choose_cadence(db, today_dates, now=None):
+    now = now or datetime.utcnow()
+    games = db.query(
+        DimGame.state, DimGame.period, DimGame.time, DimGame.tipoff_at, DimGame.date
+    ).filter(
+        (DimGame.state == STATE_LIVE)
+        | ((DimGame.state == STATE_SCHEDULED)
+           & (DimGame.tipoff_at.between(now - LATE_TIPOFF_WINDOW, now + PREGAME_WINDOW)
+              | (DimGame.tipoff_at.is_(None) & DimGame.date.in_(today_dates))))
+    ).all()
+    mode = cadence_for(games, today_dates, now)
+    return mode, CADENCE_SECONDS[mode]
@@ -0,0 +1,176 @@
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from backend.db.models import SessionLocal, ModelJob
+from backend.db.lease import holder_id, standing_down
+
+logger = logging.getLogger(__name__)
+
+MAX_JOB_HISTORY = 20
+ACTIVE_STATUSES = ("queued", "running")
+STALE_JOB_SECONDS = 3600
+QUEUED_JOB_SECONDS = 900
+
+_runner = {"id": holder_id()}
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def _snapshot(job):
+    return {
+        "id": job.id, "kind": job.kind, "source": job.source, "status": job.status,
+        "stage": job.stage, "progress": job.progress or 0.0, "stages": json.loads(job.stages or "{}"),
+        "created_at": _iso(job.created_at), "started_at": _iso(job.started_at),
+        "finished_at": _iso(job.finished_at), "duration_seconds": job.duration_seconds,
+        "result": json.loads(job.result) if job.result else None, "error": job.error,
+    }
+
+
+def get_job(job_id):
+    db = SessionLocal()
+    try:
+        job = db.query(ModelJob).filter_by(id=job_id).first()
+        return _snapshot(job) if job else None
+    finally:
+        db.close()
+
+
+def list_jobs():
+    db = SessionLocal()
+    try:
+        return [_snapshot(j) for j in db.query(ModelJob).order_by(ModelJob.created_at.desc()).limit(MAX_JOB_HISTORY)]
+    finally:
+        db.close()
+
+
+def active_job():
+    db = SessionLocal()
+    try:
+        job = db.query(ModelJob).filter(ModelJob.status.in_(ACTIVE_STATUSES)).first()
+        return _snapshot(job) if job else None
+    finally:
+        db.close()
+
+
+def _update(job_id, **fields):
+    db = SessionLocal()
+    try:
+        db.execute(update(ModelJob).where(ModelJob.id == job_id).values(updated_at=datetime.utcnow(), **fields))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _prune(db):
+    finished = db.query(ModelJob.id).filter(ModelJob.status.notin_(ACTIVE_STATUSES)).order_by(
+        ModelJob.created_at.desc()).offset(MAX_JOB_HISTORY).all()
+    if finished:
+        db.query(ModelJob).filter(ModelJob.id.in_([j for (j,) in finished])).delete(synchronize_session=False)
+
+
+def submit_retrain(source="api"):
+    _fail_stale_jobs(datetime.utcnow())
+    db = SessionLocal()
+    try:
+        existing = db.query(ModelJob).filter_by(active_key="retrain").first()
+        if existing is not None:
+            return _snapshot(existing), False
+        job = ModelJob(id=uuid.uuid4().hex[:12], kind="retrain", source=source, status="queued",
+                       active_key="retrain", progress=0.0, stages="{}", created_at=datetime.utcnow())
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return _snapshot(db.query(ModelJob).filter_by(active_key="retrain").one()), False
+        _prune(db)
+        db.commit()
+        return _snapshot(job), True
+    finally:
+        db.close()
+
+
+def _fail_stale_jobs(now):
+    db = SessionLocal()
+    try:
+        stale = db.execute(
+            update(ModelJob)
+            .where(ModelJob.status == "running", ModelJob.updated_at < now - timedelta(seconds=STALE_JOB_SECONDS))
+            .values(status="failed", active_key=None, error="abandoned by its runner", finished_at=now)
+        ).rowcount
+        stale += db.execute(
+            update(ModelJob)
+            .where(ModelJob.status == "queued", ModelJob.created_at < now - timedelta(seconds=QUEUED_JOB_SECONDS))
+            .values(status="failed", active_key=None, error="no runner claimed the job", finished_at=now)
+        ).rowcount
+        db.commit()
+    finally:
+        db.close()
+    if stale:
+        logger.warning(f"Marked {stale} stale model jobs as failed")
+
+
+def _claim_next():
+    db = SessionLocal()
+    try:
+        queued = db.query(ModelJob.id).filter_by(status="queued").order_by(ModelJob.created_at).all()
+        for (job_id,) in queued:
+            now = datetime.utcnow()
+            claimed = db.execute(
+                update(ModelJob)
+                .where(ModelJob.id == job_id, ModelJob.status == "queued")
+                .values(status="running", claimed_by=_runner["id"], started_at=now, updated_at=now)
+            ).rowcount
+            db.commit()
+            if claimed:
+                return job_id
+        return None
+    finally:
+        db.close()
+
+
+def run_pending_jobs():
+    _fail_stale_jobs(datetime.utcnow())
+    ran = 0
+    while not standing_down():
+        job_id = _claim_next()
+        if job_id is None:
+            break
+        _run_retrain(job_id)
+        ran += 1
+    return ran
+
+
+def _run_retrain(job_id):
+    from backend.models.training import train_all_models
+    from backend.jobs.scheduler import build_projections
+
+    started = time.perf_counter()
+    state = {"stage": None, "stages": {}, "time": started}
+
+    def progress(stage, fraction):
+        now = time.perf_counter()
+        if state["stage"] is not None:
+            state["stages"][state["stage"]] = round(now - state["time"], 3)
+        state.update(stage=stage, time=now)
+        _update(job_id, stage=stage, progress=round(fraction, 2), stages=json.dumps(state["stages"]))
+
+    try:
+        result = train_all_models(progress=progress)
+        progress("projections", 0.95)
+        build_projections()
+        progress(None, 1.0)
+        _update(job_id, status="succeeded", result=json.dumps(result, default=str))
+        logger.info(f"Retrain job {job_id} finished in {time.perf_counter() - started:.1f}s")
+    except Exception as e:
+        logger.error(f"Retrain job {job_id} failed: {e}")
+        _update(job_id, status="failed", error=str(e))
+    finally:
+        _update(job_id, active_key=None, finished_at=datetime.utcnow(),
+                duration_seconds=round(time.perf_counter() - started, 3))
@@ -0,0 +1,167 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import wraps
+from apscheduler.events import (
+    EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES
+)
+from backend.db.perf import recent_job_runs
+from backend.metrics import JOB_SKIPPED, JOB_OVERRUNS
+
+logger = logging.getLogger(__name__)
+
+RECENT_PROFILES = 20
+PROFILE_TOP_FUNCTIONS = 15
+MONITORED_EVENTS = EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+
+_settings = {
+    "profile": os.environ.get("JOB_PROFILE", "0") == "1",
+    "profile_threshold": float(os.environ.get("JOB_PROFILE_THRESHOLD_SECONDS", "5")),
+    "profile_dir": os.environ.get("JOB_PROFILE_DIR", "job_profiles"),
+}
+_lock = threading.Lock()
+_profile_lock = threading.Lock()
+_health = {}
+_profiles = deque(maxlen=RECENT_PROFILES)
+
+
+def configure_profiling(enabled=None, threshold=None, directory=None):
+    if enabled is not None:
+        _settings["profile"] = enabled
+    if threshold is not None:
+        _settings["profile_threshold"] = threshold
+    if directory is not None:
+        _settings["profile_dir"] = directory
+    return dict(_settings)
+
+
+def _job_health(job_id):
+    return _health.setdefault(job_id, {
+        "runs": 0, "errors": 0, "skipped": 0, "missed": 0, "overruns": 0,
+        "last_scheduled_at": None, "last_finished_at": None, "last_wall_ms": None,
+        "last_status": None, "last_error": None,
+    })
+
+
+def _interval_seconds(job):
+    interval = getattr(job.trigger, "interval", None) if job is not None else None
+    return interval.total_seconds() if interval is not None else None
+
+
+def handle_job_event(event, scheduler=None):
+    now = datetime.now(timezone.utc)
+    with _lock:
+        health = _job_health(event.job_id)
+        if event.code == EVENT_JOB_MAX_INSTANCES:
+            health["skipped"] += 1
+        elif event.code == EVENT_JOB_MISSED:
+            health["missed"] += 1
+        else:
+            wall_ms = (now - event.scheduled_run_time).total_seconds() * 1000
+            health["runs"] += 1
+            health["last_scheduled_at"] = event.scheduled_run_time.isoformat()
+            health["last_finished_at"] = now.isoformat()
+            health["last_wall_ms"] = round(wall_ms, 1)
+            health["last_status"] = "error" if event.exception else "success"
+            if event.exception:
+                health["errors"] += 1
+                health["last_error"] = repr(event.exception)[:300]
+
+    if event.code == EVENT_JOB_MAX_INSTANCES:
+        JOB_SKIPPED.inc(event.job_id, "max_instances")
+        logger.warning(f"Job {event.job_id} skipped: previous run still in progress")
+        return
+    if event.code == EVENT_JOB_MISSED:
+        JOB_SKIPPED.inc(event.job_id, "missed")
+        logger.warning(f"Job {event.job_id} missed its run at {event.scheduled_run_time}")
+        return
+
+    job = scheduler.get_job(event.job_id) if scheduler is not None else None
+    interval = _interval_seconds(job)
+    if interval and wall_ms > interval * 1000:
+        with _lock:
+            health["overruns"] += 1
+        JOB_OVERRUNS.inc(event.job_id)
+        logger.warning(f"Job {event.job_id} overran its {interval:.0f}s interval ({wall_ms / 1000:.1f}s)")
+
+
+def attach_listeners(scheduler):
+    scheduler.add_listener(lambda event: handle_job_event(event, scheduler), MONITORED_EVENTS)
+
+
+def profiled(fn):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _settings["profile"] or not _profile_lock.acquire(blocking=False):
+            return fn(*args, **kwargs)
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profile.enable()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - started
+                if elapsed >= _settings["profile_threshold"]:
+                    _save_profile(fn.__name__, profile, elapsed)
+        finally:
+            _profile_lock.release()
+    return wrapper
+
+
+def _save_profile(name, profile, elapsed):
+    captured_at = datetime.utcnow()
+    try:
+        os.makedirs(_settings["profile_dir"], exist_ok=True)
+        path = os.path.join(_settings["profile_dir"], f"{name}-{captured_at.strftime('%Y%m%dT%H%M%S%f')}.prof")
+        profile.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+    except Exception as e:
+        logger.error(f"Failed to save profile for {name}: {e}")
+        return None
+    entry = {"job": name, "path": path, "seconds": round(elapsed, 3),
+             "captured_at": captured_at.isoformat(), "top": out.getvalue()}
+    with _lock:
+        _profiles.append(entry)
+    logger.info(f"Profiled slow {name} run ({elapsed:.1f}s) to {path}")
+    return entry
+
+
+def recent_profiles(job=None):
+    with _lock:
+        return [p for p in reversed(_profiles) if job is None or p["job"] == job]
+
+
+def job_health(scheduler):
+    jobs = []
+    for job in scheduler.get_jobs():
+        name = getattr(job.func, "__name__", job.id)
+        with _lock:
+            health = dict(_job_health(job.id))
+        runs = recent_job_runs(name)
+        next_run = getattr(job, "next_run_time", None)
+        jobs.append({
+            "id": job.id,
+            "function": name,
+            "trigger": str(job.trigger),
+            "interval_seconds": _interval_seconds(job),
+            "next_run_at": next_run.isoformat() if next_run else None,
+            "max_instances": getattr(job, "max_instances", None),
+            **health,
+            "recent_runs": runs,
+        })
+    return jobs
+
+
+def reset_monitor():
+    with _lock:
+        _health.clear()
+        _profiles.clear()
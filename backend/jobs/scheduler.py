@@ -1,11 +1,24 @@
 import logging
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
-from backend.ingest.bdl_client import fetch_todays_games, fetch_games_for_dates, fetch_game_stats, fetch_recent_completed_games, fetch_all_season_games, fetch_games_for_date_range, has_api_key, fetch_players_by_team
+from backend.ingest.bdl_client import fetch_todays_games, fetch_games_for_dates, fetch_game_stats, fetch_recent_completed_games, fetch_all_season_games, fetch_games_for_date_range, has_api_key, fetch_players_by_team, has_request_budget, live_priority
 from backend.db.models import (
     SessionLocal, DimGame, DimTeam, DimPlayer, FactBoxScore,
-    FactOddsSnapshot, FactPropSnapshot, ScoreHistory, RawApiResponse, UserPick
+    FactOddsSnapshot, FactPropSnapshot, FactPlayerProjection, ScoreHistory, RawApiResponse
 )
+from backend.db.game_state import (
+    STATE_LIVE, STATE_FINAL, normalize_status, apply_status, update_live_game_ids, parse_tipoff
+)
+from backend.db.player_summary import record_box_scores
+from backend.db.player_search import rebuild_player_index, process_enrichment_requests
+from backend.db.lease import standing_down
+from backend.db.perf import tracked_job
+from backend.jobs.monitor import attach_listeners, profiled
+from backend.jobs.live_cadence import CADENCE_SECONDS, MODE_LIVE, choose_cadence
+from backend.metrics import INGESTED_ROWS, LIVE_POLL_INTERVAL
+from backend.jobs.grading import grade_pending_picks
+from backend.ingest.odds import compact_odds_history
+from backend.features.projections import projection_game_ids, build_player_projections
 import json
 import os
 import time as _time
@@ -13,7 +26,12 @@ import time as _time
 logger = logging.getLogger(__name__)
 scheduler = BackgroundScheduler()
 
-REFRESH_SECONDS = int(os.environ.get("REFRESH_SECONDS", "15"))
+REFRESH_SECONDS = CADENCE_SECONDS[MODE_LIVE]
+LIVE_POLL_JOB_ID = "ingest_games"
+
+_live_cadence = {"mode": MODE_LIVE, "seconds": REFRESH_SECONDS}
+BOX_SCORE_FETCH_DELAY = float(os.environ.get("BOX_SCORE_FETCH_DELAY", "0.5"))
+ROSTER_FETCH_DELAY = float(os.environ.get("ROSTER_FETCH_DELAY", "0.3"))
 
 
 def _get_relevant_dates():
@@ -37,6 +55,8 @@ def ingest_live_games():
                 response_json=json.dumps(games), fetched_at=datetime.utcnow()
             ))
 
+            states = {}
+            newly_final = []
             for g in games:
                 home = g.get("home_team", {})
                 visitor = g.get("visitor_team", {})
@@ -57,27 +77,34 @@ def ingest_live_games():
 
                 game = db.query(DimGame).filter_by(id=g["id"]).first()
                 if game:
-                    game.status = g.get("status", game.status)
                     game.period = g.get("period", game.period)
+                    previous, _ = apply_status(game, g.get("status", game.status))
+                    if game.state == STATE_FINAL and previous != STATE_FINAL:
+                        newly_final.append(game.id)
                     game.time = g.get("time", game.time)
+                    game.tipoff_at = parse_tipoff(g) or game.tipoff_at
                     game.home_team_score = g.get("home_team_score", 0) or 0
                     game.visitor_team_score = g.get("visitor_team_score", 0) or 0
                 else:
-                    db.add(DimGame(
+                    game = DimGame(
                         id=g["id"],
                         date=g.get("date", "")[:10],
                         season=g.get("season", 2025),
                         status=g.get("status", ""),
+                        state=normalize_status(g.get("status", ""), g.get("period", 0) or 0),
                         period=g.get("period", 0) or 0,
                         time=g.get("time", ""),
                         home_team_id=home.get("id"),
                         visitor_team_id=visitor.get("id"),
                         home_team_score=g.get("home_team_score", 0) or 0,
                         visitor_team_score=g.get("visitor_team_score", 0) or 0,
-                        postseason=g.get("postseason", False)
-                    ))
+                        postseason=g.get("postseason", False),
+                        tipoff_at=parse_tipoff(g)
+                    )
+                    db.add(game)
+                states[game.id] = game.state
 
-                if g.get("status") in ("In Progress", "in progress", "2nd Qtr", "3rd Qtr", "4th Qtr", "Halftime"):
+                if game.state == STATE_LIVE:
                     db.add(ScoreHistory(
                         game_id=g["id"],
                         home_score=g.get("home_team_score", 0) or 0,
@@ -87,12 +114,43 @@ def ingest_live_games():
                     ))
 
             db.commit()
+            update_live_game_ids(states)
+            INGESTED_ROWS.inc("live_games", amount=len(games))
         finally:
             db.close()
+        if newly_final:
+            grade_picks(newly_final)
     except Exception as e:
         logger.error(f"Error ingesting games: {e}")
 
 
+def update_live_cadence():
+    db = SessionLocal()
+    try:
+        mode, seconds = choose_cadence(db, _get_relevant_dates())
+    finally:
+        db.close()
+    if seconds != _live_cadence["seconds"] and scheduler.get_job(LIVE_POLL_JOB_ID):
+        scheduler.reschedule_job(LIVE_POLL_JOB_ID, trigger="interval", seconds=seconds)
+        logger.info(f"Live polling switched from {_live_cadence['mode']} to {mode} ({seconds}s)")
+    _live_cadence.update(mode=mode, seconds=seconds)
+    LIVE_POLL_INTERVAL.set(seconds)
+    return mode, seconds
+
+
+def live_cadence():
+    return dict(_live_cadence)
+
+
+def poll_live_games():
+    with live_priority():
+        ingest_live_games()
+    try:
+        update_live_cadence()
+    except Exception as e:
+        logger.error(f"Error updating live poll cadence: {e}")
+
+
 def ingest_box_scores():
     global _stats_api_available
     if not has_api_key():
@@ -102,10 +160,12 @@ def ingest_box_scores():
     try:
         db = SessionLocal()
         try:
-            live_games = db.query(DimGame).filter(
-                DimGame.status.in_(["Final", "final"])
-            ).all()
+            live_games = db.query(DimGame).filter(DimGame.state == STATE_FINAL).all()
+            scored = []
             for game in live_games:
+                if standing_down():
+                    logger.info("Lost scheduler lease, stopping box score ingestion")
+                    break
                 existing = db.query(FactBoxScore).filter_by(game_id=game.id).first()
                 if existing:
                     continue
@@ -117,14 +177,21 @@ def ingest_box_scores():
                 if not stats:
                     continue
                 _store_box_scores(db, game.id, stats)
+                scored.append(game.id)
             db.commit()
+            if scored:
+                rebuild_player_index(db)
         finally:
             db.close()
+        if scored:
+            grade_picks(scored)
     except Exception as e:
         logger.error(f"Error ingesting box scores: {e}")
 
 
 def _store_box_scores(db, game_id, stats):
+    stored = {pid for (pid,) in db.query(FactBoxScore.player_id).filter_by(game_id=game_id)}
+    added = []
     for s in stats:
         player_data = s.get("player", {})
         if not player_data.get("id"):
@@ -143,13 +210,11 @@ def _store_box_scores(db, game_id, stats):
             except Exception:
                 db.rollback()
 
-        existing_bs = db.query(FactBoxScore).filter_by(
-            game_id=game_id, player_id=player_data["id"]
-        ).first()
-        if existing_bs:
+        if player_data["id"] in stored:
             continue
+        stored.add(player_data["id"])
 
-        db.add(FactBoxScore(
+        bs = FactBoxScore(
             game_id=game_id,
             player_id=player_data.get("id"),
             team_id=s.get("team", {}).get("id"),
@@ -170,65 +235,20 @@ def _store_box_scores(db, game_id, stats):
             fg_pct=s.get("fg_pct", 0) or 0,
             fg3_pct=s.get("fg3_pct", 0) or 0,
             ft_pct=s.get("ft_pct", 0) or 0,
-        ))
+        )
+        db.add(bs)
+        added.append(bs)
+    record_box_scores(db, added)
+    INGESTED_ROWS.inc("box_scores", amount=len(added))
 
 
-def grade_picks():
+def grade_picks(game_ids=None):
     db = SessionLocal()
     try:
-        pending = db.query(UserPick).filter_by(result="pending").all()
-        for pick in pending:
-            game = db.query(DimGame).filter_by(id=pick.game_id).first()
-            if not game or game.status not in ("Final", "final"):
-                continue
-
-            if pick.pick_type == "moneyline":
-                home_team = db.query(DimTeam).filter_by(id=game.home_team_id).first()
-                away_team = db.query(DimTeam).filter_by(id=game.visitor_team_id).first()
-                winner = home_team if game.home_team_score > game.visitor_team_score else away_team
-                if winner and (winner.full_name in pick.selection or winner.abbreviation in pick.selection):
-                    pick.result = "win"
-                    if pick.odds > 0:
-                        pick.payout = pick.stake * (1 + pick.odds / 100)
-                    else:
-                        pick.payout = pick.stake * (1 + 100 / abs(pick.odds))
-                else:
-                    pick.result = "loss"
-                    pick.payout = 0
-
-            elif pick.pick_type == "player_prop":
-                if pick.player_id and pick.stat_type and pick.line is not None:
-                    bs = db.query(FactBoxScore).filter_by(
-                        game_id=pick.game_id, player_id=pick.player_id
-                    ).first()
-                    if bs:
-                        stat_map = {
-                            "PTS": bs.pts, "REB": bs.reb, "AST": bs.ast,
-                            "STL": bs.stl, "BLK": bs.blk, "FG3M": bs.fg3m,
-                            "PRA": (bs.pts or 0) + (bs.reb or 0) + (bs.ast or 0),
-                        }
-                        actual = stat_map.get(pick.stat_type.upper())
-                        if actual is not None:
-                            pick.actual_stat = float(actual)
-                            if pick.pick_side == "over":
-                                won = actual > pick.line
-                            else:
-                                won = actual < pick.line
-                            if actual == pick.line:
-                                pick.result = "push"
-                                pick.payout = pick.stake
-                            elif won:
-                                pick.result = "win"
-                                if pick.odds > 0:
-                                    pick.payout = pick.stake * (1 + pick.odds / 100)
-                                else:
-                                    pick.payout = pick.stake * (1 + 100 / abs(pick.odds))
-                            else:
-                                pick.result = "loss"
-                                pick.payout = 0
-
-            pick.graded_at = datetime.utcnow()
-        db.commit()
+        return grade_pending_picks(db, game_ids)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error grading picks: {e}")
     finally:
         db.close()
 
@@ -246,6 +266,7 @@ def _get_current_season():
 
 def _store_games_batch(db, games):
     added = 0
+    newly_final = []
     for g in games:
         try:
             home = g.get("home_team", {})
@@ -272,7 +293,10 @@ def _store_games_batch(db, games):
 
             existing_game = db.query(DimGame).filter_by(id=g["id"]).first()
             if existing_game:
-                existing_game.status = game_status or existing_game.status
+                previous, state = apply_status(existing_game, game_status or existing_game.status, g.get("period"))
+                if state == STATE_FINAL and previous != STATE_FINAL:
+                    newly_final.append(existing_game.id)
+                existing_game.tipoff_at = parse_tipoff(g) or existing_game.tipoff_at
                 existing_game.home_team_score = g.get("home_team_score", 0) or existing_game.home_team_score or 0
                 existing_game.visitor_team_score = g.get("visitor_team_score", 0) or existing_game.visitor_team_score or 0
             else:
@@ -281,13 +305,15 @@ def _store_games_batch(db, games):
                     date=g.get("date", "")[:10],
                     season=g.get("season", 2025),
                     status=game_status or "Scheduled",
+                    state=normalize_status(game_status, g.get("period", 0) or 0),
                     period=g.get("period", 0),
                     time=g.get("time", ""),
                     home_team_id=home.get("id"),
                     visitor_team_id=visitor.get("id"),
                     home_team_score=g.get("home_team_score", 0) or 0,
                     visitor_team_score=g.get("visitor_team_score", 0) or 0,
-                    postseason=g.get("postseason", False)
+                    postseason=g.get("postseason", False),
+                    tipoff_at=parse_tipoff(g)
                 ))
             db.flush()
             added += 1
@@ -295,6 +321,9 @@ def _store_games_batch(db, games):
             db.rollback()
             logger.debug(f"Skipping game {g.get('id')}: {e}")
     db.commit()
+    INGESTED_ROWS.inc("games", amount=added)
+    if newly_final:
+        grade_picks(newly_final)
     return added
 
 
@@ -313,22 +342,21 @@ def seed_historical_games():
         season = _get_current_season()
         games = fetch_all_season_games(season=season, max_pages=30)
         logger.info(f"Got {len(games)} games from season endpoint")
+        if standing_down():
+            logger.info("Lost scheduler lease, abandoning historical seed")
+            return
 
         added = _store_games_batch(db, games)
         logger.info(f"Stored {added} games from season endpoint")
 
         total = db.query(DimGame).count()
-        final_count = db.query(DimGame).filter(DimGame.status.in_(["Final", "final"])).count()
+        final_count = db.query(DimGame).filter(DimGame.state == STATE_FINAL).count()
         logger.info(f"After initial seed: {total} total games, {final_count} final")
 
         _seed_box_scores_for_games(db)
 
-        from backend.models.ml_models import train_win_probability_model, train_player_prop_model
-        result = train_win_probability_model()
-        logger.info(f"Win model training result: {result}")
-        for prop in ["PTS", "REB", "AST", "STL", "BLK"]:
-            r = train_player_prop_model(prop)
-            logger.info(f"Player prop {prop} model: {r}")
+        from backend.jobs.model_jobs import submit_retrain
+        submit_retrain(source="initial_seed")
     except Exception as e:
         logger.error(f"Error seeding historical games: {e}")
     finally:
@@ -338,13 +366,13 @@ def seed_historical_games():
 _backfill_checked_dates = set()
 
 
-def backfill_calendar_games():
+def backfill_calendar_games(today=None, season_start=None):
     if not has_api_key():
-        return
+        return 0
     db = SessionLocal()
     try:
         from datetime import timedelta
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        today = today or datetime.utcnow().strftime("%Y-%m-%d")
 
         existing_dates = set()
         all_games = db.query(DimGame.date).distinct().all()
@@ -352,7 +380,7 @@ def backfill_calendar_games():
             if d:
                 existing_dates.add(d)
 
-        season_start = _get_season_start()
+        season_start = season_start or _get_season_start()
         start = datetime.strptime(season_start, "%Y-%m-%d")
         end = datetime.strptime(today, "%Y-%m-%d")
         missing_dates = []
@@ -365,7 +393,13 @@ def backfill_calendar_games():
 
         if not missing_dates:
             logger.info("Calendar backfill complete - all dates checked")
-            return
+            return 0
+
+        if not has_request_budget(background=True):
+            logger.info("Calendar backfill deferred: request budget reserved for live polling")
+            return 0
+        if standing_down():
+            return 0
 
         batch = missing_dates[:7]
         logger.info(f"Backfilling {len(batch)} dates (of {len(missing_dates)} remaining): {batch[0]} to {batch[-1]}")
@@ -381,8 +415,10 @@ def backfill_calendar_games():
 
         total = db.query(DimGame).count()
         logger.info(f"After backfill: {total} total games in DB")
+        return len(batch)
     except Exception as e:
         logger.error(f"Error in calendar backfill: {e}")
+        return 0
     finally:
         db.close()
 
@@ -397,9 +433,7 @@ def _seed_box_scores_for_games(db):
         logger.info("Stats API not available (free tier), skipping box score fetch")
         return
 
-    games_without_bs = db.query(DimGame).filter(
-        DimGame.status.in_(["Final", "final"])
-    ).all()
+    games_without_bs = db.query(DimGame).filter(DimGame.state == STATE_FINAL).all()
 
     games_needing_bs = []
     for g in games_without_bs:
@@ -424,21 +458,28 @@ def _seed_box_scores_for_games(db):
     _stats_api_available = True
     _store_box_scores(db, first_game.id, stats)
     db.commit()
+    scored = [first_game.id]
 
     fetched = 1
     for g in games_needing_bs[1:29]:
+        if standing_down():
+            logger.info("Lost scheduler lease, stopping box score seed")
+            break
         try:
             stats = fetch_game_stats(g.id)
             if stats:
                 _store_box_scores(db, g.id, stats)
                 db.commit()
+                scored.append(g.id)
                 fetched += 1
-            _time.sleep(0.5)
+            _time.sleep(BOX_SCORE_FETCH_DELAY)
         except Exception as e:
             db.rollback()
             logger.debug(f"Error fetching box scores for game {g.id}: {e}")
 
     logger.info(f"Seeded box scores for {fetched} games")
+    rebuild_player_index(db)
+    grade_picks(scored)
     bs_count = db.query(FactBoxScore).count()
     player_count = db.query(DimPlayer).count()
     logger.info(f"Total box scores: {bs_count}, Total players: {player_count}")
@@ -463,6 +504,9 @@ def seed_team_rosters():
         logger.info(f"Fetching rosters for {len(team_ids_needing_roster)} teams...")
         fetched = 0
         for tid in team_ids_needing_roster:
+            if standing_down():
+                logger.info("Lost scheduler lease, stopping roster seed")
+                break
             try:
                 api_players = fetch_players_by_team(tid)
                 for ap in api_players:
@@ -478,48 +522,106 @@ def seed_team_rosters():
                         ))
                 db.commit()
                 fetched += 1
-                _time.sleep(0.3)
+                _time.sleep(ROSTER_FETCH_DELAY)
             except Exception as e:
                 db.rollback()
                 logger.debug(f"Error fetching roster for team {tid}: {e}")
 
         total_players = db.query(DimPlayer).count()
         logger.info(f"Roster seed complete: fetched for {fetched} teams, {total_players} total players")
+        if fetched:
+            rebuild_player_index(db)
+            build_projections()
     except Exception as e:
         logger.error(f"Error seeding rosters: {e}")
     finally:
         db.close()
 
 
-def daily_retrain():
+def compact_odds():
+    db = SessionLocal()
     try:
-        from backend.models.ml_models import train_win_probability_model, train_player_prop_model
-        result = train_win_probability_model()
-        logger.info(f"Daily retrain - Win model: {result}")
-        for prop in ["PTS", "REB", "AST", "STL", "BLK"]:
-            r = train_player_prop_model(prop)
-            logger.info(f"Daily retrain - {prop} model: {r}")
+        compact_odds_history(db)
     except Exception as e:
-        logger.error(f"Error in daily retrain: {e}")
+        db.rollback()
+        logger.error(f"Error compacting odds history: {e}")
+    finally:
+        db.close()
+
+
+def build_projections():
+    db = SessionLocal()
+    try:
+        build_player_projections(db)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error building player projections: {e}")
+    finally:
+        db.close()
+
+
+def build_missing_projections():
+    db = SessionLocal()
+    try:
+        game_ids = projection_game_ids(db)
+        built = {gid for (gid,) in db.query(FactPlayerProjection.game_id).filter(
+            FactPlayerProjection.game_id.in_(game_ids)).distinct()}
+        missing = [gid for gid in game_ids if gid not in built]
+        if missing:
+            build_player_projections(db, missing)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error building missing player projections: {e}")
+    finally:
+        db.close()
+
+
+def daily_retrain():
+    from backend.jobs.model_jobs import submit_retrain
+    job, created = submit_retrain(source="scheduled")
+    if created:
+        logger.info(f"Daily retrain submitted as job {job['id']}")
+    else:
+        logger.info(f"Daily retrain skipped, job {job['id']} already {job['status']}")
+
+
+def run_model_jobs():
+    from backend.jobs.model_jobs import run_pending_jobs
+    run_pending_jobs()
+
+
+def _monitored(fn):
+    return tracked_job(profiled(fn))
 
 
 def start_scheduler():
     if scheduler.running:
         return
 
-    scheduler.add_job(ingest_live_games, 'interval', seconds=REFRESH_SECONDS, id='ingest_games',
+    attach_listeners(scheduler)
+    scheduler.add_job(_monitored(poll_live_games), 'interval', seconds=REFRESH_SECONDS, id=LIVE_POLL_JOB_ID,
+                      replace_existing=True, max_instances=1)
+    scheduler.add_job(_monitored(ingest_box_scores), 'interval', minutes=5, id='ingest_boxscores',
+                      replace_existing=True, max_instances=1)
+    scheduler.add_job(_monitored(grade_picks), 'interval', minutes=60, id='grade_picks',
+                      replace_existing=True, max_instances=1)
+    scheduler.add_job(_monitored(backfill_calendar_games), 'interval', minutes=2, id='backfill_calendar',
+                      replace_existing=True, max_instances=1)
+    scheduler.add_job(_monitored(compact_odds), 'interval', hours=1, id='compact_odds',
+                      replace_existing=True, max_instances=1)
+    scheduler.add_job(_monitored(build_projections), 'interval', minutes=30, id='build_projections',
                       replace_existing=True, max_instances=1)
-    scheduler.add_job(ingest_box_scores, 'interval', minutes=5, id='ingest_boxscores',
+    scheduler.add_job(_monitored(build_missing_projections), 'interval', minutes=2, id='build_missing_projections',
                       replace_existing=True, max_instances=1)
-    scheduler.add_job(grade_picks, 'interval', minutes=10, id='grade_picks',
+    scheduler.add_job(_monitored(process_enrichment_requests), 'interval', seconds=30, id='enrich_player_search',
                       replace_existing=True, max_instances=1)
-    scheduler.add_job(backfill_calendar_games, 'interval', minutes=2, id='backfill_calendar',
+    scheduler.add_job(_monitored(run_model_jobs), 'interval', seconds=10, id='run_model_jobs',
                       replace_existing=True, max_instances=1)
-    scheduler.add_job(daily_retrain, 'cron', hour=6, minute=0, id='daily_retrain',
+    scheduler.add_job(_monitored(daily_retrain), 'cron', hour=6, minute=0, id='daily_retrain',
                       replace_existing=True, max_instances=1)
     scheduler.start()
     logger.info("Scheduler started")
 
     import threading
-    threading.Thread(target=seed_historical_games, daemon=True).start()
-    threading.Thread(target=seed_team_rosters, daemon=True).start()
+    threading.Thread(target=_monitored(seed_historical_games), daemon=True).start()
+    threading.Thread(target=_monitored(seed_team_rosters), daemon=True).start()
@@ -0,0 +1,171 @@
+import logging
+import os
+import signal
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from backend.db.models import init_db, engine
+from backend.db.lease import (
+    SCHEDULER_LEASE, LEASE_SECONDS, holder_id, acquire_lease, release_lease, set_leadership, publish_status
+)
+from backend.db.perf import instrument_engine
+from backend.metrics import CONTENT_TYPE, render_metrics, gauge
+from backend.jobs.monitor import job_health, recent_profiles
+from backend.jobs.scheduler import scheduler, start_scheduler, live_cadence
+
+logger = logging.getLogger(__name__)
+
+RENEW_SECONDS = max(1, LEASE_SECONDS // 3)
+
+_state = {"holder": None, "leading": False, "started": False, "seeded_at": None, "started_at": None}
+_lock = threading.Lock()
+_startup = {}
+_embedded = {}
+
+gauge("nba_scheduler_leader", "1 when this process holds the scheduler lease",
+      callback=lambda: [((), 1 if _state["leading"] else 0)])
+
+
+def _start_jobs():
+    from backend.db.seed import seed_database
+    from backend.models.ml_models import ensure_default_model
+    try:
+        seed_database()
+        ensure_default_model()
+        _state["seeded_at"] = datetime.utcnow().isoformat()
+    except Exception as e:
+        logger.error(f"Seeding before scheduler start failed: {e}")
+    with _lock:
+        if _state["leading"] and not _state["started"]:
+            start_scheduler()
+            _state.update(started=True, started_at=datetime.utcnow().isoformat())
+
+
+def _become_leader():
+    with _lock:
+        _state["leading"] = True
+        set_leadership(True)
+        if _state["started"]:
+            scheduler.resume()
+        elif _startup.get("thread") is None or not _startup["thread"].is_alive():
+            _startup["thread"] = threading.Thread(target=_start_jobs, daemon=True, name="scheduler-startup")
+            _startup["thread"].start()
+    logger.info(f"Acquired scheduler lease as {_state['holder']}")
+
+
+def _step_down():
+    with _lock:
+        if scheduler.running:
+            scheduler.pause()
+        _state["leading"] = False
+        set_leadership(False)
+    logger.warning(f"Lost scheduler lease, pausing jobs on {_state['holder']}")
+
+
+def scheduler_status():
+    return {
+        "scheduler_running": scheduler.running,
+        "live_cadence": live_cadence(),
+        "jobs": job_health(scheduler),
+        "profiles": recent_profiles(),
+    }
+
+
+def run_leader_loop(stop_event, holder=None, renew_seconds=RENEW_SECONDS):
+    _state["holder"] = holder or holder_id()
+    try:
+        while not stop_event.is_set():
+            try:
+                acquired = acquire_lease(_state["holder"], SCHEDULER_LEASE)
+            except Exception as e:
+                logger.error(f"Scheduler lease check failed: {e}")
+                acquired = False
+            if acquired and not _state["leading"]:
+                _become_leader()
+            elif not acquired and _state["leading"]:
+                _step_down()
+            if acquired:
+                try:
+                    publish_status(_state["holder"], scheduler_status(), SCHEDULER_LEASE)
+                except Exception as e:
+                    logger.error(f"Publishing scheduler status failed: {e}")
+            stop_event.wait(renew_seconds)
+    finally:
+        with _lock:
+            was_leading = _state["leading"]
+            _state.update(leading=False, started=False)
+            set_leadership(False)
+        if scheduler.running:
+            scheduler.shutdown(wait=False)
+        if was_leading:
+            release_lease(_state["holder"], SCHEDULER_LEASE)
+            logger.info(f"Released scheduler lease held by {_state['holder']}")
+
+
+def is_leader():
+    return _state["leading"]
+
+
+def leader_state():
+    return {k: _state[k] for k in ("holder", "leading", "started", "seeded_at", "started_at")}
+
+
+def start_embedded_scheduler():
+    if _embedded.get("thread") is not None:
+        return
+    stop_event = threading.Event()
+    thread = threading.Thread(target=run_leader_loop, args=(stop_event,), daemon=True, name="scheduler-leader")
+    thread.start()
+    _embedded.update(thread=thread, stop=stop_event)
+
+
+def stop_embedded_scheduler(timeout=5):
+    thread = _embedded.pop("thread", None)
+    stop_event = _embedded.pop("stop", None)
+    if thread is None:
+        return
+    stop_event.set()
+    thread.join(timeout)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve_metrics(port):
+    server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True, name="worker-metrics").start()
+    logger.info(f"Worker metrics on :{port}/metrics")
+    return server
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    init_db()
+    instrument_engine(engine)
+    metrics_port = os.environ.get("WORKER_METRICS_PORT")
+    server = _serve_metrics(int(metrics_port)) if metrics_port else None
+
+    stop_event = threading.Event()
+
+    def _stop(signum, frame):
+        logger.info(f"Received signal {signum}, shutting down worker")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    run_leader_loop(stop_event)
+    if server is not None:
+        server.shutdown()
@@ -1,14 +1,15 @@
 import logging
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from backend.db.models import init_db
-from backend.db.seed import seed_database
+from fastapi.responses import FileResponse, Response
+from backend.db.models import init_db, engine
+from backend.db.perf import instrument_engine, start_tracking, finish_tracking, server_timing
+from backend.metrics import HTTP_REQUESTS, HTTP_LATENCY, HTTP_QUERIES, CONTENT_TYPE, render_metrics
 from backend.api.routes import router
 from backend.api.auth import router as auth_router
-from backend.jobs.scheduler import start_scheduler
+from backend.startup import start_background_startup, stop_background_services
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -26,15 +27,48 @@ app.add_middleware(
 app.include_router(auth_router)
 app.include_router(router)
 
+instrument_engine(engine)
+
+
+@app.middleware("http")
+async def track_queries(request: Request, call_next):
+    if not request.url.path.startswith(("/api", "/auth")):
+        return await call_next(request)
+    stats, token = start_tracking("route", request.url.path)
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        route = _route_label(request)
+        finish_tracking(stats, token, f"{request.method} {route}")
+        HTTP_REQUESTS.inc(request.method, route, status)
+        HTTP_LATENCY.observe(stats["total_ms"] / 1000, request.method, route)
+        HTTP_QUERIES.observe(stats["queries"], route)
+    response.headers["Server-Timing"] = server_timing(stats)
+    return response
+
+
+def _route_label(request):
+    return getattr(request.scope.get("route"), "path", "<unmatched>")
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
 
 @app.on_event("startup")
 def startup():
     logger.info("Initializing database...")
     init_db()
-    seed_database()
-    logger.info("Starting scheduler...")
-    start_scheduler()
-    logger.info("App ready!")
+    start_background_startup()
+    logger.info("Serving requests; warm-up continues in the background")
+
+
+@app.on_event("shutdown")
+def shutdown():
+    stop_background_services()
 
 
 FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend", "dist")
@@ -0,0 +1,216 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {labels}")
+        return tuple(str(v) for v in labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key, value):
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labels=(), callback=None):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def set(self, value, *labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(self._key(labels), 0)
+
+    def render(self):
+        if self.callback is not None:
+            try:
+                for labels, value in self.callback():
+                    self.set(value, *labels)
+            except Exception as e:
+                logger.error(f"Gauge callback for {self.name} failed: {e}")
+        return super().render()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def time(self, *labels):
+        return _Timer(self, labels)
+
+    def count(self, *labels):
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def _render_value(self, key, value):
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+        labels = _format_labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+        return False
+
+
+def _register(metric):
+    with _registry_lock:
+        existing = _registry.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                raise ValueError(f"Metric {metric.name} already registered with a different shape")
+            return existing
+        _registry[metric.name] = metric
+        return metric
+
+
+def counter(name, documentation, labels=()):
+    return _register(Counter(name, documentation, labels))
+
+
+def gauge(name, documentation, labels=(), callback=None):
+    return _register(Gauge(name, documentation, labels, callback))
+
+
+def histogram(name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+    return _register(Histogram(name, documentation, labels, buckets))
+
+
+def render_metrics():
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda m: m.name)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+HTTP_REQUESTS = counter("nba_http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+HTTP_LATENCY = histogram("nba_http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+HTTP_QUERIES = histogram("nba_http_request_db_queries", "SQL statements per HTTP request", ("route",),
+                         QUERY_COUNT_BUCKETS)
+JOB_RUNS = counter("nba_scheduler_job_runs_total", "Scheduler job runs by outcome", ("job", "status"))
+JOB_DURATION = histogram("nba_scheduler_job_duration_seconds", "Scheduler job duration", ("job",),
+                         DEFAULT_BUCKETS + (120.0, 300.0, 900.0))
+JOB_LAST_SUCCESS = gauge("nba_scheduler_job_last_success_timestamp_seconds",
+                         "Unix time of each job's last successful run", ("job",))
+JOB_PHASE_SECONDS = counter("nba_scheduler_job_phase_seconds_total", "Job time spent in DB, HTTP and on CPU",
+                            ("job", "phase"))
+JOB_SKIPPED = counter("nba_scheduler_job_skipped_total", "Job runs skipped or missed by the scheduler",
+                      ("job", "reason"))
+JOB_OVERRUNS = counter("nba_scheduler_job_overruns_total", "Job runs that outlasted their interval", ("job",))
+LIVE_POLL_INTERVAL = gauge("nba_live_poll_interval_seconds", "Current interval of the live game poll")
+BDL_REQUESTS = counter("nba_bdl_requests_total", "BallDontLie API responses by endpoint and status",
+                       ("endpoint", "status"))
+BDL_LATENCY = histogram("nba_bdl_request_duration_seconds", "BallDontLie API request latency", ("endpoint",))
+CACHE_REQUESTS = counter("nba_cache_requests_total", "In-process cache lookups", ("cache", "result"))
+INGESTED_ROWS = counter("nba_ingested_rows_total", "Rows written by ingest jobs", ("kind",))
+MODEL_PREDICTIONS = histogram("nba_model_prediction_duration_seconds", "Batch model prediction latency",
+                              ("model",), FAST_BUCKETS)
+MODEL_PREDICTION_ROWS = counter("nba_model_prediction_rows_total", "Rows scored by each model", ("model",))
@@ -0,0 +1,74 @@
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 2
+ARTIFACT_SUFFIX = ".json"
+MODEL_KINDS = ("logistic", "linear")
+
+
+def artifact_hash(kind, coef, intercept, schema):
+    payload = json.dumps({"kind": kind, "coef": list(coef), "intercept": intercept, "schema": schema},
+                         sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def artifact_from_estimator(estimator, name, kind, schema):
+    coef = [float(c) for c in np.ravel(estimator.coef_)]
+    intercept = float(np.ravel(estimator.intercept_)[0])
+    return build_artifact(name, kind, coef, intercept, schema)
+
+
+def build_artifact(name, kind, coef, intercept, schema):
+    if kind not in MODEL_KINDS:
+        raise ValueError(f"Unknown model kind: {kind}")
+    if len(coef) != len(schema["features"]):
+        raise ValueError(f"{name}: {len(coef)} coefficients for {len(schema['features'])} features")
+    return {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "name": name,
+        "kind": kind,
+        "schema": schema,
+        "coef": list(coef),
+        "intercept": intercept,
+        "trained_at": datetime.utcnow().isoformat(),
+        "sha256": artifact_hash(kind, coef, intercept, schema),
+    }
+
+
+def artifact_path(directory, name):
+    return os.path.join(directory, f"{name}{ARTIFACT_SUFFIX}")
+
+
+def write_artifact(directory, artifact):
+    os.makedirs(directory, exist_ok=True)
+    path = artifact_path(directory, artifact["name"])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(artifact, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_artifact(path):
+    with open(path) as f:
+        artifact = json.load(f)
+    if artifact.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported artifact format {artifact.get('format_version')}")
+    expected = artifact_hash(artifact["kind"], artifact["coef"], artifact["intercept"], artifact["schema"])
+    if artifact.get("sha256") != expected:
+        raise ValueError(f"{path}: artifact hash mismatch")
+    artifact["coef_array"] = np.asarray(artifact["coef"], dtype=float)
+    return artifact
+
+
+def predict(artifact, X):
+    z = np.asarray(X, dtype=float) @ artifact["coef_array"] + artifact["intercept"]
+    if artifact["kind"] == "logistic":
+        return 1.0 / (1.0 + np.exp(-z))
+    return z
@@ -0,0 +1,108 @@
+import numpy as np
+from sqlalchemy import or_
+from backend.db.models import DimGame, DimTeam, FactOddsLatest
+from backend.db.game_state import STATE_FINAL
+from backend.features.consensus import load_latest_props
+from backend.models.ml_models import predict_win_probabilities, predict_player_props, PLAYER_PROP_TYPES
+from backend.models.pricing import implied_probability, expected_value, prop_side_probabilities
+
+
+def _moneyline_candidates(db, games):
+    odds_rows = db.query(FactOddsLatest).filter(
+        FactOddsLatest.game_id.in_([g.id for g in games])
+    ).all()
+    if not odds_rows:
+        return [], [], []
+
+    home_probs = dict(zip(
+        [g.id for g in games],
+        predict_win_probabilities([(g.home_team_id, g.visitor_team_id) for g in games]).tolist(),
+    ))
+    by_id = {g.id: g for g in games}
+    team_ids = {t for g in games for t in (g.home_team_id, g.visitor_team_id)}
+    teams = {t.id: t for t in db.query(DimTeam).filter(DimTeam.id.in_(team_ids))}
+
+    meta, probs, odds = [], [], []
+    for row in odds_rows:
+        game = by_id[row.game_id]
+        for side, price, prob, team_id in (
+            ("home", row.home_odds, home_probs[row.game_id], game.home_team_id),
+            ("away", row.away_odds, 1 - home_probs[row.game_id], game.visitor_team_id),
+        ):
+            if not price:
+                continue
+            team = teams.get(team_id)
+            meta.append({
+                "market": "moneyline", "game_id": row.game_id, "vendor": row.vendor, "side": side,
+                "selection": team.full_name if team else side, "team_id": team_id,
+            })
+            probs.append(prob)
+            odds.append(price)
+    return meta, probs, odds
+
+
+def _prop_candidates(db, games):
+    rows = [r for r in load_latest_props(db, [g.id for g in games]) if r.prop_type in PLAYER_PROP_TYPES]
+    if not rows:
+        return [], [], []
+
+    projections = predict_player_props({r.player_id for r in rows}, sorted({r.prop_type for r in rows}))
+    rows = [r for r in rows if (r.player_id, r.prop_type) in projections]
+    if not rows:
+        return [], [], []
+
+    projection = np.array([projections[(r.player_id, r.prop_type)] for r in rows])
+    over, under = prop_side_probabilities(projection, [r.line for r in rows])
+
+    meta, probs, odds = [], [], []
+    for i, r in enumerate(rows):
+        for side, price, prob in (("over", r.over_odds, over[i]), ("under", r.under_odds, under[i])):
+            if not price:
+                continue
+            meta.append({
+                "market": "player_prop", "game_id": r.game_id, "vendor": r.vendor, "side": side,
+                "selection": f"{r.player_name} {side} {r.line} {r.prop_type}",
+                "player_id": r.player_id, "player_name": r.player_name, "prop_type": r.prop_type,
+                "line": r.line, "projection": round(float(projection[i]), 1),
+            })
+            probs.append(float(prob))
+            odds.append(price)
+    return meta, probs, odds
+
+
+def scan_slate(db, game_date, top=25, min_edge=0.0, include_props=True):
+    games = db.query(DimGame).filter(
+        DimGame.date == game_date, or_(DimGame.state.is_(None), DimGame.state != STATE_FINAL)
+    ).all()
+    if not games:
+        return []
+
+    meta, probs, odds = _moneyline_candidates(db, games)
+    if include_props:
+        prop_meta, prop_probs, prop_odds = _prop_candidates(db, games)
+        meta += prop_meta
+        probs += prop_probs
+        odds += prop_odds
+    if not meta:
+        return []
+
+    probs = np.array(probs, dtype=float)
+    odds = np.array(odds, dtype=float)
+    implied = implied_probability(odds)
+    edge = probs - implied
+    ev = expected_value(probs, odds)
+
+    candidates = np.flatnonzero(edge >= min_edge)
+    ranked = candidates[np.argsort(-ev[candidates], kind="stable")][:top]
+
+    results = []
+    for i in ranked.tolist():
+        results.append({
+            **meta[i],
+            "odds": float(odds[i]),
+            "implied_probability": round(float(implied[i]), 4),
+            "model_probability": round(float(probs[i]), 4),
+            "edge": round(float(edge[i]), 4),
+            "expected_value": round(float(ev[i]), 4),
+        })
+    return results
@@ -1,216 +1,163 @@
 import os
-import pickle
 import logging
+import time
 import numpy as np
-from datetime import datetime
-from sklearn.linear_model import LogisticRegression, LinearRegression
-from sklearn.metrics import brier_score_loss, mean_absolute_error
-from backend.db.models import (
-    SessionLocal, DimGame, DimTeam, FactBoxScore, ModelMetrics, FeatureStore
+from backend.db.models import SessionLocal, ModelMetrics
+from backend.features.engineering import load_team_rolling_stats, load_rolling_stats
+from backend.features.schema import schema_info, schema_for_model, validate_schema, build_matrix
+from backend.metrics import CACHE_REQUESTS, MODEL_PREDICTIONS, MODEL_PREDICTION_ROWS
+from backend.models.artifacts import (
+    artifact_path, artifact_from_estimator, write_artifact, read_artifact, predict as predict_artifact
 )
-from backend.features.engineering import compute_team_rolling_stats, compute_player_rolling_stats
 
 logger = logging.getLogger(__name__)
-MODELS_DIR = "model_artifacts"
-os.makedirs(MODELS_DIR, exist_ok=True)
+MODELS_DIR = os.environ.get("MODEL_ARTIFACTS_DIR", "model_artifacts")
 
+_artifact_cache = {}
+_fallback_models = {}
 
-def _save_model(model, name):
-    path = os.path.join(MODELS_DIR, f"{name}.pkl")
-    with open(path, "wb") as f:
-        pickle.dump(model, f)
 
+def _save_model(artifact):
+    write_artifact(MODELS_DIR, artifact)
 
-def _load_model(name):
-    path = os.path.join(MODELS_DIR, f"{name}.pkl")
-    if os.path.exists(path):
-        with open(path, "rb") as f:
-            return pickle.load(f)
-    return None
 
+def publish_models(artifacts):
+    for artifact in artifacts.values():
+        write_artifact(MODELS_DIR, artifact)
 
-def train_win_probability_model():
-    db = SessionLocal()
+
+def _artifact_mtime(name):
     try:
-        games = db.query(DimGame).filter(
-            DimGame.status.in_(["Final", "final"]),
-            DimGame.home_team_score > 0
-        ).order_by(DimGame.date.desc()).limit(200).all()
-
-        if len(games) < 10:
-            logger.warning("Not enough games to train win probability model")
-            _create_default_model()
-            return {"status": "created_default", "games": len(games)}
-
-        X, y = [], []
-        for game in games:
-            home_feats = compute_team_rolling_stats(game.home_team_id)
-            away_feats = compute_team_rolling_stats(game.visitor_team_id)
-            if not home_feats or not away_feats:
-                continue
-
-            features = [
-                home_feats.get("win_pct", 0.5) - away_feats.get("win_pct", 0.5),
-                home_feats.get("net_rating", 0) - away_feats.get("net_rating", 0),
-                home_feats.get("avg_scored", 100) - away_feats.get("avg_scored", 100),
-                home_feats.get("avg_fg_pct", 0.45) - away_feats.get("avg_fg_pct", 0.45),
-                0.03,
-            ]
-            X.append(features)
-            y.append(1 if game.home_team_score > game.visitor_team_score else 0)
-
-        if len(X) < 5:
-            _create_default_model()
-            return {"status": "created_default", "games": len(X)}
-
-        X = np.array(X)
-        y = np.array(y)
-        model = LogisticRegression(max_iter=1000)
-        model.fit(X, y)
-        _save_model(model, "win_probability")
-
-        preds = model.predict_proba(X)[:, 1]
-        brier = brier_score_loss(y, preds)
-        accuracy = np.mean((preds > 0.5) == y)
-
-        db.add(ModelMetrics(
-            model_name="win_probability", metric_name="brier_score",
-            metric_value=brier, sample_size=len(y), trained_at=datetime.utcnow()
-        ))
-        db.add(ModelMetrics(
-            model_name="win_probability", metric_name="accuracy",
-            metric_value=accuracy, sample_size=len(y), trained_at=datetime.utcnow()
-        ))
-        db.commit()
-        return {"status": "trained", "brier": brier, "accuracy": accuracy, "games": len(y)}
-    finally:
-        db.close()
+        return os.stat(artifact_path(MODELS_DIR, name)).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
-def _create_default_model():
+def _load_model(name):
+    path = artifact_path(MODELS_DIR, name)
+    mtime = _artifact_mtime(name)
+    if mtime is None:
+        return None
+    cached = _artifact_cache.get(name)
+    if cached and cached[0] == mtime:
+        CACHE_REQUESTS.inc("model_artifacts", "hit")
+        return cached[1]
+    CACHE_REQUESTS.inc("model_artifacts", "miss")
+    try:
+        artifact = read_artifact(path)
+        validate_schema(artifact["schema"], schema_for_model(name))
+    except (ValueError, KeyError) as e:
+        logger.error(f"Rejecting model artifact {name}: {e}")
+        return None
+    _artifact_cache[name] = (mtime, artifact)
+    return artifact
+
+
+def _default_win_artifact():
+    from sklearn.linear_model import LogisticRegression
+
     model = LogisticRegression(max_iter=1000)
     X_dummy = np.array([[0.1, 5, 3, 0.02, 0.03], [-0.1, -5, -3, -0.02, 0.03],
                         [0.2, 8, 5, 0.04, 0.03], [-0.2, -8, -5, -0.04, 0.03]])
     y_dummy = np.array([1, 0, 1, 0])
     model.fit(X_dummy, y_dummy)
-    _save_model(model, "win_probability")
+    return artifact_from_estimator(model, "win_probability", "logistic", schema_info("win_matchup"))
 
 
-def predict_win_probability(home_team_id, away_team_id):
-    model = _load_model("win_probability")
-    if model is None:
+def _create_default_model():
+    _save_model(_default_win_artifact())
+
+
+def ensure_default_model():
+    if _load_model("win_probability") is None:
         _create_default_model()
-        model = _load_model("win_probability")
+        logger.info("Created default win probability model")
 
-    home_feats = compute_team_rolling_stats(home_team_id)
-    away_feats = compute_team_rolling_stats(away_team_id)
 
-    if not home_feats:
-        home_feats = {"win_pct": 0.5, "net_rating": 0, "avg_scored": 100, "avg_fg_pct": 0.45}
-    if not away_feats:
-        away_feats = {"win_pct": 0.5, "net_rating": 0, "avg_scored": 100, "avg_fg_pct": 0.45}
+def _fallback_win_model():
+    model = _fallback_models.get("win_probability")
+    if model is None:
+        model = _default_win_artifact()
+        model["coef_array"] = np.asarray(model["coef"], dtype=float)
+        _fallback_models["win_probability"] = model
+    return model
 
-    features = np.array([[
-        home_feats.get("win_pct", 0.5) - away_feats.get("win_pct", 0.5),
-        home_feats.get("net_rating", 0) - away_feats.get("net_rating", 0),
-        home_feats.get("avg_scored", 100) - away_feats.get("avg_scored", 100),
-        home_feats.get("avg_fg_pct", 0.45) - away_feats.get("avg_fg_pct", 0.45),
-        0.03,
-    ]])
 
-    prob = model.predict_proba(features)[0]
-    return {"home_win_prob": float(prob[1]), "away_win_prob": float(prob[0])}
+PLAYER_PROP_TYPES = ["PTS", "REB", "AST", "STL", "BLK"]
+MODEL_NAMES = ["win_probability"] + [f"player_prop_{p.lower()}" for p in PLAYER_PROP_TYPES]
 
 
-def train_player_prop_model(prop_type="PTS"):
-    db = SessionLocal()
-    try:
-        box_scores = db.query(FactBoxScore).filter(
-            FactBoxScore.pts > 0
-        ).order_by(FactBoxScore.id.desc()).limit(1000).all()
-
-        if len(box_scores) < 10:
-            return {"status": "insufficient_data"}
-
-        X, y = [], []
-        for bs in box_scores:
-            player_feats = compute_player_rolling_stats(bs.player_id)
-            if not player_feats:
-                continue
-            target_map = {
-                "PTS": bs.pts, "REB": bs.reb, "AST": bs.ast,
-                "STL": bs.stl, "BLK": bs.blk, "FG3M": bs.fg3m,
-            }
-            target = target_map.get(prop_type, bs.pts)
-            if target is None:
-                continue
-            X.append([
-                player_feats.get("avg_pts", 0),
-                player_feats.get("avg_reb", 0),
-                player_feats.get("avg_ast", 0),
-                player_feats.get("avg_stl", 0),
-                player_feats.get("avg_blk", 0),
-                player_feats.get("avg_fg_pct", 0),
-                player_feats.get("avg_fg3m", 0),
-            ])
-            y.append(target)
-
-        if len(X) < 5:
-            return {"status": "insufficient_data"}
-
-        X = np.array(X)
-        y = np.array(y, dtype=float)
-        model = LinearRegression()
-        model.fit(X, y)
-        _save_model(model, f"player_prop_{prop_type.lower()}")
-
-        preds = model.predict(X)
-        mae = mean_absolute_error(y, preds)
-
-        db.add(ModelMetrics(
-            model_name=f"player_prop_{prop_type.lower()}",
-            metric_name="mae", metric_value=mae,
-            sample_size=len(y), trained_at=datetime.utcnow()
-        ))
-        db.commit()
-        return {"status": "trained", "mae": mae, "samples": len(y)}
-    finally:
-        db.close()
+def model_version():
+    return tuple(_artifact_mtime(name) for name in MODEL_NAMES)
 
 
-def predict_player_prop(player_id, prop_type="PTS"):
-    model = _load_model(f"player_prop_{prop_type.lower()}")
-    if model is None:
-        return None
+def warm_models():
+    return sum(1 for name in MODEL_NAMES if _load_model(name) is not None)
+
 
-    player_feats = compute_player_rolling_stats(player_id)
+def predict_win_probabilities(matchups, features=None):
+    if not matchups:
+        return np.zeros(0)
+    model = _load_model("win_probability") or _fallback_win_model()
+
+    started = time.perf_counter()
+    team_ids = sorted({t for pair in matchups for t in pair})
+    position = {team_id: i for i, team_id in enumerate(team_ids)}
+    if features is None:
+        db = SessionLocal()
+        try:
+            features = load_team_rolling_stats(db, team_ids)
+        finally:
+            db.close()
+    rows = [features.get(team_id, {}) for team_id in team_ids]
+    X = build_matrix(model["schema"]["name"], rows, [(position[h], position[a]) for h, a in matchups])
+    probs = predict_artifact(model, X)
+    MODEL_PREDICTIONS.observe(time.perf_counter() - started, "win_probability")
+    MODEL_PREDICTION_ROWS.inc("win_probability", amount=len(matchups))
+    return probs
+
+
+def predict_win_probability(home_team_id, away_team_id):
+    home_prob = float(predict_win_probabilities([(home_team_id, away_team_id)])[0])
+    return {"home_win_prob": home_prob, "away_win_prob": 1 - home_prob}
+
+
+def predict_player_props(player_ids, prop_types=PLAYER_PROP_TYPES, features=None):
+    player_ids = set(player_ids)
+    if features is None:
+        db = SessionLocal()
+        try:
+            features = load_rolling_stats(db, player_ids)
+        finally:
+            db.close()
+    player_feats = {pid: features[pid] for pid in player_ids if features.get(pid)}
     if not player_feats:
-        return None
+        return {}
+
+    ordered = sorted(player_feats)
+    rows = [player_feats[pid] for pid in ordered]
+    matrices = {}
+    predictions = {}
+    for prop_type in prop_types:
+        name = f"player_prop_{prop_type.lower()}"
+        model = _load_model(name)
+        if model is None:
+            continue
+        started = time.perf_counter()
+        schema = model["schema"]["name"]
+        if schema not in matrices:
+            matrices[schema] = build_matrix(schema, rows)
+        X = matrices[schema]
+        preds = np.maximum(predict_artifact(model, X), 0)
+        for pid, pred in zip(ordered, preds.tolist()):
+            predictions[(pid, prop_type)] = float(pred)
+        MODEL_PREDICTIONS.observe(time.perf_counter() - started, name)
+        MODEL_PREDICTION_ROWS.inc(name, amount=len(ordered))
+    return predictions
 
-    expected_features = model.n_features_in_ if hasattr(model, 'n_features_in_') else 7
-    if expected_features == 5:
-        X = np.array([[
-            player_feats.get("avg_pts", 0),
-            player_feats.get("avg_reb", 0),
-            player_feats.get("avg_ast", 0),
-            player_feats.get("avg_fg_pct", 0),
-            player_feats.get("avg_fg3m", 0),
-        ]])
-    else:
-        X = np.array([[
-            player_feats.get("avg_pts", 0),
-            player_feats.get("avg_reb", 0),
-            player_feats.get("avg_ast", 0),
-            player_feats.get("avg_stl", 0),
-            player_feats.get("avg_blk", 0),
-            player_feats.get("avg_fg_pct", 0),
-            player_feats.get("avg_fg3m", 0),
-        ]])
-    try:
-        pred = model.predict(X)[0]
-        return max(0, float(pred))
-    except Exception:
-        return None
+
+def predict_player_prop(player_id, prop_type="PTS"):
+    return predict_player_props([player_id], [prop_type]).get((player_id, prop_type))
 
 
 def get_model_health():
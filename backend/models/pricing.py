@@ -0,0 +1,32 @@
+import numpy as np
+
+DISCLAIMER = "For informational and educational purposes only. Not financial advice."
+
+
+def implied_probability(odds):
+    odds = np.asarray(odds, dtype=float)
+    abs_odds = np.abs(odds)
+    return np.where(odds > 0, 100 / (abs_odds + 100), abs_odds / (abs_odds + 100))
+
+
+def payout_multiplier(odds):
+    odds = np.asarray(odds, dtype=float)
+    abs_odds = np.abs(odds)
+    underdog = np.divide(odds, 100, out=np.zeros_like(odds), where=odds > 0)
+    favorite = np.divide(100, abs_odds, out=np.zeros_like(odds), where=abs_odds > 0)
+    return 1 + np.where(odds > 0, underdog, favorite)
+
+
+def expected_value(prob, odds):
+    prob = np.asarray(prob, dtype=float)
+    return prob * (payout_multiplier(odds) - 1) - (1 - prob)
+
+
+def prop_side_probabilities(projection, line):
+    from scipy.special import pdtr, pdtrc
+
+    mu = np.maximum(np.asarray(projection, dtype=float), 0.01)
+    line = np.asarray(line, dtype=float)
+    over = pdtrc(np.floor(line), mu)
+    under = pdtr(np.ceil(line) - 1, mu)
+    return over, under
@@ -0,0 +1,194 @@
+import os
+import logging
+import multiprocessing
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from sqlalchemy import func
+from backend.db.models import SessionLocal, DimGame, FactBoxScore, ModelMetrics
+from backend.models.ml_models import (
+    PLAYER_PROP_TYPES, publish_models
+)
+from backend.features.engineering import (
+    TEAM_ROLLING_GAMES, COMPLETED_GAME, team_fg_pct_by_game, team_result, team_features
+)
+from backend.features.schema import schema_info, schema_for_model, build_matrix
+from backend.models.artifacts import artifact_from_estimator
+
+logger = logging.getLogger(__name__)
+
+TRAINING_WORKERS = int(os.environ.get("TRAINING_WORKERS", "0")) or min(6, os.cpu_count() or 1)
+ROLLING_GAMES = 10
+VALIDATION_FRACTION = 0.2
+MIN_VALIDATION_SAMPLES = 5
+MIN_TRAINING_SAMPLES = 5
+PARALLEL_MIN_SAMPLES = 5000
+MAX_PROP_SAMPLES = 20000
+
+PLAYER_STAT_COLUMNS = ["pts", "reb", "ast", "stl", "blk", "fg_pct", "fg3m"]
+PLAYER_FEATURE_SOURCES = [f"avg_{c}" for c in PLAYER_STAT_COLUMNS]
+PROP_TARGET_COLUMNS = {"PTS": "pts", "REB": "reb", "AST": "ast", "STL": "stl", "BLK": "blk"}
+
+
+def build_win_dataset(db):
+    team_fg = team_fg_pct_by_game(db)
+    games = db.query(
+        DimGame.id, DimGame.date, DimGame.home_team_id, DimGame.visitor_team_id,
+        DimGame.home_team_score, DimGame.visitor_team_score,
+    ).filter(COMPLETED_GAME).order_by(DimGame.date, DimGame.id).all()
+
+    history = {}
+    rows, y, dates = [], [], []
+    for g in games:
+        home = history.setdefault(g.home_team_id, deque(maxlen=TEAM_ROLLING_GAMES))
+        away = history.setdefault(g.visitor_team_id, deque(maxlen=TEAM_ROLLING_GAMES))
+        home_result = team_result(g.home_team_score, g.visitor_team_score, team_fg.get((g.id, g.home_team_id)))
+        if home and away:
+            rows.append(team_features(home))
+            rows.append(team_features(away))
+            y.append(1 if home_result[2] else 0)
+            dates.append(g.date)
+        home.append(home_result)
+        away.append(team_result(g.visitor_team_score, g.home_team_score, team_fg.get((g.id, g.visitor_team_id))))
+
+    pairs = [(2 * i, 2 * i + 1) for i in range(len(y))]
+    X = build_matrix(schema_for_model("win_probability"), rows, pairs)
+    return {"X": X, "y": np.array(y, dtype=float), "dates": dates}
+
+
+def build_prop_dataset(db):
+    box_scores = db.query(
+        FactBoxScore.player_id, DimGame.date,
+        *[func.coalesce(getattr(FactBoxScore, c), 0) for c in PLAYER_STAT_COLUMNS],
+    ).outerjoin(DimGame, DimGame.id == FactBoxScore.game_id).filter(
+        FactBoxScore.player_id.isnot(None)
+    ).order_by(DimGame.date, FactBoxScore.id).all()
+
+    windows, sums = {}, {}
+    rows, targets, dates = [], [], []
+    for r in box_scores:
+        stats = np.array(r[2:], dtype=float)
+        window = windows.setdefault(r.player_id, deque())
+        if window and stats[0] > 0:
+            mean = sums[r.player_id] / len(window)
+            rows.append(dict(zip(PLAYER_FEATURE_SOURCES, mean.tolist())))
+            targets.append(stats[:5])
+            dates.append(r.date)
+        window.append(stats)
+        sums[r.player_id] = sums.get(r.player_id, 0) + stats
+        if len(window) > ROLLING_GAMES:
+            sums[r.player_id] = sums[r.player_id] - window.popleft()
+
+    X = build_matrix(schema_for_model("player_prop_pts"), rows[-MAX_PROP_SAMPLES:])
+    targets = np.array(targets[-MAX_PROP_SAMPLES:], dtype=float).reshape(-1, 5)
+    return {
+        "X": X,
+        "targets": {prop: targets[:, i] for i, prop in enumerate(PROP_TARGET_COLUMNS)},
+        "dates": dates[-MAX_PROP_SAMPLES:],
+    }
+
+
+def build_training_dataset(db):
+    return {"win": build_win_dataset(db), "props": build_prop_dataset(db)}
+
+
+def time_split(n, validation_fraction=VALIDATION_FRACTION):
+    n_val = int(n * validation_fraction)
+    if n_val < MIN_VALIDATION_SAMPLES or n - n_val < MIN_TRAINING_SAMPLES:
+        return n, False
+    return n - n_val, True
+
+
+def _fit_model(task):
+    from sklearn.linear_model import LogisticRegression, LinearRegression
+    from sklearn.metrics import brier_score_loss, mean_absolute_error
+
+    X, y, kind = task["X"], task["y"], task["kind"]
+    split, held_out = time_split(len(y))
+    X_val, y_val = (X[split:], y[split:]) if held_out else (X, y)
+
+    def _new():
+        return LogisticRegression(max_iter=1000) if kind == "classifier" else LinearRegression()
+
+    model = _new().fit(X[:split], y[:split])
+    if kind == "classifier":
+        preds = model.predict_proba(X_val)[:, 1]
+        metrics = {"brier_score": float(brier_score_loss(y_val, preds)),
+                   "accuracy": float(np.mean((preds > 0.5) == y_val))}
+    else:
+        metrics = {"mae": float(mean_absolute_error(y_val, model.predict(X_val)))}
+
+    if held_out:
+        model = _new().fit(X, y)
+    artifact = artifact_from_estimator(
+        model, task["name"], "logistic" if kind == "classifier" else "linear", task["schema"]
+    )
+    return task["name"], artifact, {
+        "status": "trained", **metrics, "samples": int(len(y)),
+        "validation_samples": int(len(y_val)), "validation": "time_holdout" if held_out else "in_sample",
+    }
+
+
+def _training_tasks(dataset):
+    tasks, skipped = [], {}
+    win = dataset["win"]
+    if len(win["y"]) >= MIN_TRAINING_SAMPLES and len(set(win["y"].tolist())) > 1:
+        tasks.append({"name": "win_probability", "kind": "classifier",
+                      "schema": schema_info(schema_for_model("win_probability")),
+                      "X": win["X"], "y": win["y"]})
+    else:
+        skipped["win_probability"] = {"status": "insufficient_data", "samples": int(len(win["y"]))}
+
+    props = dataset["props"]
+    for prop in PLAYER_PROP_TYPES:
+        name = f"player_prop_{prop.lower()}"
+        if len(props["X"]) >= MIN_TRAINING_SAMPLES:
+            tasks.append({"name": name, "kind": "regressor", "schema": schema_info(schema_for_model(name)),
+                          "X": props["X"], "y": props["targets"][prop]})
+        else:
+            skipped[name] = {"status": "insufficient_data", "samples": int(len(props["X"]))}
+    return tasks, skipped
+
+
+def fit_models(tasks, workers=TRAINING_WORKERS):
+    total = sum(len(t["y"]) for t in tasks)
+    if workers <= 1 or len(tasks) <= 1 or total < PARALLEL_MIN_SAMPLES:
+        return [_fit_model(t) for t in tasks]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=context) as pool:
+        return list(pool.map(_fit_model, tasks))
+
+
+def _record_metrics(db, results):
+    now = datetime.utcnow()
+    for name, result in results.items():
+        for metric in ("brier_score", "accuracy", "mae"):
+            if metric in result:
+                db.add(ModelMetrics(
+                    model_name=name, metric_name=metric, metric_value=result[metric],
+                    sample_size=result["validation_samples"], trained_at=now,
+                ))
+    db.commit()
+
+
+def train_all_models(workers=TRAINING_WORKERS, progress=None):
+    progress = progress or (lambda stage, fraction: None)
+    started = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        progress("dataset", 0.0)
+        dataset = build_training_dataset(db)
+        tasks, results = _training_tasks(dataset)
+        progress("fitting", 0.2)
+        fitted = fit_models(tasks, workers)
+        progress("publishing", 0.8)
+        publish_models({name: model for name, model, _ in fitted})
+        trained = {name: result for name, _, result in fitted}
+        progress("metrics", 0.9)
+        _record_metrics(db, trained)
+        results.update(trained)
+    finally:
+        db.close()
+    logger.info(f"Trained {len(tasks)} models in {(datetime.utcnow() - started).total_seconds():.1f}s")
+    return results
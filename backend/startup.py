@@ -0,0 +1,95 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+EMBEDDED_SCHEDULER = os.environ.get("EMBEDDED_SCHEDULER", "0") == "1"
+
+_readiness = {"ready": False, "started_at": None, "ready_at": None, "steps": {}, "error": None}
+_lock = threading.Lock()
+
+
+def _run_step(name, fn):
+    started = time.perf_counter()
+    result = fn()
+    with _lock:
+        _readiness["steps"][name] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def _start_scheduler():
+    from backend.jobs.worker import start_embedded_scheduler
+    start_embedded_scheduler()
+
+
+def _warm_models():
+    from backend.models.ml_models import warm_models
+    return warm_models()
+
+
+def _warm_player_index():
+    from backend.db.player_search import rebuild_player_index
+    return rebuild_player_index()
+
+
+def _warm_live_games():
+    from backend.db.game_state import refresh_live_game_ids
+    return refresh_live_game_ids()
+
+
+def warm_up(embedded_scheduler=EMBEDDED_SCHEDULER):
+    with _lock:
+        _readiness.update(ready=False, error=None, started_at=datetime.utcnow().isoformat(), ready_at=None)
+        _readiness["steps"] = {}
+    try:
+        if embedded_scheduler:
+            _run_step("scheduler", _start_scheduler)
+        _run_step("models", _warm_models)
+        _run_step("player_index", _warm_player_index)
+        _run_step("live_games", _warm_live_games)
+    except Exception as e:
+        logger.error(f"Startup warm-up failed: {e}")
+        with _lock:
+            _readiness["error"] = str(e)
+        return False
+    with _lock:
+        _readiness["ready"] = True
+        _readiness["ready_at"] = datetime.utcnow().isoformat()
+    logger.info(f"App ready ({_readiness['steps']})")
+    return True
+
+
+def start_background_startup():
+    if not EMBEDDED_SCHEDULER:
+        logger.info("Embedded scheduler disabled; run run_worker.py for ingestion")
+    threading.Thread(target=warm_up, daemon=True, name="startup-warm-up").start()
+
+
+def stop_background_services():
+    if EMBEDDED_SCHEDULER:
+        from backend.jobs.worker import stop_embedded_scheduler
+        stop_embedded_scheduler()
+
+
+def _scheduler_readiness():
+    from backend.db.lease import current_lease
+    try:
+        lease = current_lease()
+    except Exception as e:
+        logger.error(f"Scheduler lease lookup failed: {e}")
+        lease = None
+    state = {"embedded": EMBEDDED_SCHEDULER, "leader_elected": bool(lease and lease["active"])}
+    if EMBEDDED_SCHEDULER:
+        from backend.jobs.worker import leader_state
+        state.update(leader_state())
+    return state
+
+
+def readiness():
+    with _lock:
+        state = {**_readiness, "steps": dict(_readiness["steps"])}
+    state["scheduler"] = _scheduler_readiness()
+    return state
@@ -0,0 +1,210 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+import numpy as np
+
+ENDPOINTS = [
+    "/api/games/today",
+    "/api/model-odds",
+    "/api/todays-players",
+    "/api/odds",
+    "/api/props",
+    "/api/picks",
+    "/api/games/calendar",
+]
+DEFAULT_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.gettempdir(), 'nba_benchmark.db')}"
+DEFAULT_MODELS_DIR = os.path.join(tempfile.gettempdir(), "nba_benchmark_models")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_ITERATIONS = 30
+DEFAULT_WARMUP = 3
+ALLOC_ITERATIONS = 3
+LATENCY_THRESHOLD = 0.5
+GATED_LATENCY_METRICS = ("p50_ms", "p95_ms")
+LATENCY_FLOOR_MS = 5.0
+SQL_THRESHOLD = 0.1
+ALLOC_THRESHOLD = 0.25
+ALLOC_FLOOR_KIB = 256.0
+BENCHMARK_USER = "synthetic_user_000000"
+
+
+def _percentiles(samples):
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {"p50_ms": round(float(p50), 2), "p95_ms": round(float(p95), 2), "p99_ms": round(float(p99), 2),
+            "mean_ms": round(float(np.mean(samples)), 2)}
+
+
+def measure_endpoint(client, path, statements, iterations=DEFAULT_ITERATIONS, warmup=DEFAULT_WARMUP):
+    cold_started = time.perf_counter()
+    resp = client.get(path)
+    cold_ms = (time.perf_counter() - cold_started) * 1000
+    if resp.status_code != 200:
+        raise RuntimeError(f"{path} returned {resp.status_code}: {resp.text[:200]}")
+    for _ in range(warmup):
+        client.get(path)
+
+    timings, counts = [], []
+    for _ in range(iterations):
+        statements["count"] = 0
+        started = time.perf_counter()
+        client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        counts.append(statements["count"])
+
+    peaks = []
+    for _ in range(ALLOC_ITERATIONS):
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        client.get(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append((peak - baseline) / 1024)
+
+    return {
+        **_percentiles(timings),
+        "cold_ms": round(cold_ms, 2),
+        "sql_statements": max(counts),
+        "peak_alloc_kib": round(max(peaks), 1),
+        "response_bytes": len(resp.content),
+        "iterations": iterations,
+    }
+
+
+def compare_results(current, baseline, latency_threshold=LATENCY_THRESHOLD,
+                    sql_threshold=SQL_THRESHOLD, alloc_threshold=ALLOC_THRESHOLD):
+    failures = []
+    for path, cur in current["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(path)
+        if base is None:
+            continue
+        for metric in GATED_LATENCY_METRICS:
+            limit = base[metric] * (1 + latency_threshold)
+            if cur[metric] > limit and cur[metric] - base[metric] > LATENCY_FLOOR_MS:
+                failures.append(f"{path}: {metric} {cur[metric]:.1f} > {limit:.1f} (baseline {base[metric]:.1f})")
+        sql_limit = math.ceil(base["sql_statements"] * (1 + sql_threshold))
+        if cur["sql_statements"] > sql_limit:
+            failures.append(f"{path}: sql_statements {cur['sql_statements']} > {sql_limit} "
+                            f"(baseline {base['sql_statements']})")
+        alloc_limit = base["peak_alloc_kib"] * (1 + alloc_threshold)
+        if cur["peak_alloc_kib"] > alloc_limit and cur["peak_alloc_kib"] - base["peak_alloc_kib"] > ALLOC_FLOOR_KIB:
+            failures.append(f"{path}: peak_alloc_kib {cur['peak_alloc_kib']:.0f} > {alloc_limit:.0f} "
+                            f"(baseline {base['peak_alloc_kib']:.0f})")
+    return failures
+
+
+def _prepare_database(scale, seed, regenerate):
+    from backend.db.models import Base, SessionLocal, DimGame, engine, init_db
+    from backend.db.synthetic import generate_synthetic_data
+
+    if regenerate:
+        Base.metadata.drop_all(bind=engine)
+    init_db()
+    db = SessionLocal()
+    try:
+        if db.query(DimGame.id).first() is None:
+            print(f"Generating synthetic data (scale={scale}, seed={seed})...", file=sys.stderr)
+            generate_synthetic_data(db, scale=scale, seed=seed)
+    finally:
+        db.close()
+
+
+def _client():
+    from fastapi.testclient import TestClient
+    from backend.main import app
+    from backend.api.auth import COOKIE_NAME, create_access_token
+    from backend.db.models import SessionLocal, User
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter_by(username=BENCHMARK_USER).first()
+    finally:
+        db.close()
+    if user is None:
+        raise RuntimeError(f"Benchmark user {BENCHMARK_USER} not found; rerun with --regenerate")
+    client = TestClient(app)
+    client.cookies.set(COOKIE_NAME, create_access_token(user.id, user.username))
+    return client
+
+
+def run(endpoints=ENDPOINTS, iterations=DEFAULT_ITERATIONS, warmup=DEFAULT_WARMUP):
+    from sqlalchemy import event
+    from backend.db.models import engine
+
+    statements = {"count": 0}
+
+    def _count(*args):
+        statements["count"] += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        client = _client()
+        results = {path: measure_endpoint(client, path, statements, iterations, warmup) for path in endpoints}
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints against a synthetic database")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--regenerate", action="store_true", help="Drop and regenerate the synthetic data")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--endpoint", action="append", help="Only benchmark these paths")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=LATENCY_THRESHOLD,
+                        help="Allowed fractional p50/p95 latency regression")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("MODEL_ARTIFACTS_DIR", DEFAULT_MODELS_DIR)
+    _prepare_database(args.scale, args.seed, args.regenerate)
+    results = {
+        "recorded_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scale": args.scale,
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "endpoints": run(args.endpoint or ENDPOINTS, args.iterations, args.warmup),
+    }
+
+    print(f"{'endpoint':<24}{'p50':>9}{'p95':>9}{'p99':>9}{'cold':>9}{'sql':>6}{'alloc KiB':>11}")
+    for path, r in results["endpoints"].items():
+        print(f"{path:<24}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['cold_ms']:>9.1f}"
+              f"{r['sql_statements']:>6}{r['peak_alloc_kib']:>11.0f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    failures = compare_results(results, baseline, latency_threshold=args.threshold)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    if not failures:
+        print("No regressions against baseline")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
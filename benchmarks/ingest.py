@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from unittest import mock
+
+DEFAULT_LIVE_POLLS = 20
+WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE")
+
+
+def _table_counts():
+    from backend.db.models import SessionLocal, DimGame, DimTeam, DimPlayer, FactBoxScore, ScoreHistory, RawApiResponse
+
+    db = SessionLocal()
+    try:
+        return {model.__tablename__: db.query(model).count()
+                for model in (DimGame, DimTeam, DimPlayer, FactBoxScore, ScoreHistory, RawApiResponse)}
+    finally:
+        db.close()
+
+
+def _reset_state():
+    from backend.db.models import Base, engine, init_db
+    from backend.ingest import bdl_client
+    from backend.jobs import scheduler
+
+    Base.metadata.drop_all(bind=engine)
+    init_db()
+    bdl_client.clear_cache()
+    scheduler._backfill_checked_dates.clear()
+    scheduler._stats_api_available = None
+
+
+def _measure(name, fn, writes):
+    from backend.ingest import bdl_client
+
+    before = _table_counts()
+    bdl_client.reset_request_stats()
+    writes.update(statements=0, rows=0)
+    started = time.perf_counter()
+    calls = fn()
+    seconds = time.perf_counter() - started
+    after = _table_counts()
+    delta = {table: after[table] - before[table] for table in after if after[table] != before[table]}
+    games = delta.get("dim_games", 0)
+    box_scores = delta.get("fact_boxscores", 0)
+    return {
+        "stage": name,
+        "seconds": round(seconds, 3),
+        "calls": calls,
+        "games_stored": games,
+        "box_scores_stored": box_scores,
+        "games_per_sec": round(games / seconds, 1) if seconds else None,
+        "box_scores_per_sec": round(box_scores / seconds, 1) if seconds else None,
+        "write_statements": writes["statements"],
+        "rows_written": writes["rows"],
+        "rows_added": delta,
+        "api": bdl_client.request_stats(),
+    }
+
+
+def run(mock_bdl, live_polls=DEFAULT_LIVE_POLLS):
+    from sqlalchemy import event
+    from backend.db.models import engine
+    from backend.ingest import bdl_client
+    from backend.jobs import scheduler
+
+    writes = {"statements": 0, "rows": 0}
+
+    def _count_writes(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(WRITE_PREFIXES):
+            writes["statements"] += 1
+            writes["rows"] += max(cursor.rowcount, 0)
+
+    today = mock_bdl.as_of.strftime("%Y-%m-%d")
+    season_start = mock_bdl.season_start.strftime("%Y-%m-%d")
+
+    def backfill():
+        calls = 0
+        while scheduler.backfill_calendar_games(today=today, season_start=season_start):
+            calls += 1
+        return calls
+
+    def seed():
+        scheduler.seed_historical_games()
+        return 1
+
+    def box_scores():
+        scheduler.ingest_box_scores()
+        return 1
+
+    def live():
+        for _ in range(live_polls):
+            bdl_client.clear_cache()
+            with bdl_client.live_priority():
+                scheduler.ingest_live_games()
+        return live_polls
+
+    bdl_client.set_transport(mock_bdl.transport())
+    event.listen(engine, "after_cursor_execute", _count_writes)
+    stages = []
+    try:
+        with mock.patch("backend.jobs.model_jobs.submit_retrain", return_value=(None, False)), \
+                mock.patch("backend.utils.get_nba_day_dates",
+                           return_value=[today, (mock_bdl.as_of + timedelta(days=1)).strftime("%Y-%m-%d")]):
+            _reset_state()
+            stages.append(_measure("backfill_calendar_games", backfill, writes))
+            _reset_state()
+            stages.append(_measure("seed_historical_games", seed, writes))
+            stages.append(_measure("ingest_box_scores", box_scores, writes))
+            stages.append(_measure("ingest_live_games", live, writes))
+    finally:
+        event.remove(engine, "after_cursor_execute", _count_writes)
+        bdl_client.set_transport(None)
+    return stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark BDL ingest jobs against a local mock API")
+    parser.add_argument("--database-url", help="Database to ingest into (default: a fresh temporary SQLite file)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated per-request API latency")
+    parser.add_argument("--rps", type=float, help="Mock rate limit in requests per second (429 when exceeded)")
+    parser.add_argument("--burst", type=int, default=10, help="Token bucket size for --rps")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Return 429 for every Nth request")
+    parser.add_argument("--min-interval", type=float, default=0.0, help="Client-side spacing between requests")
+    parser.add_argument("--budget-rpm", type=float, default=0.0,
+                        help="Client-side shared request budget per minute (0 disables it)")
+    parser.add_argument("--backoff", type=float, default=0.05, help="Client retry backoff base in seconds")
+    parser.add_argument("--live-polls", type=int, default=DEFAULT_LIVE_POLLS)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(tmp, 'ingest.db')}"
+        os.environ.setdefault("MODEL_ARTIFACTS_DIR", os.path.join(tmp, "model_artifacts"))
+        return _run_benchmark(args)
+
+
+def _run_benchmark(args):
+    os.environ.setdefault("BDL_API_KEY", "benchmark")
+    os.environ["BDL_MIN_REQUEST_INTERVAL"] = str(args.min_interval)
+    os.environ["BDL_RETRY_BACKOFF_SECONDS"] = str(args.backoff)
+    os.environ["BDL_REQUESTS_PER_MINUTE"] = str(args.budget_rpm)
+    os.environ["BOX_SCORE_FETCH_DELAY"] = "0"
+    os.environ["ROSTER_FETCH_DELAY"] = "0"
+
+    from benchmarks.mock_bdl import MockBDL
+
+    mock_bdl = MockBDL(seed=args.seed, latency=args.latency_ms / 1000, requests_per_second=args.rps,
+                       burst=args.burst, throttle_every=args.throttle_every)
+    print(f"Mock BDL: {len(mock_bdl.games)} games, {mock_bdl.final_games} final, "
+          f"{mock_bdl.box_scores} box scores", file=sys.stderr)
+    stages = run(mock_bdl, args.live_polls)
+
+    print(f"{'stage':<26}{'sec':>8}{'games/s':>10}{'box/s':>10}{'requests':>10}{'429s':>6}{'writes':>9}{'rows':>9}")
+    for s in stages:
+        print(f"{s['stage']:<26}{s['seconds']:>8.2f}{s['games_per_sec'] or 0:>10.1f}{s['box_scores_per_sec'] or 0:>10.1f}"
+              f"{s['api']['requests']:>10}{s['api']['rate_limited']:>6}{s['write_statements']:>9}{s['rows_written']:>9}")
+    results = {"seed": args.seed, "mock": mock_bdl.counters, "stages": stages}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
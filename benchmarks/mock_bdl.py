@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+import httpx
+import numpy as np
+from backend.db.seed import NBA_TEAMS, VENDORS
+from backend.db.synthetic import GAMES_PER_SEASON, _build_rosters, generate_season
+
+SEASON_DAYS_ELAPSED = 120
+
+
+def _team_payload(t):
+    return {"id": t[0], "abbreviation": t[1], "city": t[2], "conference": t[3], "division": t[4],
+            "full_name": t[5], "name": t[6]}
+
+
+class MockBDL:
+    def __init__(self, seed=42, as_of=None, days_elapsed=SEASON_DAYS_ELAPSED, latency=0.0,
+                 requests_per_second=None, burst=10, throttle_every=0, games_per_season=GAMES_PER_SEASON):
+        rng = np.random.default_rng(seed)
+        self.as_of = as_of or datetime.utcnow().replace(microsecond=0)
+        self.season_start = datetime(self.as_of.year, self.as_of.month, self.as_of.day) - timedelta(days=days_elapsed)
+        team_ids = [t[0] for t in NBA_TEAMS]
+        self.teams = {t[0]: _team_payload(t) for t in NBA_TEAMS}
+        players = _build_rosters(rng, team_ids)
+        rosters = {team_id: [p for p in players if p["team_id"] == team_id] for team_id in team_ids}
+        ratings = {team_id: float(rng.normal(0, 4)) for team_id in team_ids}
+        season = generate_season(rng, 0, self.season_start, self.as_of, rosters, ratings, team_ids, VENDORS,
+                                 games_per_season)
+
+        self.players = {p["id"]: {
+            "id": p["id"], "first_name": p["first_name"], "last_name": p["last_name"],
+            "position": p["position"], "jersey_number": p["jersey_number"], "team": self.teams[p["team_id"]],
+        } for p in players}
+        self.games = [self._game_payload(g) for g in season["games"]]
+        self.games_by_date = {}
+        for g in self.games:
+            self.games_by_date.setdefault(g["date"], []).append(g)
+        self.stats_by_game = {}
+        for i, bs in enumerate(season["box_scores"]):
+            self.stats_by_game.setdefault(bs["game_id"], []).append(self._stat_payload(i, bs))
+
+        self.latency = latency
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.throttle_every = throttle_every
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "throttled": 0, "bytes": 0}
+
+    def _game_payload(self, g):
+        return {
+            "id": g["id"], "date": g["date"], "datetime": f"{g['date']}T23:30:00.000Z", "season": g["season"],
+            "status": g["status"],
+            "period": g["period"], "time": g["time"], "postseason": g["postseason"],
+            "home_team": self.teams[g["home_team_id"]], "visitor_team": self.teams[g["visitor_team_id"]],
+            "home_team_score": g["home_team_score"], "visitor_team_score": g["visitor_team_score"],
+        }
+
+    def _stat_payload(self, i, bs):
+        player = self.players[bs["player_id"]]
+        return {
+            "id": i + 1, **{k: v for k, v in bs.items() if k not in ("game_id", "player_id", "team_id")},
+            "player": {k: player[k] for k in ("id", "first_name", "last_name", "position")},
+            "team": self.teams[bs["team_id"]], "game": {"id": bs["game_id"]},
+        }
+
+    @property
+    def final_games(self):
+        return sum(1 for g in self.games if g["status"] == "Final")
+
+    @property
+    def box_scores(self):
+        return sum(len(rows) for rows in self.stats_by_game.values())
+
+    def transport(self):
+        return httpx.MockTransport(self.handle)
+
+    def _throttled(self):
+        with self._lock:
+            self.counters["requests"] += 1
+            if self.throttle_every and self.counters["requests"] % self.throttle_every == 0:
+                return True
+            if self.requests_per_second is None:
+                return False
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.requests_per_second)
+            self._refilled_at = now
+            if self._tokens < 1:
+                return True
+            self._tokens -= 1
+            return False
+
+    def handle(self, request):
+        if self.latency:
+            time.sleep(self.latency)
+        if self._throttled():
+            self.counters["throttled"] += 1
+            return httpx.Response(429, json={"error": "Too many requests"})
+
+        params = request.url.params
+        path = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        per_page = int(params.get("per_page", 25))
+        if path == "games" and params.get_list("dates[]"):
+            data = [g for d in params.get_list("dates[]") for g in self.games_by_date.get(d, [])]
+            body = {"data": data, "meta": {"per_page": per_page}}
+        elif path == "games":
+            body = self._page(self.games, params.get("cursor"), per_page)
+        elif path == "stats":
+            data = [s for gid in params.get_list("game_ids[]") for s in self.stats_by_game.get(int(gid), [])]
+            body = {"data": data, "meta": {"per_page": per_page}}
+        elif path == "players":
+            players = list(self.players.values())
+            team_ids = {int(t) for t in params.get_list("team_ids[]")}
+            if team_ids:
+                players = [p for p in players if p["team"]["id"] in team_ids]
+            search = (params.get("search") or "").lower()
+            if search:
+                players = [p for p in players if search in f"{p['first_name']} {p['last_name']}".lower()]
+            body = self._page(players, params.get("cursor"), per_page)
+        else:
+            return httpx.Response(404, json={"error": f"Unknown endpoint {request.url.path}"})
+
+        content = json.dumps(body).encode()
+        self.counters["bytes"] += len(content)
+        return httpx.Response(200, content=content, headers={"Content-Type": "application/json"})
+
+    def _page(self, rows, cursor, per_page):
+        offset = max(0, int(cursor or 1) - 1)
+        page = rows[offset:offset + per_page]
+        next_offset = offset + per_page
+        meta = {"per_page": per_page}
+        if next_offset < len(rows):
+            meta["next_cursor"] = next_offset + 1
+        return {"data": page, "meta": meta}
@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "startup_baseline.json")
+DEFAULT_RUNS = 5
+THRESHOLD = 0.5
+FLOOR_MS = 50.0
+GATED_METRICS = ("import_ms", "serving_ms", "ready_ms")
+WATCHED_MODULES = ("sklearn", "scipy", "pandas", "pyarrow", "apscheduler", "httpx", "jose", "bcrypt", "numpy")
+READY_TIMEOUT_SECONDS = 60
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import backend.main
+imported = time.perf_counter()
+loaded = [m for m in {watched!r} if m in sys.modules]
+from fastapi.testclient import TestClient
+with TestClient(backend.main.app) as client:
+    serving = time.perf_counter()
+    deadline = serving + {timeout}
+    while client.get("/api/ready").status_code != 200:
+        if time.perf_counter() > deadline:
+            raise SystemExit("app never became ready")
+        time.sleep(0.005)
+    ready = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "serving_ms": (serving - started) * 1000,
+    "ready_ms": (ready - started) * 1000,
+    "loaded_at_import": loaded,
+}}))
+"""
+
+
+def _env(database_url):
+    env = dict(os.environ)
+    env.update(DATABASE_URL=database_url, EMBEDDED_SCHEDULER="0")
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def measure_once(database_url, workdir):
+    probe = _PROBE.format(timeout=READY_TIMEOUT_SECONDS, watched=WATCHED_MODULES)
+    out = subprocess.run([sys.executable, "-c", probe], env=_env(database_url), cwd=workdir,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def import_breakdown(database_url, workdir, top=10):
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import backend.main"],
+                         env=_env(database_url), cwd=workdir, capture_output=True, text=True, check=True)
+    packages = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        try:
+            self_us = int(self_us.strip())
+        except ValueError:
+            continue
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    ranked = sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    return [{"package": name, "self_ms": round(us / 1000, 1)} for name, us in ranked]
+
+
+def run(runs=DEFAULT_RUNS, database_url=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = database_url or f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        measure_once(database_url, tmp)
+        samples = [measure_once(database_url, tmp) for _ in range(runs)]
+        breakdown = import_breakdown(database_url, tmp)
+    summary = {metric: round(float(np.median([s[metric] for s in samples])), 1) for metric in GATED_METRICS}
+    summary["loaded_at_import"] = samples[-1]["loaded_at_import"]
+    summary["import_breakdown"] = breakdown
+    return summary
+
+
+def compare_startup(current, baseline, threshold=THRESHOLD):
+    failures = []
+    for metric in GATED_METRICS:
+        if metric not in baseline:
+            continue
+        limit = baseline[metric] * (1 + threshold)
+        if current[metric] > limit and current[metric] - baseline[metric] > FLOOR_MS:
+            failures.append(f"{metric} {current[metric]:.0f}ms > {limit:.0f}ms (baseline {baseline[metric]:.0f}ms)")
+    for module in current.get("loaded_at_import", []):
+        if module not in baseline.get("loaded_at_import", []):
+            failures.append(f"{module} is now imported by backend.main")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark API import and cold-start time")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--database-url", help="Database to start against (default: a fresh temporary SQLite file)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Allowed fractional regression")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = {
+        "recorded_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": args.runs,
+        **run(args.runs, args.database_url),
+    }
+    print(f"import {results['import_ms']:.0f}ms, serving {results['serving_ms']:.0f}ms, "
+          f"ready {results['ready_ms']:.0f}ms")
+    print(f"heavy modules loaded by backend.main: {', '.join(results['loaded_at_import']) or 'none'}")
+    for row in results["import_breakdown"]:
+        print(f"  {row['package']:<20}{row['self_ms']:>8.1f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    failures = compare_startup(results, baseline, args.threshold)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    if not failures:
+        print("No regressions against baseline")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
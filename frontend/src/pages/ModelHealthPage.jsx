@@ -1,7 +1,9 @@
-import { useState } from 'react'
+import { useState, useEffect } from 'react'
 import { useApi, postApi } from '../hooks/useApi'
 import { Brain, RefreshCw, CheckCircle, AlertCircle } from 'lucide-react'
 
+const JOB_POLL_MS = 1500
+
 function RetrainResults({ result }) {
   if (!result) return null
   if (result.error) {
@@ -59,19 +61,48 @@ export default function ModelHealthPage() {
   const { data, loading, refetch } = useApi('/api/model/health')
   const [retraining, setRetraining] = useState(false)
   const [retrainResult, setRetrainResult] = useState(null)
+  const [job, setJob] = useState(null)
+
+  useEffect(() => {
+    if (!job || job.status === 'succeeded' || job.status === 'failed') return
+    const timer = setTimeout(async () => {
+      try {
+        const res = await fetch(`/api/model/jobs/${job.id}`, { credentials: 'include' })
+        if (!res.ok) throw new Error(`HTTP ${res.status}`)
+        const next = await res.json()
+        setJob(next)
+        if (next.status === 'succeeded') {
+          setRetrainResult(next.result)
+          setRetraining(false)
+          refetch()
+        } else if (next.status === 'failed') {
+          setRetrainResult({ error: next.error || 'Training failed' })
+          setRetraining(false)
+        }
+      } catch (e) {
+        setRetrainResult({ error: e.message })
+        setRetraining(false)
+        setJob(null)
+      }
+    }, JOB_POLL_MS)
+    return () => clearTimeout(timer)
+  }, [job, refetch])
 
   const handleRetrain = async () => {
     setRetraining(true)
+    setRetrainResult(null)
     try {
-      const result = await postApi('/api/model/retrain', {})
-      setRetrainResult(result)
-      refetch()
+      setJob(await postApi('/api/model/retrain', {}))
     } catch (e) {
       setRetrainResult({ error: e.message })
+      setRetraining(false)
     }
-    setRetraining(false)
   }
 
+  const progressLabel = job && retraining
+    ? `Training${job.stage ? ` (${job.stage})` : ''} ${Math.round((job.progress || 0) * 100)}%`
+    : 'Training...'
+
   const models = data?.models || {}
 
   return (
@@ -83,7 +114,7 @@ export default function ModelHealthPage() {
         </div>
         <button className="btn btn-primary" onClick={handleRetrain} disabled={retraining}>
           <RefreshCw size={16} className={retraining ? 'pulse' : ''} />
-          {retraining ? 'Training...' : 'Retrain All Models'}
+          {retraining ? progressLabel : 'Retrain All Models'}
         </button>
       </div>
 
@@ -93,7 +93,7 @@ function PickButton({ team, odds, gameId, onPick, isPicked, isOtherPicked, loadi
 
 export default function OddsPage() {
   const { data: predictions, loading } = useApi('/api/model-odds', { refreshInterval: 30 })
-  const { data: picksData, refetch: refetchPicks } = useApi('/api/picks')
+  const { data: picksData, refetch: refetchPicks } = useApi('/api/picks?pick_type=moneyline&result=pending&limit=200')
   const [expanded, setExpanded] = useState({})
   const [filter, setFilter] = useState('all')
   const [savingGame, setSavingGame] = useState(null)
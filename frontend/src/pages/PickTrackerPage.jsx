@@ -1,21 +1,39 @@
-import { useState } from 'react'
+import { useState, useEffect } from 'react'
 import { useApi } from '../hooks/useApi'
 import { Trophy, Trash2, CheckCircle, XCircle, Clock, History, ArrowLeft } from 'lucide-react'
 
 export default function PickTrackerPage() {
-  const { data, loading, refetch } = useApi('/api/picks')
   const [showHistory, setShowHistory] = useState(false)
+  const picksUrl = `/api/picks?pick_type=moneyline&result=${showHistory ? 'graded' : 'pending'}&limit=50`
+  const { data, loading, refetch } = useApi(picksUrl)
+  const [olderPicks, setOlderPicks] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
 
-  const allPicks = (data?.picks || []).filter(p => p.pick_type === 'moneyline')
-  const activePicks = allPicks.filter(p => p.result === 'pending')
-  const gradedPicks = allPicks.filter(p => p.result === 'win' || p.result === 'loss')
+  useEffect(() => {
+    setOlderPicks([])
+    setNextCursor(data?.next_cursor || null)
+  }, [data])
 
-  const wins = gradedPicks.filter(p => p.result === 'win').length
-  const losses = gradedPicks.filter(p => p.result === 'loss').length
+  const stats = data?.stats?.by_type?.moneyline
+  const wins = stats?.wins || 0
+  const losses = stats?.losses || 0
+  const pendingCount = stats?.pending || 0
   const graded = wins + losses
   const winRate = graded > 0 ? (wins / graded * 100).toFixed(1) : '--'
 
-  const displayPicks = showHistory ? gradedPicks : activePicks
+  const displayPicks = [...(data?.picks || []), ...olderPicks]
+    .filter(p => showHistory ? (p.result === 'win' || p.result === 'loss') : p.result === 'pending')
+
+  const loadMore = async () => {
+    try {
+      const res = await fetch(`${picksUrl}&cursor=${encodeURIComponent(nextCursor)}`, { credentials: 'include' })
+      const json = await res.json()
+      setOlderPicks(prev => [...prev, ...(json.picks || [])])
+      setNextCursor(json.next_cursor || null)
+    } catch (e) {
+      alert('Error loading picks')
+    }
+  }
 
   const handleDelete = async (pickId) => {
     if (!confirm('Remove this pick?')) return
@@ -72,7 +90,7 @@ export default function PickTrackerPage() {
           }}>
             <Clock size={24} color="var(--orange)" />
           </div>
-          <div className="stat-value" style={{ fontSize: 32 }}>{activePicks.length}</div>
+          <div className="stat-value" style={{ fontSize: 32 }}>{pendingCount}</div>
           <div className="stat-label">Pending</div>
         </div>
       </div>
@@ -82,13 +100,13 @@ export default function PickTrackerPage() {
           className={`btn btn-sm ${!showHistory ? 'btn-primary' : 'btn-secondary'}`}
           onClick={() => setShowHistory(false)}
         >
-          <Clock size={14} /> Active Picks ({activePicks.length})
+          <Clock size={14} /> Active Picks ({pendingCount})
         </button>
         <button
           className={`btn btn-sm ${showHistory ? 'btn-primary' : 'btn-secondary'}`}
           onClick={() => setShowHistory(true)}
         >
-          <History size={14} /> Pick History ({gradedPicks.length})
+          <History size={14} /> Pick History ({graded})
         </button>
       </div>
 
@@ -161,6 +179,11 @@ export default function PickTrackerPage() {
               </tbody>
             </table>
           </div>
+          {nextCursor && (
+            <div style={{ textAlign: 'center', padding: 16 }}>
+              <button className="btn btn-sm btn-secondary" onClick={loadMore}>Load more</button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -205,13 +205,13 @@ function GameCalendar({ calendarData }) {
 
 export default function TodayPage() {
   const { data: status } = useApi('/api/status')
-  const { data: picksData } = useApi('/api/picks')
+  const { data: picksData } = useApi('/api/picks?limit=0')
   const { data: calendarData } = useApi('/api/games/calendar')
   const { data: games } = useApi('/api/games/today', { refreshInterval: 15 })
 
-  const picks = (picksData?.picks || []).filter(p => p.pick_type === 'moneyline')
-  const wins = picks.filter(p => p.result === 'win').length
-  const losses = picks.filter(p => p.result === 'loss').length
+  const moneylineStats = picksData?.stats?.by_type?.moneyline
+  const wins = moneylineStats?.wins || 0
+  const losses = moneylineStats?.losses || 0
 
   const todayCount = (games || []).length
   const liveCount = (games || []).filter(g => isLive(g.status)).length
@@ -0,0 +1,4 @@
+from backend.jobs.worker import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import os
+import shutil
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="nba-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp_dir, 'nba_test.db')}"
+os.environ["MODEL_ARTIFACTS_DIR"] = os.path.join(_tmp_dir, "model_artifacts")
+os.environ["JOB_PROFILE_DIR"] = os.path.join(_tmp_dir, "job_profiles")
+os.environ["EMBEDDED_SCHEDULER"] = "0"
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_tmp_dir, ignore_errors=True)
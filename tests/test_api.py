@@ -1,14 +1,22 @@
+import uuid
 import pytest
 from fastapi.testclient import TestClient
 from backend.main import app
 from backend.db.models import init_db
 from backend.db.seed import seed_database
+from backend.db.perf import set_budget_mode, set_query_budget, QueryBudgetExceeded
 
 init_db()
 seed_database()
+set_budget_mode("raise")
 
 client = TestClient(app)
 
+_suffix = uuid.uuid4().hex[:8]
+client.post("/auth/signup", json={
+    "username": f"tester_{_suffix}", "email": f"tester_{_suffix}@example.com", "password": "test-password"
+})
+
 
 def test_status():
     resp = client.get("/api/status")
@@ -28,6 +36,15 @@ def test_games_today():
     assert "visitor_team" in games[0]
 
 
+def test_games_calendar():
+    resp = client.get("/api/games/calendar")
+    assert resp.status_code == 200
+    dates = resp.json()["dates"]
+    assert dates
+    game = next(iter(dates.values()))[0]
+    assert game["home_team"]["id"] and game["visitor_team"]["id"]
+
+
 def test_odds():
     resp = client.get("/api/odds")
     assert resp.status_code == 200
@@ -38,6 +55,16 @@ def test_odds():
         assert "history" in odds[0]
 
 
+def test_odds_movement():
+    resp = client.get("/api/odds/900000/movement?resolution=1h")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["resolution"] == "1h"
+    for series in data["series"]:
+        assert {"vendor", "market", "points"} <= set(series)
+    assert client.get("/api/odds/900000/movement?resolution=2m").status_code == 400
+
+
 def test_props():
     resp = client.get("/api/props")
     assert resp.status_code == 200
@@ -59,6 +86,49 @@ def test_edge_calculator():
     assert "disclaimer" in data
 
 
+def test_edge_scan():
+    resp = client.get("/api/edge/scan?top=10")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert "disclaimer" in data
+    results = data["results"]
+    assert len(results) <= 10
+    evs = [r["expected_value"] for r in results]
+    assert evs == sorted(evs, reverse=True)
+    for r in results:
+        assert r["market"] in ("moneyline", "player_prop")
+        assert abs(r["edge"] - (r["model_probability"] - r["implied_probability"])) < 1e-3
+
+    assert client.get("/api/edge/scan?date=bad").status_code == 400
+
+
+def test_edge_scan_includes_games_without_state():
+    from backend.db.models import SessionLocal, DimGame, DimTeam, FactOddsLatest
+    from backend.models.edge_scanner import scan_slate
+
+    db = SessionLocal()
+    try:
+        home, away = [t.id for t in db.query(DimTeam).order_by(DimTeam.id).limit(2)]
+        db.add(DimGame(id=990101, date="2031-01-01", home_team_id=home, visitor_team_id=away, state=None))
+        db.add(FactOddsLatest(game_id=990101, vendor="TestBook", market_type="game", home_odds=150, away_odds=-170))
+        db.commit()
+        results = scan_slate(db, "2031-01-01", include_props=False)
+        assert {r["game_id"] for r in results} == {990101}
+    finally:
+        db.query(FactOddsLatest).filter_by(game_id=990101).delete()
+        db.query(DimGame).filter_by(id=990101).delete()
+        db.commit()
+        db.close()
+
+
+def test_model_version_follows_artifacts():
+    from backend.models.ml_models import model_version, publish_models, _default_win_artifact
+
+    before = model_version()
+    publish_models({"win_probability": _default_win_artifact()})
+    assert model_version() != before
+
+
 def test_picks():
     resp = client.get("/api/picks")
     assert resp.status_code == 200
@@ -70,13 +140,89 @@ def test_picks():
 
 def test_create_pick():
     resp = client.post("/api/picks", json={
-        "game_id": 900000, "pick_type": "moneyline",
+        "game_id": 900004, "pick_type": "moneyline",
         "selection": "Test Pick", "odds": -110, "stake": 10, "notes": "test"
     })
     assert resp.status_code == 200
     assert resp.json()["status"] == "created"
 
 
+def test_picks_ledger_and_pagination():
+    for i in range(3):
+        resp = client.post("/api/picks", json={
+            "game_id": 900004, "pick_type": "player_prop", "selection": f"Prop {i}",
+            "odds": -110, "stake": 5, "player_id": 101, "stat_type": "PTS", "line": 20.5, "pick_side": "over",
+        })
+        assert resp.status_code == 200
+
+    stats = client.get("/api/picks?limit=0").json()["stats"]
+    assert stats["by_type"]["player_prop"]["total_picks"] == 3
+    assert stats["by_type"]["player_prop"]["total_staked"] == 15
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/picks?limit=2&pick_type=player_prop" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(url).json()
+        assert len(page["picks"]) <= 2
+        seen.extend(p["id"] for p in page["picks"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert len(seen) == 3 and len(set(seen)) == 3
+
+    resp = client.delete(f"/api/picks/{seen[0]}")
+    assert resp.status_code == 200
+    stats = client.get("/api/picks?limit=0").json()["stats"]
+    assert stats["by_type"]["player_prop"]["total_picks"] == 2
+    assert stats["by_type"]["player_prop"]["pending"] == 2
+
+
+def test_todays_players():
+    resp = client.get("/api/todays-players")
+    assert resp.status_code == 200
+    games = resp.json()
+    assert isinstance(games, list)
+    for g in games:
+        for p in g["home_players"] + g["away_players"]:
+            assert set(p["projections"]) == {"PTS", "REB", "AST", "STL", "BLK"}
+            assert "fg_pct" in p["averages"]
+        pts = [p["projections"]["PTS"] for p in g["home_players"]]
+        assert pts == sorted(pts, reverse=True)
+        assert len(g["home_players"]) <= 15
+
+
+def test_todays_players_does_not_build_on_request():
+    from backend.db.models import SessionLocal, FactPlayerProjection
+    from backend.features.projections import projection_game_ids
+    from backend.jobs.scheduler import build_missing_projections
+    db = SessionLocal()
+    try:
+        game_ids = projection_game_ids(db)
+        db.query(FactPlayerProjection).filter(
+            FactPlayerProjection.game_id.in_(game_ids)).delete(synchronize_session=False)
+        db.commit()
+        games = client.get("/api/todays-players").json()
+        assert all(not g["projections_ready"] and not g["home_players"] for g in games)
+        assert not db.query(FactPlayerProjection).filter(FactPlayerProjection.game_id.in_(game_ids)).count()
+    finally:
+        db.close()
+    build_missing_projections()
+    games = client.get("/api/todays-players").json()
+    assert all(g["projections_ready"] for g in games)
+
+
+def test_player_stats_summary():
+    resp = client.get("/api/player-stats/101")
+    assert resp.status_code == 200
+    data = resp.json()
+    summary = data["summary"]
+    assert summary["games_tracked"] >= data["games_available"]
+    if data["game_log"]:
+        assert all(g["date"] for g in data["game_log"])
+        assert summary["last_game_id"] is not None
+
+
 def test_teams():
     resp = client.get("/api/teams")
     assert resp.status_code == 200
@@ -94,3 +240,187 @@ def test_picks_export():
     resp = client.get("/api/picks/export")
     assert resp.status_code == 200
     assert "text/csv" in resp.headers["content-type"]
+
+
+def test_picks_export_filters():
+    client.post("/api/picks", json={
+        "game_id": 900004, "pick_type": "moneyline", "selection": "Export Pick", "odds": 120, "stake": 10,
+    })
+    rows = client.get("/api/picks/export").text.strip().splitlines()
+    assert rows[0].startswith("id,game_id,type")
+    own_ids = {p["id"] for p in client.get("/api/picks?limit=200").json()["picks"]}
+    assert {int(r.split(",")[0]) for r in rows[1:]} == own_ids
+
+    future = client.get("/api/picks/export?start_date=2999-01-01").text.strip().splitlines()
+    assert len(future) == 1
+
+    assert client.get("/api/picks/export?start_date=yesterday").status_code == 400
+    assert client.get("/api/picks/export?format=xml").status_code == 400
+
+
+def test_picks_export_parquet():
+    pq = pytest.importorskip("pyarrow.parquet")
+    import io
+    resp = client.get("/api/picks/export?format=parquet")
+    assert resp.status_code == 200
+    table = pq.read_table(io.BytesIO(resp.content))
+    assert "created_at" in table.column_names
+    assert table.num_rows == len(client.get("/api/picks?limit=200").json()["picks"])
+
+
+def test_query_instrumentation(monkeypatch):
+    from backend.api import auth
+
+    monkeypatch.setattr(auth, "ADMIN_USERNAMES", {f"tester_{_suffix}"})
+    resp = client.get("/api/games/today")
+    assert resp.status_code == 200
+    assert 'desc="' in resp.headers["server-timing"]
+    assert resp.headers["server-timing"].startswith("db;dur=")
+
+    report = client.get("/api/debug/perf").json()
+    route = next(r for r in report["routes"] if r["name"] == "GET /api/games/today")
+    assert route["count"] >= 1
+    assert route["max_queries"] > 0
+    assert report["slowest_statements"]
+
+
+def test_model_odds_batches_team_stats():
+    from backend.api.routes import _model_odds_cache
+    _model_odds_cache["data"] = None
+    resp = client.get("/api/model-odds")
+    assert resp.status_code == 200
+    games = resp.json()
+    assert games
+    for g in games:
+        assert abs(g["home_win_prob"] + g["away_win_prob"] - 1) < 1e-3
+        assert g["home_team"] and g["away_team"]
+
+
+def test_query_budget_raises_when_exceeded():
+    set_query_budget("GET /api/teams", 0)
+    try:
+        with pytest.raises(QueryBudgetExceeded):
+            client.get("/api/teams")
+    finally:
+        set_query_budget("GET /api/teams", None)
+
+
+def test_metrics_endpoint():
+    client.get("/api/games/today")
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'nba_http_requests_total{method="GET",route="/api/games/today",status="200"}' in resp.text
+    assert "# TYPE nba_http_request_duration_seconds histogram" in resp.text
+
+
+def test_admin_jobs_requires_admin(monkeypatch):
+    from backend.api import auth
+
+    assert client.get("/api/admin/jobs").status_code == 403
+    monkeypatch.setattr(auth, "ADMIN_USERNAMES", {f"tester_{_suffix}"})
+    resp = client.get("/api/admin/jobs")
+    assert resp.status_code == 200
+    assert "jobs" in resp.json()
+    assert "profiles" in client.get("/api/admin/profiles").json()
+
+
+def test_perf_report_requires_admin(monkeypatch):
+    from backend.api import auth
+
+    client.get("/api/teams")
+    assert client.get("/api/debug/perf?reset=true").status_code == 403
+    assert client.get("/api/debug/perf").status_code == 403
+    monkeypatch.setattr(auth, "ADMIN_USERNAMES", {f"tester_{_suffix}"})
+    assert client.get("/api/debug/perf").json()["routes"]
+    assert client.get("/api/debug/perf?reset=true").status_code == 200
+
+
+def test_failed_requests_tracked_by_route_template():
+    from backend.db.perf import perf_report
+    from backend.metrics import render_metrics
+
+    def boom(item: int):
+        raise RuntimeError("boom")
+
+    app.add_api_route("/api/test-boom/{item}", boom)
+    try:
+        with pytest.raises(RuntimeError):
+            client.get("/api/test-boom/7")
+    finally:
+        app.router.routes.pop()
+    names = {r["name"] for r in perf_report()["routes"]}
+    assert "GET /api/test-boom/{item}" in names
+    assert 'nba_http_request_db_queries_count{route="/api/test-boom/{item}"}' in render_metrics()
+    assert "/api/test-boom/7" not in names
+
+
+def test_ready_after_warm_up():
+    from backend.startup import warm_up
+
+    assert warm_up(embedded_scheduler=False)
+    resp = client.get("/api/ready")
+    assert resp.status_code == 200
+    assert {"models", "player_index", "live_games"} <= set(resp.json()["steps"])
+    assert resp.json()["scheduler"]["embedded"] is False
+    assert "leader_elected" in resp.json()["scheduler"]
+
+
+def _picks_query_count():
+    resp = client.get("/api/picks")
+    assert resp.status_code == 200
+    return int(resp.headers["server-timing"].split('desc="')[1].split()[0])
+
+
+def test_authenticated_requests_reuse_cached_user():
+    from backend.api.auth import invalidate_user, _user_cache
+    from backend.db.models import SessionLocal, User
+
+    _picks_query_count()
+    invalidate_user()
+    cold = _picks_query_count()
+    warm = _picks_query_count()
+    assert warm == cold - 1
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter_by(username=f"tester_{_suffix}").first()
+        user.email = f"discarded_{_suffix}@example.com"
+        db.flush()
+        assert user.id in _user_cache
+        db.rollback()
+        assert user.id in _user_cache
+
+        user.email = f"renamed_{_suffix}@example.com"
+        db.flush()
+        assert user.id in _user_cache
+        db.commit()
+        assert user.id not in _user_cache
+    finally:
+        db.close()
+    assert _picks_query_count() == cold
+    assert client.get("/auth/me").json()["email"] == f"renamed_{_suffix}@example.com"
+
+
+def test_cached_user_needs_no_session(monkeypatch):
+    from backend.api import auth
+
+    assert client.get("/auth/me").status_code == 200
+
+    def no_session():
+        raise AssertionError("opened a session on a cache hit")
+
+    monkeypatch.setattr(auth, "SessionLocal", no_session)
+    resp = client.get("/auth/me")
+    assert resp.status_code == 200
+    assert resp.headers["server-timing"].startswith("db;dur=0")
+
+
+def test_response_cache_prunes_and_bounds_entries():
+    from backend.api.routes import _cache_put
+
+    cache = {}
+    _cache_put(cache, "old", {"time": 0}, ttl_seconds=60)
+    for i in range(5):
+        _cache_put(cache, i, {"time": 100 + i}, ttl_seconds=60, max_entries=3)
+    assert list(cache) == [2, 3, 4]
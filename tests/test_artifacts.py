@@ -0,0 +1,42 @@
+import json
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression, LinearRegression
+from backend.models.artifacts import artifact_from_estimator, write_artifact, read_artifact, predict
+
+SCHEMA = {"name": "test", "version": 1, "fingerprint": "0", "features": ["a", "b", "c"]}
+
+
+def _data():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(200, 3))
+    return X, X @ np.array([1.5, -2.0, 0.5]) + 0.3
+
+
+def test_linear_artifact_matches_sklearn(tmp_path):
+    X, y = _data()
+    model = LinearRegression().fit(X, y)
+    write_artifact(tmp_path, artifact_from_estimator(model, "reg", "linear", SCHEMA))
+    artifact = read_artifact(tmp_path / "reg.json")
+    assert np.allclose(predict(artifact, X), model.predict(X))
+
+
+def test_logistic_artifact_matches_sklearn(tmp_path):
+    X, y = _data()
+    model = LogisticRegression().fit(X, (y > 0).astype(int))
+    write_artifact(tmp_path, artifact_from_estimator(model, "clf", "logistic", SCHEMA))
+    artifact = read_artifact(tmp_path / "clf.json")
+    assert np.allclose(predict(artifact, X), model.predict_proba(X)[:, 1])
+
+
+def test_tampered_artifact_is_rejected(tmp_path):
+    X, y = _data()
+    path = write_artifact(tmp_path, artifact_from_estimator(LinearRegression().fit(X, y), "reg", "linear", SCHEMA))
+    with open(path) as f:
+        payload = json.load(f)
+    payload["coef"][0] += 1
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    with pytest.raises(ValueError):
+        read_artifact(path)
+    assert not list(tmp_path.glob("*.tmp"))
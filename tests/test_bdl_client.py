@@ -0,0 +1,82 @@
+import pytest
+from backend.ingest import bdl_client
+from benchmarks.mock_bdl import MockBDL
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    monkeypatch.setenv("BDL_API_KEY", "test")
+    monkeypatch.setattr(bdl_client, "MIN_REQUEST_INTERVAL", 0)
+    monkeypatch.setattr(bdl_client, "RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(bdl_client, "BACKGROUND_RESERVE", 0)
+    api = MockBDL(seed=3, games_per_season=60)
+    bdl_client.set_transport(api.transport())
+    bdl_client.clear_cache()
+    bdl_client.reset_request_stats()
+    yield api
+    bdl_client.set_transport(None)
+    bdl_client.clear_cache()
+
+
+def test_fetches_games_and_stats_through_transport(mock_api):
+    date = mock_api.games[0]["date"]
+    games = bdl_client.fetch_todays_games(date)
+    assert {g["id"] for g in games} == {g["id"] for g in mock_api.games_by_date[date]}
+
+    final = next(g for g in mock_api.games if g["status"] == "Final")
+    stats = bdl_client.fetch_game_stats(final["id"])
+    assert len(stats) == len(mock_api.stats_by_game[final["id"]])
+    assert sum(s["pts"] for s in stats if s["team"]["id"] == final["home_team"]["id"]) == final["home_team_score"]
+
+    season = bdl_client.fetch_all_season_games(season=final["season"])
+    assert len(season) == len(mock_api.games)
+
+
+def test_retries_after_rate_limit(mock_api):
+    mock_api.throttle_every = 2
+    bdl_client.fetch_todays_games(mock_api.games[0]["date"])
+    games = bdl_client.fetch_todays_games(mock_api.games[-1]["date"])
+    assert games
+    assert bdl_client.request_stats()["rate_limited"] == 1
+    assert mock_api.counters["throttled"] == 1
+
+
+def test_background_jobs_leave_budget_for_live_polls(mock_api, monkeypatch):
+    monkeypatch.setattr(bdl_client, "REQUESTS_PER_MINUTE", 8)
+    monkeypatch.setattr(bdl_client, "BACKGROUND_RESERVE", 0.5)
+    bdl_client.reset_request_budget()
+    try:
+        for date in list(mock_api.games_by_date)[:4]:
+            assert bdl_client.has_request_budget(background=True)
+            bdl_client.fetch_todays_games(date)
+        assert not bdl_client.has_request_budget(background=True)
+        assert bdl_client.has_request_budget(background=False)
+    finally:
+        monkeypatch.undo()
+        bdl_client.reset_request_budget()
+
+
+def test_live_polls_skip_the_background_reserve(monkeypatch):
+    monkeypatch.setattr(bdl_client, "REQUESTS_PER_MINUTE", 8)
+    monkeypatch.setattr(bdl_client, "BACKGROUND_RESERVE", 0.5)
+    waits = []
+
+    def fake_sleep(seconds):
+        waits.append(seconds)
+        bdl_client.reset_request_budget()
+
+    monkeypatch.setattr(bdl_client.time, "sleep", fake_sleep)
+    bdl_client.reset_request_budget()
+    try:
+        for _ in range(4):
+            bdl_client._consume_budget()
+        assert not waits
+        with bdl_client.live_priority():
+            for _ in range(3):
+                bdl_client._consume_budget()
+        assert not waits
+        bdl_client._consume_budget()
+        assert len(waits) == 1
+    finally:
+        monkeypatch.undo()
+        bdl_client.reset_request_budget()
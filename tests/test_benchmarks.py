@@ -0,0 +1,37 @@
+from benchmarks.endpoints import compare_results
+
+
+def _result(p50=10.0, p95=12.0, sql=4, alloc=100.0):
+    return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p95, "sql_statements": sql, "peak_alloc_kib": alloc}
+
+
+def test_compare_results_flags_regressions():
+    baseline = {"endpoints": {"/api/odds": _result(p50=20.0, p95=30.0), "/api/picks": _result()}}
+    current = {"endpoints": {
+        "/api/odds": _result(p50=45.0, p95=32.0, sql=6, alloc=2000.0),
+        "/api/picks": _result(p50=13.0, p95=16.0),
+        "/api/new": _result(),
+    }}
+    failures = compare_results(current, baseline)
+    assert len(failures) == 3
+    assert all(f.startswith("/api/odds") for f in failures)
+    assert any("p50_ms" in f for f in failures)
+    assert any("sql_statements" in f for f in failures)
+    assert any("peak_alloc_kib" in f for f in failures)
+
+
+def test_compare_results_within_thresholds():
+    baseline = {"endpoints": {"/api/odds": _result(sql=10)}}
+    current = {"endpoints": {"/api/odds": _result(p50=14.0, p95=17.0, sql=11, alloc=300.0)}}
+    assert compare_results(current, baseline) == []
+
+
+def test_compare_startup_flags_slower_starts_and_new_heavy_imports():
+    from benchmarks.startup import compare_startup
+
+    baseline = {"import_ms": 900.0, "serving_ms": 1000.0, "ready_ms": 1100.0, "loaded_at_import": ["numpy"]}
+    assert compare_startup({**baseline, "ready_ms": 1300.0}, baseline) == []
+    failures = compare_startup({**baseline, "import_ms": 1500.0, "loaded_at_import": ["numpy", "sklearn"]}, baseline)
+    assert len(failures) == 2
+    assert any("import_ms" in f for f in failures)
+    assert any("sklearn" in f for f in failures)
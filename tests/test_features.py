@@ -41,3 +41,89 @@ def test_edge_math():
     payout_mult = 100 / abs(odds)
     ev = true_prob * payout_mult - (1 - true_prob)
     assert ev > 0
+
+
+def test_prop_consensus_matches_statistics():
+    import statistics
+    from collections import namedtuple
+    from backend.features.consensus import compute_consensus
+
+    Row = namedtuple("Row", "game_id player_id player_name team_id prop_type vendor line over_odds under_odds snapshot_at")
+    rows = [
+        Row(1, 101, "LeBron James", 14, "PTS", "A", 24.5, -110, -115, None),
+        Row(1, 101, "LeBron James", 14, "PTS", "B", 25.5, -105, None, None),
+        Row(1, 101, "LeBron James", 14, "PTS", "C", 27.0, None, -120, None),
+        Row(1, 101, "LeBron James", 14, "PTS", "D", 27.5, -130, -100, None),
+        Row(1, 101, "LeBron James", 14, "REB", "A", 7.5, -110, -110, None),
+    ]
+    result = compute_consensus(rows)
+    assert len(result) == 2
+    pts, reb = result
+    lines = [24.5, 25.5, 27.0, 27.5]
+    assert pts["consensus_line"] == round(statistics.median(lines), 1)
+    assert pts["disagreement"] == round(statistics.stdev(lines), 2)
+    assert pts["best_over_odds"] == -105
+    assert pts["best_under_odds"] == -100
+    assert len(pts["vendors"]) == 4
+    assert reb["consensus_line"] == 7.5
+    assert reb["disagreement"] == 0
+
+
+def test_bulk_rolling_stats_match_per_player():
+    from backend.db.models import SessionLocal, FactBoxScore
+    from backend.features.engineering import load_rolling_stats
+
+    db = SessionLocal()
+    try:
+        player_ids = [pid for (pid,) in db.query(FactBoxScore.player_id).distinct().limit(5)]
+        rolling = load_rolling_stats(db, player_ids)
+        for pid in player_ids:
+            expected = compute_player_rolling_stats(pid)
+            for name, value in expected.items():
+                assert abs(rolling[pid][name] - value) < 1e-9
+    finally:
+        db.close()
+
+
+def test_player_summaries_match_box_scores():
+    from backend.db.models import SessionLocal, FactBoxScore, PlayerSummary
+    from backend.db.player_summary import rebuild_player_summaries
+
+    db = SessionLocal()
+    try:
+        maintained = {s.player_id: (s.games_tracked, s.last_game_id, s.pts) for s in db.query(PlayerSummary)}
+        rebuild_player_summaries(db)
+        rebuilt = {s.player_id: (s.games_tracked, s.last_game_id, s.pts) for s in db.query(PlayerSummary)}
+        assert maintained == rebuilt
+        for pid, (games_tracked, _, pts) in rebuilt.items():
+            box_scores = db.query(FactBoxScore).filter_by(player_id=pid).all()
+            assert games_tracked == len(box_scores)
+            assert pts == sum(bs.pts or 0 for bs in box_scores)
+    finally:
+        db.close()
+
+
+def test_serving_team_features_match_training_history():
+    from collections import deque
+    from backend.db.models import SessionLocal, DimGame
+    from backend.features.engineering import (
+        TEAM_ROLLING_GAMES, COMPLETED_GAME, team_fg_pct_by_game, team_result, team_features
+    )
+
+    db = SessionLocal()
+    try:
+        team_fg = team_fg_pct_by_game(db)
+        history = {}
+        for g in db.query(DimGame).filter(COMPLETED_GAME).order_by(DimGame.date, DimGame.id):
+            history.setdefault(g.home_team_id, deque(maxlen=TEAM_ROLLING_GAMES)).append(
+                team_result(g.home_team_score, g.visitor_team_score, team_fg.get((g.id, g.home_team_id))))
+            history.setdefault(g.visitor_team_id, deque(maxlen=TEAM_ROLLING_GAMES)).append(
+                team_result(g.visitor_team_score, g.home_team_score, team_fg.get((g.id, g.visitor_team_id))))
+    finally:
+        db.close()
+
+    assert history
+    for team_id, games in list(history.items())[:5]:
+        served = compute_team_rolling_stats(team_id)
+        for name, value in team_features(games).items():
+            assert abs(served[name] - value) < 1e-9
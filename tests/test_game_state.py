@@ -0,0 +1,25 @@
+from backend.db.game_state import (
+    STATE_SCHEDULED, STATE_LIVE, STATE_FINAL, normalize_status, update_live_game_ids, get_live_game_ids
+)
+
+
+def test_normalize_status():
+    assert normalize_status("Final") == STATE_FINAL
+    assert normalize_status("Final/OT") == STATE_FINAL
+    assert normalize_status("1st Qtr", 1) == STATE_LIVE
+    assert normalize_status("Halftime", 2) == STATE_LIVE
+    assert normalize_status("OT2", 6) == STATE_LIVE
+    assert normalize_status("In Progress") == STATE_LIVE
+    assert normalize_status("Scheduled") == STATE_SCHEDULED
+    assert normalize_status("2025-01-05T00:30:00Z") == STATE_SCHEDULED
+    assert normalize_status("7:30 pm ET") == STATE_SCHEDULED
+    assert normalize_status(None) == STATE_SCHEDULED
+
+
+def test_live_game_set_updates():
+    update_live_game_ids({1: STATE_LIVE, 2: STATE_LIVE})
+    update_live_game_ids({2: STATE_FINAL})
+    ids = get_live_game_ids()
+    assert 1 in ids
+    assert 2 not in ids
+    update_live_game_ids({1: STATE_FINAL})
@@ -0,0 +1,75 @@
+from backend.db.models import init_db, SessionLocal, DimGame, DimTeam, FactBoxScore, UserPick
+from backend.db.seed import seed_database
+from backend.jobs.grading import grade_pending_picks, payout_multiplier
+
+init_db()
+seed_database()
+
+
+def test_payout_multiplier():
+    mult = payout_multiplier([150, -200, 0])
+    assert abs(mult[0] - 2.5) < 1e-9
+    assert abs(mult[1] - 1.5) < 1e-9
+    assert mult[2] == 1
+
+
+def test_grade_pending_picks():
+    db = SessionLocal()
+    try:
+        game = db.query(DimGame).filter_by(id=900002).first()
+        home = db.query(DimTeam).filter_by(id=game.home_team_id).first()
+        away = db.query(DimTeam).filter_by(id=game.visitor_team_id).first()
+        winner = home if game.home_team_score > game.visitor_team_score else away
+        loser = away if winner is home else home
+        bs = db.query(FactBoxScore).filter_by(game_id=900002).first()
+        scheduled = db.query(DimGame).filter_by(id=900004).first()
+
+        picks = [
+            UserPick(game_id=900002, pick_type="moneyline", selection=winner.full_name, odds=150, stake=10),
+            UserPick(game_id=900002, pick_type="moneyline", selection=loser.full_name, odds=-120, stake=10),
+            UserPick(game_id=900002, pick_type="player_prop", selection="over", odds=-110, stake=10,
+                     player_id=bs.player_id, stat_type="PTS", line=bs.pts - 0.5, pick_side="over"),
+            UserPick(game_id=900002, pick_type="player_prop", selection="under", odds=-110, stake=10,
+                     player_id=bs.player_id, stat_type="PRA", line=float(bs.pts + bs.reb + bs.ast),
+                     pick_side="under"),
+            UserPick(game_id=scheduled.id, pick_type="moneyline", selection=home.full_name, odds=-110, stake=10),
+        ]
+        db.add_all(picks)
+        db.commit()
+        ids = [p.id for p in picks]
+
+        grade_pending_picks(db, [900002, scheduled.id])
+        db.expire_all()
+        graded = [db.query(UserPick).filter_by(id=i).first() for i in ids]
+        assert graded[0].result == "win" and abs(graded[0].payout - 25) < 1e-6
+        assert graded[1].result == "loss" and graded[1].payout == 0
+        assert graded[2].result == "win" and graded[2].actual_stat == bs.pts
+        assert graded[3].result == "push" and graded[3].payout == 10
+        assert graded[4].result == "pending" and graded[4].graded_at is None
+
+        for p in graded:
+            db.delete(p)
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_ledger_deltas_upsert_into_one_bucket():
+    from backend.db.models import UserPickLedger
+    from backend.db.ledger import apply_deltas, new_deltas, add_delta, pick_delta
+
+    bucket = (990001, "ledger_test", "2031-01")
+    writers = [SessionLocal(), SessionLocal()]
+    try:
+        for db in writers:
+            deltas = new_deltas()
+            add_delta(deltas, bucket, pick_delta("win", 10, 19))
+            apply_deltas(db, deltas)
+            db.commit()
+        row = writers[0].query(UserPickLedger).filter_by(user_id=990001, pick_type="ledger_test").one()
+        assert (row.total_picks, row.wins, row.total_staked, row.total_payout) == (2, 2, 20, 38)
+    finally:
+        writers[0].query(UserPickLedger).filter_by(user_id=990001).delete()
+        writers[0].commit()
+        for db in writers:
+            db.close()
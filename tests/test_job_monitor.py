@@ -0,0 +1,66 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from apscheduler.events import (
+    EVENT_JOB_EXECUTED, EVENT_JOB_MAX_INSTANCES, JobExecutionEvent, JobSubmissionEvent
+)
+from apscheduler.schedulers.background import BackgroundScheduler
+from backend.db.perf import tracked_job, recent_job_runs, record_http
+from backend.jobs import monitor
+from backend.metrics import JOB_SKIPPED, JOB_OVERRUNS
+
+
+def _noop():
+    pass
+
+
+def test_skipped_and_overrun_runs_are_counted():
+    monitor.reset_monitor()
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(_noop, "interval", seconds=15, id="monitor_test_job")
+    skipped_before = JOB_SKIPPED.value("monitor_test_job", "max_instances")
+    overruns_before = JOB_OVERRUNS.value("monitor_test_job")
+
+    now = datetime.now(timezone.utc)
+    monitor.handle_job_event(JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, "monitor_test_job", "default", [now]),
+                             scheduler)
+    monitor.handle_job_event(JobExecutionEvent(EVENT_JOB_EXECUTED, "monitor_test_job", "default",
+                                               now - timedelta(seconds=40)), scheduler)
+    monitor.handle_job_event(JobExecutionEvent(EVENT_JOB_EXECUTED, "monitor_test_job", "default", now), scheduler)
+
+    health = next(j for j in monitor.job_health(scheduler) if j["id"] == "monitor_test_job")
+    assert health["skipped"] == 1
+    assert health["runs"] == 2
+    assert health["overruns"] == 1
+    assert health["interval_seconds"] == 15
+    assert JOB_SKIPPED.value("monitor_test_job", "max_instances") == skipped_before + 1
+    assert JOB_OVERRUNS.value("monitor_test_job") == overruns_before + 1
+
+
+def test_tracked_job_splits_http_and_cpu_time():
+    def monitor_phase_job():
+        record_http(12.5)
+        sum(range(10000))
+
+    tracked_job(monitor_phase_job)()
+    run = recent_job_runs("monitor_phase_job")[-1]
+    assert run["status"] == "success"
+    assert run["http_calls"] == 1
+    assert run["http_ms"] == 12.5
+    assert run["cpu_ms"] >= 0
+
+
+def test_slow_runs_are_profiled_to_disk(tmp_path):
+    monitor.reset_monitor()
+    previous = monitor.configure_profiling()
+    monitor.configure_profiling(enabled=True, threshold=0.01, directory=str(tmp_path))
+    try:
+        monitor.profiled(lambda: time.sleep(0.02))()
+        monitor.profiled(lambda: None)()
+    finally:
+        monitor.configure_profiling(previous["profile"], previous["profile_threshold"], previous["profile_dir"])
+
+    profiles = monitor.recent_profiles()
+    assert len(profiles) == 1
+    assert os.path.exists(profiles[0]["path"])
+    assert "cumulative" in profiles[0]["top"]
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime, timedelta
+from backend.db.models import init_db
+from backend.db.lease import acquire_lease, release_lease, current_lease
+
+init_db()
+
+
+def test_only_one_holder_gets_the_lease():
+    name = f"test_{uuid.uuid4().hex[:8]}"
+    now = datetime.utcnow()
+    assert acquire_lease("worker-a", name, ttl_seconds=30, now=now)
+    assert not acquire_lease("worker-b", name, ttl_seconds=30, now=now)
+    assert acquire_lease("worker-a", name, ttl_seconds=30, now=now + timedelta(seconds=10))
+    assert current_lease(name)["holder"] == "worker-a"
+
+    later = now + timedelta(seconds=60)
+    assert acquire_lease("worker-b", name, ttl_seconds=30, now=later)
+    assert not acquire_lease("worker-a", name, ttl_seconds=30, now=later)
+    assert current_lease(name)["acquired_at"] == later.isoformat()
+
+
+def test_released_lease_can_be_taken_over():
+    name = f"test_{uuid.uuid4().hex[:8]}"
+    assert acquire_lease("worker-a", name)
+    release_lease("worker-b", name)
+    assert not acquire_lease("worker-b", name)
+    release_lease("worker-a", name)
+    assert not current_lease(name)["active"]
+    assert acquire_lease("worker-b", name, now=datetime.utcnow() + timedelta(seconds=1))
+
+
+def test_leader_keeps_renewing_while_seeding(monkeypatch):
+    import threading
+    import time
+    from backend.db import lease, seed
+    from backend.db.lease import leader_status, standing_down
+    from backend.jobs import worker
+
+    seeding, finish_seed = threading.Event(), threading.Event()
+    started = []
+    monkeypatch.setattr(lease, "_leadership", {})
+    monkeypatch.setattr(seed, "seed_database", lambda: (seeding.set(), finish_seed.wait(5)))
+    monkeypatch.setattr(worker, "start_scheduler", lambda: started.append(True))
+
+    stop = threading.Event()
+    thread = threading.Thread(target=worker.run_leader_loop, args=(stop, "test-leader", 0.02))
+    thread.start()
+    try:
+        assert seeding.wait(5)
+        first = datetime.fromisoformat(current_lease()["expires_at"])
+        time.sleep(0.1)
+        assert datetime.fromisoformat(current_lease()["expires_at"]) > first
+        assert worker.is_leader() and not started
+        assert leader_status()["holder"] == "test-leader"
+        finish_seed.set()
+        deadline = time.monotonic() + 5
+        while not started and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert started == [True]
+    finally:
+        finish_seed.set()
+        stop.set()
+        thread.join(5)
+    assert not current_lease()["active"]
+    assert standing_down()
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+from backend.db.game_state import STATE_SCHEDULED, STATE_LIVE, STATE_FINAL, parse_tipoff
+from backend.jobs.live_cadence import (
+    MODE_IDLE, MODE_PREGAME, MODE_LIVE, MODE_CLUTCH, cadence_for, clock_seconds, is_clutch
+)
+
+NOW = datetime(2025, 1, 10, 0, 0)
+TODAY = ["2025-01-09"]
+
+
+def test_clock_and_clutch_detection():
+    assert clock_seconds("Q4 2:31") == 151
+    assert clock_seconds("") is None
+    assert is_clutch(4, "2:59")
+    assert not is_clutch(4, "5:00")
+    assert not is_clutch(3, "0:30")
+    assert is_clutch(5, "")
+
+
+def test_cadence_follows_the_slate():
+    assert cadence_for([], TODAY, NOW) == MODE_IDLE
+    far = (STATE_SCHEDULED, 0, "", NOW + timedelta(hours=5), "2025-01-10")
+    assert cadence_for([far], TODAY, NOW) == MODE_IDLE
+    soon = (STATE_SCHEDULED, 0, "", NOW + timedelta(minutes=30), "2025-01-09")
+    assert cadence_for([far, soon], TODAY, NOW) == MODE_PREGAME
+    undated = (STATE_SCHEDULED, 0, "", None, "2025-01-09")
+    assert cadence_for([undated], TODAY, NOW) == MODE_PREGAME
+    live = (STATE_LIVE, 2, "6:12", None, "2025-01-09")
+    assert cadence_for([soon, live], TODAY, NOW) == MODE_LIVE
+    clutch = (STATE_LIVE, 4, "1:45", None, "2025-01-09")
+    assert cadence_for([live, clutch, (STATE_FINAL, 4, "", None, "2025-01-09")], TODAY, NOW) == MODE_CLUTCH
+
+
+def test_parse_tipoff():
+    assert parse_tipoff({"datetime": "2025-01-10T00:30:00.000Z"}) == datetime(2025, 1, 10, 0, 30)
+    assert parse_tipoff({"status": "2025-01-10T00:30:00Z"}) == datetime(2025, 1, 10, 0, 30)
+    assert parse_tipoff({"status": "3rd Qtr"}) is None
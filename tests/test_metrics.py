@@ -0,0 +1,37 @@
+import pytest
+from backend.metrics import Counter, Gauge, Histogram, counter, render_metrics
+
+
+def test_histogram_renders_cumulative_buckets():
+    h = Histogram("test_latency_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        h.observe(value, "/a")
+    lines = h.render()
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'test_latency_seconds_count{route="/a"} 4' in lines
+    assert h.count("/a") == 4
+
+
+def test_counter_and_gauge_labels():
+    c = Counter("test_requests_total", "Requests", ("status",))
+    c.inc(200)
+    c.inc(200, amount=2)
+    assert c.value(200) == 3
+    with pytest.raises(ValueError):
+        c.inc()
+
+    g = Gauge("test_entries", "Entries", callback=lambda: [((), 7)])
+    assert "test_entries 7" in g.render()
+
+
+def test_registry_reuses_and_renders_metrics():
+    first = counter("nba_test_registered_total", "Registered", ("kind",))
+    assert counter("nba_test_registered_total", "Registered", ("kind",)) is first
+    with pytest.raises(ValueError):
+        counter("nba_test_registered_total", "Registered", ("other",))
+    first.inc('a"b')
+    text = render_metrics()
+    assert "# TYPE nba_test_registered_total counter" in text
+    assert 'nba_test_registered_total{kind="a\\"b"} 1' in text
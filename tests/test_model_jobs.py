@@ -0,0 +1,91 @@
+import time
+from fastapi.testclient import TestClient
+from backend.main import app
+from backend.db.models import init_db
+from backend.db.seed import seed_database
+from backend.jobs import model_jobs
+
+init_db()
+seed_database()
+
+client = TestClient(app)
+
+
+def _wait_for(job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        model_jobs.run_pending_jobs()
+        job = client.get(f"/api/model/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError("retrain job did not finish")
+
+
+def test_retrain_job_lifecycle():
+    resp = client.post("/api/model/retrain")
+    assert resp.status_code == 202
+    job = _wait_for(resp.json()["id"])
+    assert job["status"] == "succeeded"
+    assert job["progress"] == 1.0
+    assert "win_probability" in job["result"]
+    assert job["duration_seconds"] is not None
+    assert "fitting" in job["stages"]
+    assert any(j["id"] == job["id"] for j in client.get("/api/model/jobs").json()["jobs"])
+
+
+def test_duplicate_retrain_is_deduplicated():
+    first, created = model_jobs.submit_retrain()
+    second, created_again = model_jobs.submit_retrain()
+    assert created and not created_again
+    assert first["id"] == second["id"]
+    assert first["status"] == "queued"
+    resp = client.post("/api/model/retrain")
+    assert resp.json()["id"] == first["id"]
+    assert resp.json()["deduplicated"] is True
+    assert _wait_for(first["id"])["status"] == "succeeded"
+
+
+def test_queued_job_is_claimed_once(monkeypatch):
+    from datetime import datetime, timedelta
+    from backend.db.models import SessionLocal, ModelJob
+
+    job, _ = model_jobs.submit_retrain()
+    assert model_jobs._claim_next() == job["id"]
+    assert model_jobs._claim_next() is None
+    assert model_jobs.get_job(job["id"])["status"] == "running"
+
+    db = SessionLocal()
+    try:
+        db.query(ModelJob).filter_by(id=job["id"]).update(
+            {"updated_at": datetime.utcnow() - timedelta(seconds=model_jobs.STALE_JOB_SECONDS + 1)})
+        db.commit()
+    finally:
+        db.close()
+    assert model_jobs.run_pending_jobs() == 0
+    assert model_jobs.get_job(job["id"])["status"] == "failed"
+    assert model_jobs.submit_retrain()[1]
+    model_jobs.run_pending_jobs()
+
+
+def test_unclaimed_job_expires():
+    from datetime import datetime, timedelta
+    from backend.db.models import SessionLocal, ModelJob
+
+    job, _ = model_jobs.submit_retrain()
+    assert "runner_active" in client.post("/api/model/retrain").json()
+    db = SessionLocal()
+    try:
+        db.query(ModelJob).filter_by(id=job["id"]).update(
+            {"created_at": datetime.utcnow() - timedelta(seconds=model_jobs.QUEUED_JOB_SECONDS + 1)})
+        db.commit()
+    finally:
+        db.close()
+    replacement, created = model_jobs.submit_retrain()
+    assert created and replacement["id"] != job["id"]
+    assert model_jobs.get_job(job["id"])["error"] == "no runner claimed the job"
+    model_jobs.run_pending_jobs()
+
+
+def test_unknown_job():
+    assert client.get("/api/model/jobs/missing").status_code == 404
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from backend.db.models import init_db, SessionLocal, FactOddsSnapshot, FactOddsLatest, FactLineRollup
+from backend.ingest.odds import record_odds_snapshot, compact_odds_history, rebuild_latest_odds
+from backend.ingest.line_rollups import bucket_start, get_line_movement
+from backend.db.data_versions import data_version
+
+init_db()
+
+TEST_GAME_ID = 990001
+
+
+def _cleanup(db):
+    db.query(FactOddsSnapshot).filter_by(game_id=TEST_GAME_ID).delete()
+    db.query(FactOddsLatest).filter_by(game_id=TEST_GAME_ID).delete()
+    db.query(FactLineRollup).filter_by(game_id=TEST_GAME_ID).delete()
+    db.commit()
+
+
+def test_record_snapshot_skips_unchanged_lines():
+    db = SessionLocal()
+    try:
+        _cleanup(db)
+        start = datetime.utcnow() - timedelta(hours=1)
+        for i, line in enumerate([-3.5, -3.5, -4.0, -4.0, -3.5]):
+            record_odds_snapshot(db, TEST_GAME_ID, "TestBook", "game", snapshot_at=start + timedelta(minutes=i),
+                                 home_line=line, away_line=-line, total=220.5)
+        db.commit()
+
+        history = db.query(FactOddsSnapshot).filter_by(game_id=TEST_GAME_ID).all()
+        assert [h.home_line for h in sorted(history, key=lambda h: h.snapshot_at)] == [-3.5, -4.0, -3.5]
+        latest = db.query(FactOddsLatest).filter_by(game_id=TEST_GAME_ID).one()
+        assert latest.home_line == -3.5
+        assert latest.open_home_line == -3.5
+        assert latest.last_seen_at == start + timedelta(minutes=4)
+    finally:
+        _cleanup(db)
+        db.close()
+
+
+def test_odds_version_moves_only_on_commit():
+    db = SessionLocal()
+    try:
+        _cleanup(db)
+        before = data_version(db, "odds")
+        record_odds_snapshot(db, TEST_GAME_ID, "TestBook", "game", home_line=-1.5, away_line=1.5)
+        db.rollback()
+        assert data_version(db, "odds") == before
+
+        record_odds_snapshot(db, TEST_GAME_ID, "TestBook", "game", home_line=-1.5, away_line=1.5)
+        reader = SessionLocal()
+        try:
+            assert data_version(reader, "odds") == before
+            db.commit()
+            assert data_version(reader, "odds") == before + 1
+        finally:
+            reader.close()
+    finally:
+        _cleanup(db)
+        db.close()
+
+
+def test_compaction_and_rebuild():
+    db = SessionLocal()
+    try:
+        _cleanup(db)
+        start = datetime.utcnow() - timedelta(hours=1)
+        for i, line in enumerate([-2.0, -2.0, -2.0, -2.5, -2.5]):
+            db.add(FactOddsSnapshot(game_id=TEST_GAME_ID, vendor="TestBook", market_type="game",
+                                    home_line=line, snapshot_at=start + timedelta(minutes=i)))
+        db.commit()
+
+        compact_odds_history(db)
+        remaining = db.query(FactOddsSnapshot).filter_by(game_id=TEST_GAME_ID).count()
+        assert remaining == 2
+
+        rebuild_latest_odds(db)
+        latest = db.query(FactOddsLatest).filter_by(game_id=TEST_GAME_ID).one()
+        assert latest.home_line == -2.5
+        assert latest.open_home_line == -2.0
+    finally:
+        _cleanup(db)
+        db.close()
+
+
+def test_bucket_start():
+    ts = datetime(2025, 1, 5, 19, 47, 31)
+    assert bucket_start(ts, 60) == datetime(2025, 1, 5, 19, 47)
+    assert bucket_start(ts, 300) == datetime(2025, 1, 5, 19, 45)
+    assert bucket_start(ts, 3600) == datetime(2025, 1, 5, 19, 0)
+
+
+def test_line_rollups():
+    db = SessionLocal()
+    try:
+        _cleanup(db)
+        start = datetime(2025, 1, 5, 19, 0)
+        for i, line in enumerate([-3.0, -3.5, -2.5, -4.0, -3.5, -3.5]):
+            record_odds_snapshot(db, TEST_GAME_ID, "TestBook", "game", snapshot_at=start + timedelta(minutes=i),
+                                 home_line=line, total=221.0)
+        db.commit()
+
+        hourly = get_line_movement(db, TEST_GAME_ID, "1h", market="spread")
+        assert len(hourly) == 1
+        point = hourly[0]["points"][0]
+        assert (point["open"], point["high"], point["low"], point["close"], point["count"]) == \
+            (-3.0, -2.5, -4.0, -3.5, 6)
+
+        five_min = get_line_movement(db, TEST_GAME_ID, "5m", market="spread")[0]["points"]
+        assert [p["count"] for p in five_min] == [5, 1]
+        assert len(get_line_movement(db, TEST_GAME_ID, "1m", market="spread")[0]["points"]) == 6
+    finally:
+        _cleanup(db)
+        db.close()
+
+
+def test_line_rollups_handle_out_of_order_snapshots():
+    db = SessionLocal()
+    try:
+        _cleanup(db)
+        start = datetime(2025, 1, 5, 19, 0)
+        for minute, line in [(30, -3.0), (5, -2.0), (50, -4.5), (40, -5.0)]:
+            record_odds_snapshot(db, TEST_GAME_ID, "TestBook", "game", snapshot_at=start + timedelta(minutes=minute),
+                                 home_line=line)
+        db.commit()
+
+        point = get_line_movement(db, TEST_GAME_ID, "1h", market="spread")[0]["points"][0]
+        assert (point["open"], point["high"], point["low"], point["close"], point["count"]) == \
+            (-2.0, -2.0, -5.0, -4.5, 4)
+    finally:
+        _cleanup(db)
+        db.close()
@@ -0,0 +1,91 @@
+import time
+from backend.db.models import init_db
+from backend.db.seed import seed_database
+from backend.db.player_search import rebuild_player_index, search_index, normalize_name, trigrams
+
+init_db()
+seed_database()
+rebuild_player_index()
+
+
+def _names(query):
+    return [r["full_name"] for r in search_index(query)]
+
+
+def test_normalize_name():
+    assert normalize_name("  Luka Dončić ") == "luka doncic"
+    assert normalize_name("Shai Gilgeous-Alexander") == "shai gilgeous alexander"
+    assert "  l" in trigrams("lebron")
+
+
+def test_prefix_and_full_name():
+    assert _names("lebron james")[0] == "LeBron James"
+    assert "LeBron James" in _names("leb")
+    assert "LeBron James" in _names("le ja")
+
+
+def test_typo_tolerance():
+    assert "LeBron James" in _names("lebrn")
+    assert "Stephen Curry" in _names("stephn cury")
+
+
+def test_ranking_and_team_payload():
+    results = search_index("james")
+    assert results
+    assert all(r["team"] is not None for r in results)
+    assert search_index("zzzzqqq") == []
+
+
+def test_typeahead_latency():
+    start = time.perf_counter()
+    for q in ["le", "leb", "lebr", "lebro", "curry", "giannis"]:
+        search_index(q)
+    assert (time.perf_counter() - start) / 6 < 0.01
+
+
+def test_index_refreshes_when_players_change():
+    from backend.db.models import SessionLocal, DimPlayer
+    from backend.db.player_search import refresh_player_index
+
+    search_index("lebron")
+    assert not refresh_player_index(force=True)
+    db = SessionLocal()
+    try:
+        db.add(DimPlayer(id=990001, first_name="Wembanyama", last_name="Victor", position="C", team_id=27))
+        db.commit()
+        assert refresh_player_index(force=True)
+        assert "Wembanyama Victor" in _names("wembanyama")
+    finally:
+        db.query(DimPlayer).filter_by(id=990001).delete()
+        db.commit()
+        db.close()
+    assert refresh_player_index(force=True)
+    assert "Wembanyama Victor" not in _names("wembanyama")
+
+
+def test_enrichment_is_queued_for_the_scheduler(monkeypatch):
+    from backend.db.models import SessionLocal, DimPlayer, PlayerSearchRequest
+    from backend.db import player_search
+    from backend.ingest import bdl_client
+
+    calls = []
+    monkeypatch.setattr(bdl_client, "fetch_players", lambda search=None, page=1: calls.append(search) or [
+        {"id": 990002, "first_name": "Cooper", "last_name": "Flagg", "position": "F", "team": {"id": 7}},
+    ])
+    assert player_search.schedule_enrichment("cooper flagg")
+    assert not player_search.schedule_enrichment("Cooper Flagg")
+    assert calls == []
+
+    db = SessionLocal()
+    try:
+        assert player_search.process_enrichment_requests() == 1
+        assert calls == ["cooper flagg"]
+        assert db.query(PlayerSearchRequest).filter_by(query_key="cooper flagg").one().processed_at is not None
+        assert "Cooper Flagg" in _names("flagg")
+    finally:
+        db.query(DimPlayer).filter_by(id=990002).delete()
+        db.query(PlayerSearchRequest).filter_by(query_key="cooper flagg").delete()
+        db.commit()
+        db.close()
+        player_search._enrich_recent.clear()
+    player_search.refresh_player_index(force=True)
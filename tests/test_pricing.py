@@ -0,0 +1,23 @@
+import numpy as np
+from backend.models.pricing import implied_probability, payout_multiplier, expected_value, prop_side_probabilities
+
+
+def test_implied_probability():
+    probs = implied_probability([-110, 150, 100])
+    assert np.allclose(probs, [110 / 210, 100 / 250, 0.5])
+
+
+def test_expected_value_matches_scalar_formula():
+    odds = np.array([-110, 150, -200])
+    prob = np.array([0.55, 0.45, 0.6])
+    payout = np.where(odds > 0, odds / 100, 100 / np.abs(odds))
+    assert np.allclose(expected_value(prob, odds), prob * payout - (1 - prob))
+    assert np.allclose(payout_multiplier(odds), 1 + payout)
+
+
+def test_prop_side_probabilities():
+    over, under = prop_side_probabilities([25.0, 25.0, 8.0], [24.5, 25.0, 8.5])
+    assert np.allclose(over[0] + under[0], 1)
+    assert over[1] + under[1] < 1
+    assert over[0] > over[1]
+    assert under[2] > 0.5
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from backend.features.schema import build_matrix, schema_info, validate_schema, FEATURE_SCHEMAS
+
+
+def test_pair_schema_gathers_differences_and_constants():
+    rows = [{"win_pct": 0.7, "net_rating": 5, "avg_scored": 112, "avg_fg_pct": 0.48}, {}]
+    X = build_matrix("win_matchup", rows, [(0, 1), (1, 0)])
+    assert np.allclose(X[0], [0.2, 5, 12, 0.03, 0.03])
+    assert np.allclose(X[1], [-0.2, -5, -12, -0.03, 0.03])
+
+
+def test_single_schema_uses_registry_order_and_defaults():
+    X = build_matrix("player_rolling", [{"avg_fg3m": 2.5, "avg_pts": 20}])
+    assert X.shape == (1, len(FEATURE_SCHEMAS["player_rolling"]["features"]))
+    assert X[0, 0] == 20 and X[0, -1] == 2.5 and X[0, 1] == 0
+
+
+def test_validate_schema_rejects_drift():
+    info = schema_info("player_rolling")
+    validate_schema(info, "player_rolling")
+    with pytest.raises(ValueError):
+        validate_schema({**info, "version": info["version"] + 1})
+    with pytest.raises(ValueError):
+        validate_schema({**info, "features": info["features"][:-1]})
+    with pytest.raises(ValueError):
+        validate_schema(info, "win_matchup")
+
+
+def test_stale_artifact_schema_is_not_served(tmp_path, monkeypatch):
+    from backend.models import ml_models
+    from backend.models.artifacts import build_artifact, write_artifact
+
+    monkeypatch.setattr(ml_models, "MODELS_DIR", str(tmp_path))
+    info = schema_info("player_rolling")
+    write_artifact(tmp_path, build_artifact("player_prop_pts", "linear", [1.0] + [0.0] * 6, 0.0, info))
+    assert ml_models.predict_player_props([1], ["PTS"], features={1: {"avg_pts": 12}}) == {(1, "PTS"): 12.0}
+
+    stale = {**info, "version": info["version"] + 1}
+    write_artifact(tmp_path, build_artifact("player_prop_reb", "linear", [1.0] + [0.0] * 6, 0.0, stale))
+    assert ml_models.predict_player_props([1], ["REB"], features={1: {"avg_pts": 12}}) == {}
+
+
+def test_only_ensure_default_model_writes_the_fallback(tmp_path, monkeypatch):
+    import os
+    from backend.models import ml_models
+    from backend.models.artifacts import artifact_path
+
+    monkeypatch.setattr(ml_models, "MODELS_DIR", str(tmp_path))
+    assert ml_models.warm_models() == 0
+    probs = ml_models.predict_win_probabilities([(1, 2)], features={})
+    assert 0 < probs[0] < 1
+    assert not os.path.exists(artifact_path(str(tmp_path), "win_probability"))
+
+    ml_models.ensure_default_model()
+    assert os.path.exists(artifact_path(str(tmp_path), "win_probability"))
+    assert abs(ml_models.predict_win_probabilities([(1, 2)], features={})[0] - probs[0]) < 1e-9
@@ -0,0 +1,53 @@
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from backend.db.models import Base, DimGame, FactBoxScore, UserPick, UserPickLedger
+from backend.db.game_state import STATE_FINAL
+from backend.db.synthetic import generate_synthetic_data, _schedule_pairs, _schedule_days
+import numpy as np
+
+AS_OF = datetime(2026, 1, 20, 1, 30)
+
+
+def _generate(seed=7):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    counts = generate_synthetic_data(db, seed=seed, as_of=AS_OF, users=10, picks_per_user=5,
+                                     games_per_season=90)
+    return db, counts
+
+
+def test_full_schedule_is_balanced():
+    pairs = _schedule_pairs(np.random.default_rng(1), list(range(1, 31)), 1230)
+    games = Counter(t for pair in pairs for t in pair)
+    home = Counter(h for h, _ in pairs)
+    assert len(pairs) == 1230
+    assert set(games.values()) == {82}
+    assert set(home.values()) == {41}
+
+    by_day = {}
+    for day, h, a in _schedule_days(pairs, 170):
+        teams = by_day.setdefault(day, [])
+        teams.extend((h, a))
+    assert all(len(teams) == len(set(teams)) for teams in by_day.values())
+
+
+def test_generated_data_is_consistent_and_deterministic():
+    db, counts = _generate()
+    _, again = _generate()
+    counts.pop("seconds")
+    again.pop("seconds")
+    assert counts == again
+    assert counts["games"] == 90
+
+    for game in db.query(DimGame).filter(DimGame.state == STATE_FINAL):
+        assert game.home_team_score != game.visitor_team_score
+        home_pts = db.query(func.sum(FactBoxScore.pts)).filter(
+            FactBoxScore.game_id == game.id, FactBoxScore.team_id == game.home_team_id).scalar()
+        assert home_pts == game.home_team_score
+
+    picks = db.query(UserPick).count()
+    assert picks == counts["picks"]
+    assert db.query(func.sum(UserPickLedger.total_picks)).scalar() == picks
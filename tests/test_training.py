@@ -0,0 +1,74 @@
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from backend.db.models import Base, DimGame, FactBoxScore
+from backend.db.game_state import STATE_FINAL
+from backend.features.schema import schema_info
+from backend.models.training import (
+    build_win_dataset, build_prop_dataset, time_split, fit_models, _fit_model
+)
+
+
+def _memory_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_win_dataset_uses_only_prior_games():
+    db = _memory_session()
+    db.add_all([
+        DimGame(id=1, date="2025-01-01", state=STATE_FINAL, home_team_id=1, visitor_team_id=2,
+                home_team_score=110, visitor_team_score=100),
+        DimGame(id=2, date="2025-01-03", state=STATE_FINAL, home_team_id=2, visitor_team_id=1,
+                home_team_score=90, visitor_team_score=120),
+        DimGame(id=3, date="2025-01-02", state=STATE_FINAL, home_team_id=3, visitor_team_id=1,
+                home_team_score=99, visitor_team_score=101),
+    ])
+    db.commit()
+    data = build_win_dataset(db)
+    assert data["dates"] == ["2025-01-03"]
+    assert data["y"].tolist() == [0]
+    assert data["X"][0][0] == -1
+
+
+def test_prop_dataset_rolling_window():
+    db = _memory_session()
+    for i in range(1, 13):
+        db.add(DimGame(id=i, date=f"2025-01-{i:02d}", state=STATE_FINAL))
+        db.add(FactBoxScore(game_id=i, player_id=7, pts=i, reb=1, ast=1, stl=0, blk=0, fg_pct=0.5, fg3m=1))
+    db.commit()
+    data = build_prop_dataset(db)
+    assert len(data["X"]) == 11
+    assert data["X"][0][0] == 1
+    assert data["targets"]["PTS"][0] == 2
+    assert data["X"][-1][0] == np.mean(range(2, 12))
+
+
+def test_time_split_holds_out_latest_rows():
+    assert time_split(100) == (80, True)
+    assert time_split(10) == (10, False)
+
+
+def test_fit_models_serial_and_parallel_agree():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 7))
+    y = X @ np.arange(1, 8) + rng.normal(scale=0.1, size=400)
+    schema = schema_info("player_rolling")
+    tasks = [{"name": f"m{i}", "kind": "regressor", "schema": schema, "X": X, "y": y} for i in range(2)]
+
+    name, artifact, result = _fit_model(tasks[0])
+    assert result["validation"] == "time_holdout"
+    assert result["validation_samples"] == 80
+    assert result["mae"] < 0.5
+
+    import backend.models.training as training
+    previous = training.PARALLEL_MIN_SAMPLES
+    training.PARALLEL_MIN_SAMPLES = 0
+    try:
+        parallel = fit_models(tasks, workers=2)
+    finally:
+        training.PARALLEL_MIN_SAMPLES = previous
+    assert [r[0] for r in parallel] == ["m0", "m1"]
+    assert np.allclose(parallel[0][1]["coef"], artifact["coef"])
+    assert artifact["schema"] == schema